@@ -7,8 +7,20 @@ set -uo pipefail
 echo "=== Agent Creator Audit Report ==="
 echo ""
 
-# Find recently modified agent files (last 60 minutes)
-RECENT_AGENTS=$(find .claude/agents -name "*.md" -mmin -60 2>/dev/null || true)
+SCRIPT_DIR="${BASH_SOURCE[0]%/*}"
+[[ "$SCRIPT_DIR" == "${BASH_SOURCE[0]}" ]] && SCRIPT_DIR="."
+source "$SCRIPT_DIR/../utils/journal.sh"
+
+INPUT=$(cat 2>/dev/null || true)
+SESSION_ID=$(journal_session_id "$INPUT")
+
+if [[ -n "$SESSION_ID" ]]; then
+    # Agent files this session wrote, from the journal lint-agent.sh keeps
+    RECENT_AGENTS=$(journal_files "$SESSION_ID" '\.claude/agents/.*\.md$' "$(journal_cwd "$INPUT")")
+else
+    # Run by hand without a payload: fall back to recently modified files
+    RECENT_AGENTS=$(find .claude/agents -name "*.md" -mmin -60 2>/dev/null || true)
+fi
 
 if [[ -z "$RECENT_AGENTS" ]]; then
     echo "No agent files modified in this session."
@@ -4,9 +4,19 @@
 
 set -euo pipefail
 
-# Read tool input from stdin
-INPUT=$(cat)
-FILE_PATH=$(echo "$INPUT" | jq -r '.tool_input.file_path // .tool_input.filePath // empty' 2>/dev/null || true)
+SCRIPT_DIR="${BASH_SOURCE[0]%/*}"
+[[ "$SCRIPT_DIR" == "${BASH_SOURCE[0]}" ]] && SCRIPT_DIR="."
+source "$SCRIPT_DIR/../utils/payload.sh"
+source "$SCRIPT_DIR/../utils/journal.sh"
+
+# One streaming pass over stdin; a large file's content is never read
+mapfile -t FIELDS < <(payload_fields hook_event_name session_id cwd 'tool_input.file_path|tool_input.filePath')
+EVENT="${FIELDS[0]:-}" SESSION_ID="${FIELDS[1]:-}" PAYLOAD_CWD="${FIELDS[2]:-}" FILE_PATH="${FIELDS[3]:-}"
+
+# Record every write in the session journal (read by the Stop audit report)
+if [[ -z "$EVENT" || "$EVENT" == "PostToolUse" ]]; then
+    journal_record "$SESSION_ID" "$FILE_PATH" "$PAYLOAD_CWD"
+fi
 
 # Only lint agent files
 if [[ ! "$FILE_PATH" =~ \.claude/agents/.*\.md$ ]]; then
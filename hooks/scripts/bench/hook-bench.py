@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+Hook latency benchmark and replay suite.
+
+Records real hook stdin payloads into a corpus, then replays them against
+every configured hook: global hooks from hooks/hooks.json, agent-scoped hooks
+from agents/*.md frontmatter, and the example templates under
+skills/hook-development/examples. For each hook it reports cold and warm
+p50/p95/p99 latency and the number of processes the hook forks, and exits 1
+when a hook goes over its budget.
+
+Budgets: PreToolUse hooks get 100ms; other hooks get their configured
+timeout (60s when none is set). Override with --budget EVENT=MS. A hook is
+over budget when its warm p95 or cold p50 exceeds the budget, or any run
+times out.
+
+Cold runs get a fresh cache directory and validator socket each time, so
+nothing a hook caches (validation verdicts, daemons) survives between them.
+Warm runs share one environment after an untimed warm-up run.
+
+Fork counts come from strace when it is installed; otherwise from the
+last-PID delta in /proc/loadavg, which also counts threads and any other
+process started meanwhile, so treat it as an upper bound.
+
+Usage:
+    hook-bench.py record [--corpus DIR]          # as a hook: saves stdin, prints nothing
+    hook-bench.py seed [--corpus DIR]            # write synthetic payloads for every event
+    hook-bench.py replay [--corpus DIR] [--runs N] [--cold-runs N] [--filter TEXT]
+                         [--budget EVENT=MS ...] [--no-templates] [--json FILE]
+
+Seeded payloads name files in a placeholder project (PROJECT_PLACEHOLDER).
+Replay moves them into the project hooks run against (a scratch directory
+unless --project-dir is given) and creates any file a Write payload names
+that does not exist yet, so file checks time real work, not early exits.
+
+Recording: add a command hook running
+    python3 "${CLAUDE_PLUGIN_ROOT}/hooks/scripts/bench/hook-bench.py" record
+for each event to capture, use Claude Code normally, then remove it.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[3]
+
+EVENTS = ['PreToolUse', 'PostToolUse', 'PostToolUseFailure', 'Stop', 'SubagentStart', 'SubagentStop']
+
+PRE_TOOL_USE_BUDGET_MS = 100
+DEFAULT_TIMEOUT_S = 60
+
+# Seeded payloads point inside this placeholder project; replay rewrites it
+# to the project the hooks run against
+PROJECT_PLACEHOLDER = '/hook-bench-project'
+
+TEMPLATE_DIR = PLUGIN_ROOT / 'skills' / 'hook-development' / 'examples'
+TEMPLATE_RUNNERS = {'.py': 'python3', '.sh': 'bash', '.cjs': 'node', '.js': 'node'}
+
+
+def default_corpus():
+    project_dir = os.environ.get('CLAUDE_PROJECT_DIR', '.')
+    return Path(project_dir) / '.claude' / 'hooks' / 'bench-corpus'
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CORPUS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def save_payload(corpus, payload_bytes):
+    """Store a payload under corpus/<event>/<hash>.json; identical payloads are stored once."""
+    try:
+        event = json.loads(payload_bytes).get('hook_event_name') or 'Unknown'
+    except (ValueError, AttributeError):
+        return None
+    target = Path(corpus) / re.sub(r'[^A-Za-z0-9_-]', '_', event)
+    target.mkdir(parents=True, exist_ok=True)
+    path = target / f"{hashlib.sha1(payload_bytes).hexdigest()[:16]}.json"
+    if not path.exists():
+        tmp = path.with_suffix('.tmp')
+        tmp.write_bytes(payload_bytes)
+        os.replace(tmp, path)
+    return path
+
+
+def load_corpus(corpus):
+    """{event: [payload bytes, ...]} sorted by file name."""
+    payloads = {}
+    for path in sorted(Path(corpus).glob('*/*.json')):
+        try:
+            data = path.read_bytes()
+            event = json.loads(data).get('hook_event_name')
+        except (OSError, ValueError, AttributeError):
+            continue
+        if event:
+            payloads.setdefault(event, []).append(data)
+    return payloads
+
+
+def localize(payload, project_dir):
+    """Payload bytes with PROJECT_PLACEHOLDER paths moved into project_dir."""
+    return payload.replace(PROJECT_PLACEHOLDER.encode(), json.dumps(str(project_dir))[1:-1].encode())
+
+
+def materialize(payloads, project_dir):
+    """Create the files Write payloads name inside project_dir, so hooks check a real file instead of exiting early."""
+    for payload in payloads:
+        try:
+            tool_input = json.loads(payload).get('tool_input') or {}
+        except (ValueError, AttributeError):
+            continue
+        path, content = tool_input.get('file_path'), tool_input.get('content')
+        if not isinstance(path, str) or not isinstance(content, str):
+            continue
+        path = Path(path)
+        if project_dir not in path.parents or path.exists():
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+def synthetic_payloads(project_dir=PROJECT_PLACEHOLDER):
+    """One representative payload per event, pointing at files inside project_dir."""
+    skill_md = f"{project_dir}/.claude/skills/bench-skill/SKILL.md"
+    content = '---\nname: bench-skill\ndescription: Use when benchmarking hooks\n---\n\n# Bench\n'
+    base = {'session_id': 'bench-session', 'cwd': project_dir, 'transcript_path': ''}
+    write = {'tool_name': 'Write', 'tool_input': {'file_path': skill_md, 'content': content}}
+    return [
+        dict(base, hook_event_name='PreToolUse', **write),
+        dict(base, hook_event_name='PreToolUse', tool_name='Bash', tool_input={'command': 'ls'}),
+        dict(base, hook_event_name='PostToolUse', tool_response={'success': True}, **write),
+        dict(base, hook_event_name='PostToolUseFailure', error='Permission denied', **write),
+        dict(base, hook_event_name='Stop', stop_hook_active=False),
+        dict(base, hook_event_name='SubagentStart', agent_id='bench-1', agent_type='skill-creator'),
+        dict(base, hook_event_name='SubagentStop', agent_id='bench-1', agent_type='skill-creator'),
+    ]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# HOOK DISCOVERY
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def hook_record(event, source, command, matcher=None, timeout=None):
+    budget_ms = PRE_TOOL_USE_BUDGET_MS if event == 'PreToolUse' else (timeout or DEFAULT_TIMEOUT_S) * 1000
+    return {
+        'event': event,
+        'source': source,
+        'command': command,
+        'matcher': matcher or '',
+        'timeout': timeout or DEFAULT_TIMEOUT_S,
+        'budget_ms': budget_ms,
+    }
+
+
+def global_hooks(plugin_root):
+    try:
+        with open(plugin_root / 'hooks' / 'hooks.json') as f:
+            config = json.load(f).get('hooks', {})
+    except (OSError, ValueError):
+        return []
+    hooks = []
+    for event, groups in config.items():
+        for group in groups:
+            for hook in group.get('hooks', []):
+                if hook.get('type') == 'command':
+                    hooks.append(hook_record(event, 'hooks.json', hook['command'],
+                                             group.get('matcher'), hook.get('timeout')))
+    return hooks
+
+
+def agent_hooks(plugin_root):
+    """Hooks declared in agents/*.md frontmatter (needs PyYAML)."""
+    try:
+        import yaml
+    except ImportError:
+        print('Warning: PyYAML not installed; skipping agent-scoped hooks', file=sys.stderr)
+        return []
+
+    hooks = []
+    for path in sorted((plugin_root / 'agents').glob('*.md')):
+        text = path.read_text()
+        match = re.match(r'^---\n(.*?)\n---', text, re.DOTALL)
+        if not match:
+            continue
+        try:
+            frontmatter = yaml.safe_load(match.group(1)) or {}
+        except yaml.YAMLError:
+            continue
+        for event, entries in (frontmatter.get('hooks') or {}).items():
+            for entry in entries or []:
+                if entry.get('type') == 'command':
+                    hooks.append(hook_record(event, f'agents/{path.name}', entry['command'],
+                                             entry.get('matcher'), entry.get('timeout')))
+    return hooks
+
+
+def template_hooks(template_dir):
+    """Example templates; the event comes from the file name (preToolUse-template.py)."""
+    hooks = []
+    for path in sorted(template_dir.glob('*/*-template.*')):
+        runner = TEMPLATE_RUNNERS.get(path.suffix)
+        if runner is None:
+            continue
+        name = path.name.split('-template')[0]
+        event = name[:1].upper() + name[1:]
+        if event in EVENTS:
+            hooks.append(hook_record(event, 'template', f'{runner} "{path}"'))
+    return hooks
+
+
+def matches(hook, payload):
+    """Claude Code semantics: the matcher is a regex on tool_name; events without a tool always match."""
+    tool_name = payload.get('tool_name')
+    if not hook['matcher'] or hook['matcher'] == '*' or tool_name is None:
+        return True
+    return re.fullmatch(hook['matcher'], tool_name) is not None
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MEASUREMENT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def last_pid():
+    try:
+        with open('/proc/loadavg') as f:
+            return int(f.read().split()[4].split('/')[0])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def run_hook(command, payload, env, timeout):
+    """(seconds, exit code) for one invocation; exit code None on timeout."""
+    started = time.perf_counter()
+    try:
+        proc = subprocess.run(command, shell=True, input=payload, env=env, timeout=timeout,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        code = proc.returncode
+    except subprocess.TimeoutExpired:
+        code = None
+    return time.perf_counter() - started, code
+
+
+def count_forks(command, payload, env, timeout):
+    """(processes forked by the hook, method), or (None, None) when it cannot be measured."""
+    if shutil.which('strace'):
+        with tempfile.NamedTemporaryFile('r', suffix='.strace') as trace:
+            try:
+                subprocess.run(['strace', '-f', '-qq', '-o', trace.name,
+                                '-e', 'trace=fork,vfork,clone,clone3', '/bin/sh', '-c', command],
+                               input=payload, env=env, timeout=timeout * 4,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            except subprocess.TimeoutExpired:
+                return None, None
+            forks = sum(
+                1 for line in trace
+                if re.search(r'\b(v?fork|clone3?)\(', line) and 'CLONE_THREAD' not in line
+                and 'resumed>' not in line
+            )
+        return forks, 'strace'
+
+    before = last_pid()
+    if before is None:
+        return None, None
+    run_hook(command, payload, env, timeout)
+    after = last_pid()
+    # Minus one for the /bin/sh that subprocess starts for the command
+    return max(0, after - before - 1), 'pid-delta'
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile in milliseconds."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, -(-len(ordered) * pct // 100) - 1))
+    return round(ordered[int(index)] * 1000, 2)
+
+
+def summary(samples):
+    return {'n': len(samples), 'p50': percentile(samples, 50),
+            'p95': percentile(samples, 95), 'p99': percentile(samples, 99)}
+
+
+def bench_env(plugin_root, project_dir, scratch):
+    """Environment for one benchmark context; scratch holds its caches and sockets."""
+    env = dict(os.environ)
+    env.update({
+        'CLAUDE_PLUGIN_ROOT': str(plugin_root),
+        'CLAUDE_PROJECT_DIR': str(project_dir),
+        'XDG_CACHE_HOME': str(scratch / 'cache'),
+        'SKILL_VALIDATOR_SOCKET': str(scratch / 'validator.sock'),
+        'SKILL_VALIDATOR_IDLE_TIMEOUT': '30',
+    })
+    return env
+
+
+def bench_hook(hook, payloads, plugin_root, project_dir, runs, cold_runs, workdir):
+    """Measure one hook over its matching payloads."""
+    payloads = [p for p in payloads if matches(hook, json.loads(p))]
+    result = dict(hook, payloads=len(payloads), failures=0, timeouts=0)
+    if not payloads:
+        return None
+
+    cold = []
+    for i in range(cold_runs):
+        scratch = Path(tempfile.mkdtemp(prefix='cold-', dir=workdir))
+        env = bench_env(plugin_root, project_dir, scratch)
+        elapsed, code = run_hook(hook['command'], payloads[i % len(payloads)], env, hook['timeout'])
+        cold.append(elapsed)
+        result['timeouts'] += code is None
+        result['failures'] += code not in (0, 2, None)
+
+    scratch = Path(tempfile.mkdtemp(prefix='warm-', dir=workdir))
+    env = bench_env(plugin_root, project_dir, scratch)
+    run_hook(hook['command'], payloads[0], env, hook['timeout'])
+    warm = []
+    for i in range(runs):
+        elapsed, code = run_hook(hook['command'], payloads[i % len(payloads)], env, hook['timeout'])
+        warm.append(elapsed)
+        result['timeouts'] += code is None
+        result['failures'] += code not in (0, 2, None)
+
+    result['forks'], result['fork_method'] = count_forks(hook['command'], payloads[0], env, hook['timeout'])
+    result['cold'] = summary(cold)
+    result['warm'] = summary(warm)
+    worst = max(result['warm']['p95'] or 0, result['cold']['p50'] or 0)
+    result['over_budget'] = bool(result['timeouts']) or worst > result['budget_ms']
+    return result
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COMMANDS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def cmd_record(args):
+    # Never disturb the session being recorded: always exit 0 with no output
+    try:
+        save_payload(args.corpus, sys.stdin.buffer.read())
+    except OSError:
+        pass
+    return 0
+
+
+def cmd_seed(args):
+    for payload in synthetic_payloads():
+        path = save_payload(args.corpus, json.dumps(payload).encode())
+        print(f"  ✓ {path}")
+    return 0
+
+
+def short_command(command, plugin_root):
+    return command.replace('${CLAUDE_PLUGIN_ROOT}/', '').replace(f'{plugin_root}/', '')
+
+
+def fmt(value):
+    return '-' if value is None else f'{value:.1f}'
+
+
+def print_table(results, plugin_root):
+    print(f"{'EVENT':<18} {'HOOK':<52} {'COLD p50':>9} {'WARM p50':>9} {'p95':>8} {'p99':>8} "
+          f"{'FORKS':>6} {'BUDGET':>8}")
+    for r in results:
+        name = f"{short_command(r['command'], plugin_root)} [{r['source']}]"
+        forks = '-' if r['forks'] is None else str(r['forks'])
+        flag = '❌' if r['over_budget'] else '✓'
+        print(f"{r['event']:<18} {name[:52]:<52} {fmt(r['cold']['p50']):>9} {fmt(r['warm']['p50']):>9} "
+              f"{fmt(r['warm']['p95']):>8} {fmt(r['warm']['p99']):>8} {forks:>6} {r['budget_ms']:>7.0f} {flag}")
+
+
+def cmd_replay(args):
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        print(f"No payloads in {args.corpus} (run 'record' as a hook, or 'seed')", file=sys.stderr)
+        return 2
+
+    plugin_root = Path(args.plugin_root).resolve()
+    hooks = global_hooks(plugin_root) + agent_hooks(plugin_root)
+    if not args.no_templates:
+        hooks += template_hooks(plugin_root / 'skills' / 'hook-development' / 'examples')
+    if args.filter:
+        hooks = [h for h in hooks if args.filter in h['command'] or args.filter in h['source']]
+
+    for override in args.budget:
+        event, _, ms = override.partition('=')
+        for hook in hooks:
+            if hook['event'] == event:
+                hook['budget_ms'] = float(ms)
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix='hook-bench-') as workdir:
+        project_dir = Path(args.project_dir or Path(workdir) / 'project').resolve()
+        project_dir.mkdir(parents=True, exist_ok=True)
+        corpus = {event: [localize(p, project_dir) for p in payloads] for event, payloads in corpus.items()}
+        materialize([p for payloads in corpus.values() for p in payloads], project_dir)
+        for hook in hooks:
+            result = bench_hook(hook, corpus.get(hook['event'], []), plugin_root, project_dir,
+                                args.runs, args.cold_runs, workdir)
+            if result is not None:
+                results.append(result)
+
+    if not results:
+        print('No configured hook matched any recorded payload', file=sys.stderr)
+        return 2
+
+    print_table(results, plugin_root)
+    over = [r for r in results if r['over_budget']]
+    methods = {r['fork_method'] for r in results if r['fork_method']}
+    print()
+    print(f"Hooks: {len(results)}  Over budget: {len(over)}  Fork counts: {', '.join(sorted(methods)) or 'unavailable'}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'corpus': str(args.corpus), 'results': results}, f, indent=2)
+            f.write('\n')
+
+    return 1 if over else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Record hook payloads and benchmark hooks against them')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    for name in ('record', 'seed', 'replay'):
+        p = sub.add_parser(name)
+        p.add_argument('--corpus', type=Path, default=default_corpus(),
+                       help='Payload corpus directory (default: .claude/hooks/bench-corpus)')
+        if name == 'replay':
+            p.add_argument('--plugin-root', default=os.environ.get('CLAUDE_PLUGIN_ROOT', PLUGIN_ROOT))
+            p.add_argument('--project-dir', help='CLAUDE_PROJECT_DIR for hooks (default: a scratch dir)')
+            p.add_argument('--runs', type=int, default=20, help='Warm runs per hook (default: 20)')
+            p.add_argument('--cold-runs', type=int, default=3, help='Cold runs per hook (default: 3)')
+            p.add_argument('--filter', help='Only hooks whose command or source contains TEXT')
+            p.add_argument('--budget', action='append', default=[], metavar='EVENT=MS',
+                           help='Override the latency budget for an event')
+            p.add_argument('--no-templates', action='store_true', help='Skip the example templates')
+            p.add_argument('--json', metavar='FILE', help='Write full results as JSON')
+
+    args = parser.parse_args()
+    handler = {'record': cmd_record, 'seed': cmd_seed, 'replay': cmd_replay}[args.command]
+    sys.exit(handler(args))
+
+
+if __name__ == '__main__':
+    main()
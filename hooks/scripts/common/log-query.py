@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+Query hook logs through a local SQLite index with full-text search.
+
+Records from $CLAUDE_PROJECT_DIR/.claude/hooks/.cache are ingested into
+.cache/logs.db before every query, incrementally:
+    live day directories   by byte offset per file (only complete lines)
+    compacted segments     by member count per day (see log_segments.py)
+A live file that shrinks or is replaced is re-read from the start; once a
+day directory has been compacted away its live records are dropped and the
+segment members take their place. Days pruned by retention leave the index too.
+
+JSONL records are indexed with their session_id, agent_type, tool_name and
+hook_event_name; .log lines with their timestamp (and session, for the
+session-<id>.log copies). Every line is searchable with SQLite FTS5.
+
+Usage:
+    log-query.py [--session ID] [--agent-type TYPE] [--tool NAME] [--category NAME]
+                 [--kind KIND] [--since WHEN] [--until WHEN] [--text WORDS | --match EXPR]
+                 [--limit N] [--json] [--no-ingest] [--reindex] [--project-dir DIR]
+
+WHEN is YYYY-MM-DD, "YYYY-MM-DD HH:MM:SS", or relative to now: 30m, 6h, 2d.
+Every logged event is written as a .log line, a session log line and (for
+most categories) a JSONL record. Without --kind a query returns the JSONL
+records, plus .log lines for categories that have no JSONL.
+
+Examples:
+    log-query.py --category tool-failure --since 1d
+    log-query.py --agent-type skill-creator --json
+    log-query.py --text "permission denied" --session abc123
+"""
+
+import argparse
+import datetime
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import log_segments
+
+DB_NAME = "logs.db"
+SCHEMA_VERSION = 1
+KINDS = ["log", "session-log", "jsonl"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    day TEXT NOT NULL,
+    ts TEXT,
+    session TEXT,
+    category TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    agent_type TEXT,
+    tool_name TEXT,
+    event TEXT,
+    origin TEXT NOT NULL,
+    source TEXT NOT NULL,
+    line TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_ts ON records (ts);
+CREATE INDEX IF NOT EXISTS records_session ON records (session, ts);
+CREATE INDEX IF NOT EXISTS records_category ON records (category, ts);
+CREATE INDEX IF NOT EXISTS records_agent ON records (agent_type, ts);
+CREATE INDEX IF NOT EXISTS records_source ON records (source);
+CREATE INDEX IF NOT EXISTS records_kind ON records (kind, category);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS records_fts USING fts5 (
+    line, content='records', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS records_ad AFTER DELETE ON records BEGIN
+    INSERT INTO records_fts (records_fts, rowid, line) VALUES ('delete', old.id, old.line);
+END;
+
+-- Ingestion state: byte offset per live file, member count per segment day
+CREATE TABLE IF NOT EXISTS live_files (
+    source TEXT PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    offset INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS segment_days (
+    day TEXT PRIMARY KEY,
+    index_mtime INTEGER NOT NULL,
+    members INTEGER NOT NULL
+);
+"""
+
+_LOG_LINE = log_segments._LOG_LINE
+
+
+def remove_db(db_path):
+    """Delete the index with its WAL and shared-memory files, so no stale WAL is replayed."""
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+
+def open_db(base, reindex=False):
+    base = Path(base)
+    base.mkdir(parents=True, exist_ok=True)
+    db_path = base / DB_NAME
+    if reindex:
+        remove_db(db_path)
+    db = sqlite3.connect(db_path, timeout=10, isolation_level=None)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    if db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        # Unknown or older layout: the index is derived data, so rebuild it
+        db.close()
+        remove_db(db_path)
+        db = sqlite3.connect(db_path, timeout=10, isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(SCHEMA)
+        db.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+    return db
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# INGESTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def parse_line(line, category, kind, session=None):
+    """Column values (ts, session, category, agent_type, tool_name, event) for one line."""
+    if kind == "jsonl":
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if not isinstance(record, dict):
+            return None, session, category, None, None, None
+        return (
+            record.get("timestamp"),
+            record.get("session_id") or session,
+            category,
+            record.get("agent_type"),
+            record.get("tool_name"),
+            record.get("hook_event_name"),
+        )
+    match = _LOG_LINE.match(line)
+    if kind == "session-log" and match and match.group(2):
+        category = match.group(2)
+    return match and match.group(1), session, category, None, None, None
+
+
+def _insert(db, day, kind, origin, source, lines, category, session=None):
+    rows = []
+    for line in lines:
+        ts, sess, cat, agent_type, tool_name, event = parse_line(line, category, kind, session)
+        rows.append((day, ts, sess, cat, kind, agent_type, tool_name, event, origin, source, line))
+    db.executemany(
+        "INSERT INTO records (day, ts, session, category, kind, agent_type, tool_name, event, origin, source, line)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    return len(rows)
+
+
+def classify(name):
+    """(category, kind, session) for a file in a day directory, or None to skip it."""
+    if name.endswith(".jsonl"):
+        return name[:-len(".jsonl")], "jsonl", None
+    if name.startswith("session-") and name.endswith(".log"):
+        return "unknown", "session-log", name[len("session-"):-len(".log")]
+    if name.endswith(".log"):
+        return name[:-len(".log")], "log", None
+    return None
+
+
+def ingest_live(db, base):
+    """Read new complete lines from every live log file; returns records added."""
+    added = 0
+    seen = set()
+    for day in log_segments.live_days(base):
+        for path in sorted((Path(base) / day).iterdir()):
+            kind_info = classify(path.name)
+            if kind_info is None or not path.is_file():
+                continue
+            category, kind, session = kind_info
+            source = f"{day}/{path.name}"
+            seen.add(source)
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+
+            row = db.execute("SELECT inode, offset FROM live_files WHERE source = ?", (source,)).fetchone()
+            offset = 0
+            if row is not None:
+                inode, offset = row
+                if inode != st.st_ino or st.st_size < offset:
+                    # Replaced or truncated: start over
+                    db.execute("DELETE FROM records WHERE source = ?", (source,))
+                    offset = 0
+            if row is not None and st.st_size == offset:
+                continue
+
+            with open(path, "rb") as f:
+                f.seek(offset)
+                chunk = f.read()
+            end = chunk.rfind(b"\n") + 1  # leave a partly written last line for next time
+            lines = [l for l in chunk[:end].decode("utf-8", errors="replace").splitlines() if l.strip()]
+            added += _insert(db, day, kind, "live", source, lines, category, session)
+            db.execute(
+                "INSERT OR REPLACE INTO live_files (source, inode, offset) VALUES (?, ?, ?)",
+                (source, st.st_ino, offset + end),
+            )
+
+    # Files that are gone (compacted or cleaned) take their records with them
+    for (source,) in db.execute("SELECT source FROM live_files").fetchall():
+        if source not in seen:
+            db.execute("DELETE FROM records WHERE source = ?", (source,))
+            db.execute("DELETE FROM live_files WHERE source = ?", (source,))
+    return added
+
+
+def ingest_segments(db, base):
+    """Ingest segment members not yet indexed; returns records added."""
+    added = 0
+    days = log_segments.segment_days(base)
+    for day in days:
+        seg_path, idx_path = log_segments.segment_paths(base, day)
+        try:
+            mtime = idx_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            continue
+        row = db.execute("SELECT index_mtime, members FROM segment_days WHERE day = ?", (day,)).fetchone()
+        if row is not None and row[0] == mtime:
+            continue
+
+        members = log_segments.read_index(idx_path)
+        done = row[1] if row is not None else 0
+        if done > len(members):
+            # Segment was rewritten from scratch
+            db.execute("DELETE FROM records WHERE day = ? AND origin = 'segment'", (day,))
+            done = 0
+
+        with open(seg_path, "rb") as seg:
+            for number, member in enumerate(members[done:], start=done):
+                text = log_segments.read_member(seg, member).decode("utf-8", errors="replace")
+                lines = [l for l in text.splitlines() if l.strip()]
+                added += _insert(db, day, member["kind"], "segment", f"segments/{day}#{number}",
+                                 lines, member["category"], member["session"])
+        db.execute(
+            "INSERT OR REPLACE INTO segment_days (day, index_mtime, members) VALUES (?, ?, ?)",
+            (day, mtime, len(members)),
+        )
+
+    # Segments removed by retention
+    for (day,) in db.execute("SELECT day FROM segment_days").fetchall():
+        if day not in days:
+            db.execute("DELETE FROM records WHERE day = ? AND origin = 'segment'", (day,))
+            db.execute("DELETE FROM segment_days WHERE day = ?", (day,))
+    return added
+
+
+def ingest(db, base):
+    """Bring the index up to date with the log directory; returns records added."""
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        newest = db.execute("SELECT coalesce(max(id), 0) FROM records").fetchone()[0]
+        added = ingest_live(db, base) + ingest_segments(db, base)
+        # One bulk FTS insert is several times faster than a per-row trigger;
+        # AUTOINCREMENT keeps every new id above `newest`
+        db.execute("INSERT INTO records_fts (rowid, line) SELECT id, line FROM records WHERE id > ?", (newest,))
+        db.execute("COMMIT")
+    except BaseException:
+        db.execute("ROLLBACK")
+        raise
+    return added
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# QUERYING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_RELATIVE = re.compile(r"(\d+)([smhdw])")
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_when(value):
+    """Timestamp string comparable with the logged ones ('YYYY-MM-DD HH:MM:SS')."""
+    match = _RELATIVE.fullmatch(value.strip())
+    if match:
+        seconds = int(match.group(1)) * _UNITS[match.group(2)]
+        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time() - seconds))
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d", "%Y-%m-%dT%H:%M:%S"):
+        try:
+            return datetime.datetime.strptime(value.strip(), fmt).strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            pass
+    raise argparse.ArgumentTypeError(f"not a date, time or relative age (30m, 6h, 2d): {value!r}")
+
+
+def text_query(words):
+    """FTS5 expression requiring every word, each taken literally."""
+    return " AND ".join('"' + word.replace('"', '""') + '"' for word in words.split())
+
+
+def query(db, session=None, agent_type=None, tool=None, category=None, kinds=None,
+          since=None, until=None, match=None, limit=50):
+    """Matching records as dicts, oldest first (the newest `limit` of them when limit > 0)."""
+    where, params = [], []
+    for column, value in (("session", session), ("agent_type", agent_type),
+                          ("tool_name", tool), ("category", category)):
+        if value is not None:
+            where.append(f"r.{column} = ?")
+            params.append(value)
+    if not kinds:
+        where.append("(r.kind = 'jsonl' OR (r.kind = 'log' AND NOT EXISTS ("
+                     "SELECT 1 FROM records j WHERE j.kind = 'jsonl' AND j.category = r.category)))")
+    else:
+        where.append(f"r.kind IN ({', '.join('?' * len(kinds))})")
+        params.extend(kinds)
+    if since:
+        where.append("r.ts >= ?")
+        params.append(since)
+    if until:
+        # Date-only bounds include the whole day
+        where.append("r.ts <= ?")
+        params.append(until if until[11:] != "00:00:00" else until[:10] + " 23:59:59")
+    if match:
+        where.append("r.id IN (SELECT rowid FROM records_fts WHERE records_fts MATCH ?)")
+        params.append(match)
+
+    sql = "SELECT r.* FROM records r"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY r.ts DESC, r.id DESC"
+    if limit:
+        sql += f" LIMIT {int(limit)}"
+
+    db.row_factory = sqlite3.Row
+    rows = [dict(row) for row in db.execute(sql, params)]
+    rows.reverse()
+    return rows
+
+
+def to_json(row):
+    result = {
+        "timestamp": row["ts"],
+        "day": row["day"],
+        "category": row["category"],
+        "kind": row["kind"],
+        "session": row["session"],
+        "agent_type": row["agent_type"],
+        "tool_name": row["tool_name"],
+        "event": row["event"],
+    }
+    if row["kind"] == "jsonl":
+        try:
+            result["record"] = json.loads(row["line"])
+        except ValueError:
+            result["line"] = row["line"]
+    else:
+        result["message"] = _LOG_LINE.sub("", row["line"], count=1)
+    return result
+
+
+def summary(row, width=90):
+    if row["kind"] != "jsonl":
+        text = _LOG_LINE.sub("", row["line"], count=1)
+    else:
+        try:
+            record = json.loads(row["line"])
+        except ValueError:
+            record = {}
+        if not isinstance(record, dict):
+            record = {}
+        error = record.get("error")
+        if isinstance(error, dict):
+            error = error.get("message")
+        parts = [record.get("hook_event_name"), record.get("agent_id") and f"id={record['agent_id']}", error]
+        text = " ".join(str(p) for p in parts if p) or row["line"]
+    text = " ".join(text.split())
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
+def print_table(rows):
+    if not rows:
+        print("No matching records")
+        return
+    print(f"{'TIME':<19}  {'CATEGORY':<13} {'SESSION':<12} {'AGENT/TOOL':<20} DETAILS")
+    for row in rows:
+        who = row["agent_type"] or row["tool_name"] or "-"
+        session = (row["session"] or "-")[:12]
+        print(f"{row['ts'] or '?':<19}  {row['category']:<13} {session:<12} {who[:20]:<20} {summary(row)}")
+    print(f"\n{len(rows)} record(s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query hook logs through an indexed SQLite database")
+    parser.add_argument("--project-dir", help="Project whose .claude/hooks/.cache to use (default: $CLAUDE_PROJECT_DIR)")
+    parser.add_argument("--session", help="Only this session_id")
+    parser.add_argument("--agent-type", help="Only records with this agent_type")
+    parser.add_argument("--tool", help="Only records with this tool_name")
+    parser.add_argument("--category", help="Only this category (subagent, tool-failure, ...)")
+    parser.add_argument("--kind", action="append", choices=KINDS,
+                        help="Only this kind of record (repeatable; default: jsonl, else log)")
+    parser.add_argument("--since", type=parse_when, help="At or after WHEN")
+    parser.add_argument("--until", type=parse_when, help="At or before WHEN")
+    text = parser.add_mutually_exclusive_group()
+    text.add_argument("--text", "-t", help="Full-text search: every word must appear")
+    text.add_argument("--match", help="Raw FTS5 query expression")
+    parser.add_argument("--limit", "-n", type=int, default=50, help="Newest N matches (0 for all; default: 50)")
+    parser.add_argument("--json", action="store_true", help="Print matches as a JSON array")
+    parser.add_argument("--no-ingest", action="store_true", help="Query the index as it is")
+    parser.add_argument("--reindex", action="store_true", help="Rebuild the index from scratch")
+    args = parser.parse_args()
+
+    base = log_segments.log_base(args.project_dir)
+    db = open_db(base, reindex=args.reindex)
+    if not args.no_ingest:
+        ingest(db, base)
+
+    match = text_query(args.text) if args.text else args.match
+    try:
+        rows = query(db, args.session, args.agent_type, args.tool, args.category,
+                     args.kind, args.since, args.until, match, args.limit)
+    except sqlite3.OperationalError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+
+    try:
+        if args.json:
+            json.dump([to_json(row) for row in rows], sys.stdout, indent=2)
+            print()
+        else:
+            print_table(rows)
+    except BrokenPipeError:
+        # Output piped into head and friends
+        sys.stdout = open(os.devnull, "w")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
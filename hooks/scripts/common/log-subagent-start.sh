@@ -3,22 +3,29 @@
 set -euo pipefail
 
 # Source shared logging utilities
-SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+SCRIPT_DIR="${BASH_SOURCE[0]%/*}"
+[[ "$SCRIPT_DIR" == "${BASH_SOURCE[0]}" ]] && SCRIPT_DIR="."
 source "$SCRIPT_DIR/logging.sh"
 
 # Read JSON input from stdin
 INPUT=$(cat)
 
-# Extract relevant fields
-AGENT_ID=$(echo "$INPUT" | jq -r '.agent_id // "unknown"')
-AGENT_TYPE=$(echo "$INPUT" | jq -r '.agent_type // "unknown"')
-SESSION_ID=$(echo "$INPUT" | jq -r '.session_id // "unknown"')
+# Extract relevant fields and the timestamped JSON record (one jq call,
+# unit-separator delimited; tojson leaves no raw newline or separator)
+_log_now TIMESTAMP
+IFS=$'\x1f' read -r AGENT_ID AGENT_TYPE SESSION_ID RECORD <<< "$(jq -r --arg ts "$TIMESTAMP" \
+    '[.agent_id // "unknown", .agent_type // "unknown", .session_id // "unknown",
+      (if type == "object" then . + {timestamp: $ts} | tojson else "" end)]
+     | map(tostring | gsub("[\n\u001f]"; " ")) | join("\u001f")' <<< "$INPUT" 2>/dev/null)" || true
+AGENT_ID="${AGENT_ID:-unknown}"
+AGENT_TYPE="${AGENT_TYPE:-unknown}"
+SESSION_ID="${SESSION_ID:-unknown}"
 
 # Log the subagent start
 log_event "subagent" "START: $AGENT_TYPE (id: $AGENT_ID)" "$SESSION_ID"
 
 # Also log structured JSON
-log_json "subagent" "$INPUT" "$SESSION_ID"
+log_json "subagent" "$INPUT" "$SESSION_ID" "$RECORD"
 
 # Exit success
 exit 0
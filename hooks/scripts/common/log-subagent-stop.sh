@@ -3,22 +3,29 @@
 set -euo pipefail
 
 # Source shared logging utilities
-SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+SCRIPT_DIR="${BASH_SOURCE[0]%/*}"
+[[ "$SCRIPT_DIR" == "${BASH_SOURCE[0]}" ]] && SCRIPT_DIR="."
 source "$SCRIPT_DIR/logging.sh"
 
 # Read JSON input from stdin
 INPUT=$(cat)
 
-# Extract relevant fields
-AGENT_ID=$(echo "$INPUT" | jq -r '.agent_id // "unknown"')
-SESSION_ID=$(echo "$INPUT" | jq -r '.session_id // "unknown"')
-STOP_HOOK_ACTIVE=$(echo "$INPUT" | jq -r '.stop_hook_active // false')
+# Extract relevant fields and the timestamped JSON record (one jq call,
+# unit-separator delimited; tojson leaves no raw newline or separator)
+_log_now TIMESTAMP
+IFS=$'\x1f' read -r AGENT_ID SESSION_ID STOP_HOOK_ACTIVE RECORD <<< "$(jq -r --arg ts "$TIMESTAMP" \
+    '[.agent_id // "unknown", .session_id // "unknown", .stop_hook_active // false,
+      (if type == "object" then . + {timestamp: $ts} | tojson else "" end)]
+     | map(tostring | gsub("[\n\u001f]"; " ")) | join("\u001f")' <<< "$INPUT" 2>/dev/null)" || true
+AGENT_ID="${AGENT_ID:-unknown}"
+SESSION_ID="${SESSION_ID:-unknown}"
+STOP_HOOK_ACTIVE="${STOP_HOOK_ACTIVE:-false}"
 
 # Log the subagent stop
 log_event "subagent" "STOP: $AGENT_ID (stop_hook_active: $STOP_HOOK_ACTIVE)" "$SESSION_ID"
 
 # Also log structured JSON
-log_json "subagent" "$INPUT" "$SESSION_ID"
+log_json "subagent" "$INPUT" "$SESSION_ID" "$RECORD"
 
 # Exit success - allow subagent to stop normally
 exit 0
@@ -3,22 +3,30 @@
 set -euo pipefail
 
 # Source shared logging utilities
-SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+SCRIPT_DIR="${BASH_SOURCE[0]%/*}"
+[[ "$SCRIPT_DIR" == "${BASH_SOURCE[0]}" ]] && SCRIPT_DIR="."
 source "$SCRIPT_DIR/logging.sh"
 
 # Read JSON input from stdin
 INPUT=$(cat)
 
-# Extract relevant fields
-TOOL_NAME=$(echo "$INPUT" | jq -r '.tool_name // "unknown"')
-SESSION_ID=$(echo "$INPUT" | jq -r '.session_id // "unknown"')
-ERROR=$(echo "$INPUT" | jq -r '.tool_response.error // .tool_response // "no error info"' | head -c 500)
+# Extract relevant fields and the timestamped JSON record (one jq call,
+# unit-separator delimited; tojson leaves no raw newline or separator)
+_log_now TIMESTAMP
+IFS=$'\x1f' read -r TOOL_NAME SESSION_ID ERROR RECORD <<< "$(jq -r --arg ts "$TIMESTAMP" \
+    '[.tool_name // "unknown", .session_id // "unknown",
+      (.tool_response.error // .tool_response // "no error info" | if type == "string" then . else tojson end | .[:500]),
+      (if type == "object" then . + {timestamp: $ts} | tojson else "" end)]
+     | map(tostring | gsub("[\n\u001f]"; " ")) | join("\u001f")' <<< "$INPUT" 2>/dev/null)" || true
+TOOL_NAME="${TOOL_NAME:-unknown}"
+SESSION_ID="${SESSION_ID:-unknown}"
+ERROR="${ERROR:-no error info}"
 
 # Log the failure
 log_event "tool-failure" "FAILURE: $TOOL_NAME - $ERROR" "$SESSION_ID"
 
 # Also log structured JSON for detailed analysis
-log_json "tool-failure" "$INPUT" "$SESSION_ID"
+log_json "tool-failure" "$INPUT" "$SESSION_ID" "$RECORD"
 
 # Exit success - don't block on logging failures
 exit 0
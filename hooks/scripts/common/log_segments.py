@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Compacted, indexed log segments for $CLAUDE_PROJECT_DIR/.claude/hooks/.cache.
+
+Finished day directories (YYYY-MM-DD/, anything before today) are rolled into
+    segments/YYYY-MM-DD.seg        concatenated gzip members
+    segments/YYYY-MM-DD.idx.json   sidecar index, one entry per member
+and the day directory is removed. Each member holds one (session, category,
+kind) group of records, so a reader seeks to `offset` and inflates `length`
+bytes instead of decompressing the whole day.
+
+Index entries: session (null for the per-category logs, which carry no
+session id), category, kind ("log" for <category>.log, "session-log" for
+session-<id>.log, "jsonl" for <category>.jsonl), first/last timestamp,
+records, offset, length, raw_size.
+
+Retention: --keep-days drops segments older than N days, --max-bytes drops
+the oldest segments until the total fits.
+
+Usage:
+    log_segments.py compact [--keep-days N] [--max-bytes N] [--include-today]
+    log_segments.py read [--session ID] [--category NAME] [--kind KIND] [--day YYYY-MM-DD]
+    log_segments.py list
+"""
+
+import argparse
+import datetime
+import gzip
+import json
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+
+SEGMENT_DIR = "segments"
+INDEX_FORMAT = 1
+
+_DAY = re.compile(r"\d{4}-\d{2}-\d{2}")
+_LOG_LINE = re.compile(r"\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] (?:\[([^\]]+)\] )?")
+
+
+def log_base(project_dir=None):
+    project_dir = project_dir or os.environ.get("CLAUDE_PROJECT_DIR") or os.getcwd()
+    return Path(project_dir) / ".claude" / "hooks" / ".cache"
+
+
+def segment_paths(base, day):
+    seg_dir = Path(base) / SEGMENT_DIR
+    return seg_dir / f"{day}.seg", seg_dir / f"{day}.idx.json"
+
+
+def read_index(index_path):
+    """Members listed in a sidecar index ([] when missing or unreadable)."""
+    try:
+        with open(index_path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return []
+    if data.get("format") != INDEX_FORMAT:
+        return []
+    return data.get("members", [])
+
+
+def segment_days(base):
+    """Days that have a segment, oldest first."""
+    seg_dir = Path(base) / SEGMENT_DIR
+    if not seg_dir.is_dir():
+        return []
+    return sorted(p.name[:-len(".idx.json")] for p in seg_dir.glob("*.idx.json"))
+
+
+def live_days(base):
+    """Day directories still being written or awaiting compaction, oldest first."""
+    base = Path(base)
+    if not base.is_dir():
+        return []
+    return sorted(p.name for p in base.iterdir() if p.is_dir() and _DAY.fullmatch(p.name))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# GROUPING A DAY DIRECTORY
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _group(groups, key, line, timestamp):
+    group = groups.setdefault(key, {"lines": [], "first": None, "last": None})
+    group["lines"].append(line)
+    if timestamp:
+        if group["first"] is None or timestamp < group["first"]:
+            group["first"] = timestamp
+        if group["last"] is None or timestamp > group["last"]:
+            group["last"] = timestamp
+
+
+def group_day(day_dir):
+    """{(session, category, kind): {lines, first, last}} for every record in a day directory."""
+    groups = {}
+    for path in sorted(Path(day_dir).iterdir()):
+        if not path.is_file():
+            continue
+        name = path.name
+        with open(path, encoding="utf-8", errors="replace") as f:
+            lines = [line if line.endswith("\n") else line + "\n" for line in f if line.strip()]
+
+        if name.endswith(".jsonl"):
+            category = name[:-len(".jsonl")]
+            for line in lines:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = {}
+                if not isinstance(record, dict):
+                    record = {}
+                session = str(record.get("session_id") or "unknown")
+                _group(groups, (session, category, "jsonl"), line, record.get("timestamp"))
+
+        elif name.startswith("session-") and name.endswith(".log"):
+            session = name[len("session-"):-len(".log")]
+            for line in lines:
+                match = _LOG_LINE.match(line)
+                category = (match and match.group(2)) or "unknown"
+                _group(groups, (session, category, "session-log"), line, match and match.group(1))
+
+        elif name.endswith(".log"):
+            category = name[:-len(".log")]
+            for line in lines:
+                match = _LOG_LINE.match(line)
+                _group(groups, (None, category, "log"), line, match and match.group(1))
+    return groups
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COMPACTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _atomic_write_json(path, data):
+    tmp = path.with_name(f".{path.name}.tmp")
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=1)
+        f.write("\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def compact_day(base, day):
+    """Roll one day directory into its segment; returns the number of members written."""
+    day_dir = Path(base) / day
+    seg_path, idx_path = segment_paths(base, day)
+    seg_path.parent.mkdir(parents=True, exist_ok=True)
+
+    groups = group_day(day_dir)
+    members = read_index(idx_path)
+
+    if members and seg_path.exists():
+        # Append after the last indexed member, dropping any tail left by an interrupted run
+        offset = max(m["offset"] + m["length"] for m in members)
+        seg = open(seg_path, "r+b")
+        seg.truncate(offset)
+        seg.seek(offset)
+    else:
+        # A segment without a readable index is rewritten from scratch
+        members, offset = [], 0
+        seg = open(seg_path, "wb")
+
+    with seg:
+        for (session, category, kind), group in sorted(groups.items(), key=lambda kv: (kv[0][0] or "", kv[0][1:])):
+            raw = "".join(group["lines"]).encode("utf-8")
+            member = gzip.compress(raw, compresslevel=9, mtime=0)
+            seg.write(member)
+            members.append({
+                "session": session,
+                "category": category,
+                "kind": kind,
+                "first": group["first"],
+                "last": group["last"],
+                "records": len(group["lines"]),
+                "offset": offset,
+                "length": len(member),
+                "raw_size": len(raw),
+            })
+            offset += len(member)
+        seg.flush()
+        os.fsync(seg.fileno())
+
+    # Index last: until it is replaced, the old index never points past valid data
+    _atomic_write_json(idx_path, {"format": INDEX_FORMAT, "day": day, "members": members})
+    shutil.rmtree(day_dir, ignore_errors=True)
+    return len(groups)
+
+
+def prune(base, keep_days=None, max_bytes=None, today=None):
+    """Delete old segments; returns the days removed."""
+    days = segment_days(base)
+    removed = []
+
+    if keep_days is not None:
+        today = today or datetime.date.today()
+        cutoff = (today - datetime.timedelta(days=keep_days)).isoformat()
+        removed += [d for d in days if d < cutoff]
+
+    if max_bytes is not None:
+        remaining = [d for d in days if d not in removed]
+        sizes = {d: sum(p.stat().st_size for p in segment_paths(base, d) if p.exists()) for d in remaining}
+        total = sum(sizes.values())
+        for day in remaining:
+            if total <= max_bytes:
+                break
+            removed.append(day)
+            total -= sizes[day]
+
+    for day in removed:
+        for path in segment_paths(base, day):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+    return removed
+
+
+def compact(base, keep_days=None, max_bytes=None, include_today=False):
+    """Compact every finished day, then apply retention. Returns (compacted days, pruned days)."""
+    import fcntl
+
+    seg_dir = Path(base) / SEGMENT_DIR
+    seg_dir.mkdir(parents=True, exist_ok=True)
+    today = datetime.date.today().isoformat()
+
+    # One compactor at a time; a concurrent run just waits its turn
+    with open(seg_dir / ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        compacted = []
+        for day in live_days(base):
+            if day < today or include_today:
+                compact_day(base, day)
+                compacted.append(day)
+        return compacted, prune(base, keep_days, max_bytes)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# READING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def select(members, session=None, category=None, kind=None):
+    return [
+        m for m in members
+        if (session is None or m["session"] == session)
+        and (category is None or m["category"] == category)
+        and (kind is None or m["kind"] == kind)
+    ]
+
+
+def read_member(seg_file, member):
+    """Decompressed bytes of one member from an open segment file."""
+    seg_file.seek(member["offset"])
+    return gzip.decompress(seg_file.read(member["length"]))
+
+
+def iter_records(base, session=None, category=None, kind=None, days=None):
+    """Yield (day, member, line) for matching records, seeking straight to each member."""
+    for day in days or segment_days(base):
+        seg_path, idx_path = segment_paths(base, day)
+        members = select(read_index(idx_path), session, category, kind)
+        if not members:
+            continue
+        with open(seg_path, "rb") as seg:
+            for member in members:
+                for line in read_member(seg, member).decode("utf-8", errors="replace").splitlines():
+                    yield day, member, line
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact and read hook log segments")
+    parser.add_argument("--project-dir", help="Project whose .claude/hooks/.cache to use (default: $CLAUDE_PROJECT_DIR)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("compact", help="Roll finished days into segments and apply retention")
+    p.add_argument("--keep-days", type=int, help="Delete segments older than N days")
+    p.add_argument("--max-bytes", type=int, help="Delete the oldest segments until the total fits")
+    p.add_argument("--include-today", action="store_true", help="Also compact today's directory")
+
+    p = sub.add_parser("read", help="Print records from segments")
+    p.add_argument("--session")
+    p.add_argument("--category")
+    p.add_argument("--kind", choices=["log", "session-log", "jsonl"])
+    p.add_argument("--day", action="append", help="Only this day (repeatable)")
+
+    sub.add_parser("list", help="List segments and their members")
+
+    args = parser.parse_args()
+    base = log_base(args.project_dir)
+
+    if args.command == "compact":
+        compacted, pruned = compact(base, args.keep_days, args.max_bytes, args.include_today)
+        print(f"Compacted {len(compacted)} day(s){': ' + ', '.join(compacted) if compacted else ''}")
+        if pruned:
+            print(f"Removed {len(pruned)} old segment(s): {', '.join(pruned)}")
+
+    elif args.command == "read":
+        for _, _, line in iter_records(base, args.session, args.category, args.kind, args.day):
+            print(line)
+
+    else:
+        for day in segment_days(base):
+            seg_path, idx_path = segment_paths(base, day)
+            members = read_index(idx_path)
+            size = seg_path.stat().st_size if seg_path.exists() else 0
+            raw = sum(m["raw_size"] for m in members)
+            print(f"{day}: {len(members)} members, {size} bytes ({raw} uncompressed)")
+            for m in members:
+                print(f"  {m['session'] or '-':<40} {m['category']:<14} {m['kind']:<11} "
+                      f"{m['records']:>6} records  {m['first'] or '?'} .. {m['last'] or '?'}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
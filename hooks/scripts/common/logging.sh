@@ -7,15 +7,29 @@
 # Log location: $CLAUDE_PROJECT_DIR/.claude/hooks/.cache/YYYY-MM-DD/
 # This ensures logs stay with the project being worked on, not the plugin itself.
 
+# Fork-free logging: timestamps come from bash's printf %(...)T (date(1) only
+# on bash < 4.2), directory and .gitignore setup runs once per day (marked by
+# $LOG_DATE_DIR/.initialized), and each record is a single O_APPEND write.
+# JSON records are stamped by string manipulation instead of piping through jq.
+
+# Current time into the named variable
+# Usage: _log_now <var> [format]
+if (( BASH_VERSINFO[0] > 4 || (BASH_VERSINFO[0] == 4 && BASH_VERSINFO[1] >= 2) )); then
+    _log_now() { printf -v "$1" "%(${2:-%Y-%m-%d %H:%M:%S})T" -1; }
+else
+    _log_now() { printf -v "$1" '%s' "$(date "+${2:-%Y-%m-%d %H:%M:%S}")"; }
+fi
+
 # Initialize logging directory structure
 # Usage: init_log_dir [session_id]
 # Returns: Sets LOG_BASE, LOG_DATE_DIR, SESSION_LOG variables
 init_log_dir() {
     # CLAUDE_PROJECT_DIR is set by Claude Code to the project being worked on
     # This is NOT the plugin directory - it's where the user is running Claude
-    local project_dir="${CLAUDE_PROJECT_DIR:-$(pwd)}"
+    local project_dir="${CLAUDE_PROJECT_DIR:-$PWD}"
     local session_id="${1:-unknown}"
-    local date_folder=$(date '+%Y-%m-%d')
+    local date_folder
+    _log_now date_folder '%Y-%m-%d'
 
     # Log to the TARGET PROJECT's .claude/hooks/.cache/
     # NOT to the plugin source directory
@@ -23,6 +37,16 @@ init_log_dir() {
     LOG_DATE_DIR="$LOG_BASE/$date_folder"
     SESSION_LOG="$LOG_DATE_DIR/session-${session_id}.log"
 
+    # Export for use by caller
+    export LOG_BASE LOG_DATE_DIR SESSION_LOG
+
+    # Setup already done today (by this process or an earlier hook)
+    [[ "${_LOG_INITIALIZED:-}" == "$LOG_DATE_DIR" ]] && return 0
+    if [[ -e "$LOG_DATE_DIR/.initialized" ]]; then
+        _LOG_INITIALIZED="$LOG_DATE_DIR"
+        return 0
+    fi
+
     # Create directory structure in the target project
     mkdir -p "$LOG_DATE_DIR" 2>/dev/null || true
 
@@ -30,14 +54,12 @@ init_log_dir() {
     local gitignore="$project_dir/.gitignore"
     if [[ -f "$gitignore" ]]; then
         if ! grep -q ".claude/hooks/.cache" "$gitignore" 2>/dev/null; then
-            echo "" >> "$gitignore"
-            echo "# Claude Code hook logs (auto-added)" >> "$gitignore"
-            echo ".claude/hooks/.cache/" >> "$gitignore"
+            printf '\n# Claude Code hook logs (auto-added)\n.claude/hooks/.cache/\n' >> "$gitignore"
         fi
     fi
 
-    # Export for use by caller
-    export LOG_BASE LOG_DATE_DIR SESSION_LOG
+    : 2>/dev/null >> "$LOG_DATE_DIR/.initialized" || true
+    _LOG_INITIALIZED="$LOG_DATE_DIR"
 }
 
 # Log a message to the appropriate log file
@@ -47,49 +69,82 @@ log_event() {
     local category="$1"
     local message="$2"
     local session_id="${3:-unknown}"
-    local timestamp=$(date '+%Y-%m-%d %H:%M:%S')
+    local timestamp
+    _log_now timestamp
 
     init_log_dir "$session_id"
 
-    # Category-specific log file
-    local category_log="$LOG_DATE_DIR/${category}.log"
-
     # Write to category log
-    echo "[$timestamp] $message" >> "$category_log" 2>/dev/null || true
+    printf '[%s] %s\n' "$timestamp" "$message" >> "$LOG_DATE_DIR/${category}.log" 2>/dev/null || true
 
     # Also write to session log if session is known
     if [[ "$session_id" != "unknown" ]]; then
-        echo "[$timestamp] [$category] $message" >> "$SESSION_LOG" 2>/dev/null || true
+        printf '[%s] [%s] %s\n' "$timestamp" "$category" "$message" >> "$SESSION_LOG" 2>/dev/null || true
     fi
 }
 
+# Escape a string for use inside a JSON string literal
+# Usage: _log_json_escape <var> <string>
+_log_json_escape() {
+    local s="$2"
+    s=${s//\\/\\\\}
+    s=${s//\"/\\\"}
+    s=${s//$'\n'/\\n}
+    s=${s//$'\r'/\\r}
+    s=${s//$'\t'/\\t}
+    # Every other control character as \u00XX (NUL never survives into a bash string)
+    if [[ "$s" == *[[:cntrl:]]* ]]; then
+        local i hex c
+        for ((i = 1; i < 32; i++)); do
+            printf -v hex '%02x' "$i"
+            printf -v c "\\x$hex"
+            s=${s//"$c"/\\u00$hex}
+        done
+    fi
+    printf -v "$1" '%s' "$s"
+}
+
 # Log structured JSON event
-# Usage: log_json <category> <json_string> [session_id]
+# Usage: log_json <category> <json_string> [session_id] [record]
+#
+# record is json_string already stamped by the caller's own jq call, e.g.
+#   _log_now ts; jq -c --arg ts "$ts" '. + {timestamp: $ts}'
+# so logging costs no extra fork. Without it json_string is stamped here with
+# jq; input jq rejects, or no jq, is written as {"timestamp", "raw"}.
 log_json() {
     local category="$1"
     local json="$2"
     local session_id="${3:-unknown}"
-    local timestamp=$(date '+%Y-%m-%d %H:%M:%S')
+    local record="${4:-}"
+    local timestamp
+    _log_now timestamp
 
     init_log_dir "$session_id"
 
     # JSON log file (append JSONL format)
     local json_log="$LOG_DATE_DIR/${category}.jsonl"
 
-    # Add timestamp to JSON and write
-    if command -v jq &>/dev/null; then
-        echo "$json" | jq -c --arg ts "$timestamp" '. + {timestamp: $ts}' >> "$json_log" 2>/dev/null || \
-            echo "{\"timestamp\": \"$timestamp\", \"raw\": \"$(echo "$json" | tr '"' "'" | head -c 1000)\"}" >> "$json_log"
-    else
-        echo "{\"timestamp\": \"$timestamp\", \"data\": \"jq not available\"}" >> "$json_log"
+    # Add timestamp to the JSON object and write
+    if [[ -z "$record" ]] && command -v jq &>/dev/null; then
+        record=$(jq -c --arg ts "$timestamp" 'if type == "object" then . + {timestamp: $ts} else error end' \
+            <<< "$json" 2>/dev/null) || record=""
+        # One object per record; several concatenated values are not one
+        [[ "$record" == *$'\n'* ]] && record=""
     fi
+    if [[ -z "$record" ]]; then
+        local raw
+        _log_json_escape raw "${json:0:1000}"
+        record="{\"timestamp\": \"$timestamp\", \"raw\": \"$raw\"}"
+    fi
+    printf '%s\n' "$record" >> "$json_log" 2>/dev/null || true
 }
 
 # Get summary of today's logs
 # Usage: get_log_summary [project_dir]
 get_log_summary() {
-    local project_dir="${1:-${CLAUDE_PROJECT_DIR:-$(pwd)}}"
-    local date_folder=$(date '+%Y-%m-%d')
+    local project_dir="${1:-${CLAUDE_PROJECT_DIR:-$PWD}}"
+    local date_folder
+    _log_now date_folder '%Y-%m-%d'
     local log_dir="$project_dir/.claude/hooks/.cache/$date_folder"
 
     if [[ -d "$log_dir" ]]; then
@@ -109,14 +164,22 @@ get_log_summary() {
 }
 
 # Clean old logs (keep last N days)
+# Finished days are first compacted into indexed segments (log_segments.py);
+# segments older than N days are then dropped. Without python3, old day
+# directories are simply deleted.
 # Usage: clean_old_logs [days_to_keep]
 clean_old_logs() {
     local days="${1:-7}"
-    local project_dir="${CLAUDE_PROJECT_DIR:-$(pwd)}"
+    local project_dir="${CLAUDE_PROJECT_DIR:-$PWD}"
     local log_base="$project_dir/.claude/hooks/.cache"
+    local compactor="${BASH_SOURCE[0]%/*}/log_segments.py"
 
     if [[ -d "$log_base" ]]; then
-        find "$log_base" -type d -mtime +"$days" -exec rm -rf {} \; 2>/dev/null || true
+        if command -v python3 &>/dev/null && [[ -f "$compactor" ]]; then
+            python3 "$compactor" --project-dir "$project_dir" compact --keep-days "$days" >/dev/null 2>&1 || true
+        fi
+        find "$log_base" -mindepth 1 -maxdepth 1 -type d -name '????-??-??' -mtime +"$days" \
+            -exec rm -rf {} + 2>/dev/null || true
         echo "Cleaned logs older than $days days"
     fi
 }
@@ -11,9 +11,17 @@
 #   view-logs.sh 2026-01-29         # Specific date
 #   view-logs.sh today subagent     # Today's subagent logs only
 #   view-logs.sh --list             # List available dates
+#   view-logs.sh --clean [days]     # Compact finished days, drop segments older than N days
+#   view-logs.sh --query [args]     # Indexed search (see log-query.py --help), e.g.
+#   view-logs.sh --query --category tool-failure --since 1d --text "permission denied"
+#
+# Finished days are compacted into .cache/segments/ (see log_segments.py);
+# viewing a compacted date reads its records back from the segment.
 
 set -euo pipefail
 
+SEGMENTS="$(dirname "${BASH_SOURCE[0]}")/log_segments.py"
+
 # Use CLAUDE_PROJECT_DIR (set by Claude Code) or current directory
 PROJECT_DIR="${CLAUDE_PROJECT_DIR:-$(pwd)}"
 LOG_BASE="$PROJECT_DIR/.claude/hooks/.cache"
@@ -23,12 +31,23 @@ DATE="${1:-$(date '+%Y-%m-%d')}"
 CATEGORY="${2:-}"
 
 # Handle special commands
+if [[ "$DATE" == "--query" || "$DATE" == "-q" ]]; then
+    if ! command -v python3 &>/dev/null; then
+        echo "--query needs python3" >&2
+        exit 1
+    fi
+    exec python3 "$(dirname "${BASH_SOURCE[0]}")/log-query.py" --project-dir "$PROJECT_DIR" "${@:2}"
+fi
+
 if [[ "$DATE" == "--list" || "$DATE" == "-l" ]]; then
     echo "=== Available Log Dates ==="
     echo "Location: $LOG_BASE"
     echo ""
     if [[ -d "$LOG_BASE" ]]; then
-        ls -1 "$LOG_BASE" 2>/dev/null | sort -r | head -20 || echo "  (no logs yet)"
+        {
+            ls -1 "$LOG_BASE" 2>/dev/null | grep -E '^[0-9]{4}-[0-9]{2}-[0-9]{2}$' || true
+            ls -1 "$LOG_BASE/segments" 2>/dev/null | sed -n 's/\.idx\.json$/ (compacted)/p' || true
+        } | sort -r | head -20
     else
         echo "  (no logs directory yet)"
     fi
@@ -39,7 +58,9 @@ if [[ "$DATE" == "--clean" ]]; then
     DAYS="${2:-7}"
     echo "Cleaning logs older than $DAYS days..."
     if [[ -d "$LOG_BASE" ]]; then
-        find "$LOG_BASE" -type d -mtime +"$DAYS" -exec rm -rf {} \; 2>/dev/null || true
+        # shellcheck source=/dev/null
+        source "$(dirname "${BASH_SOURCE[0]}")/logging.sh"
+        CLAUDE_PROJECT_DIR="$PROJECT_DIR" clean_old_logs "$DAYS" >/dev/null
         echo "Done."
     fi
     exit 0
@@ -51,6 +72,22 @@ fi
 
 LOG_DIR="$LOG_BASE/$DATE"
 
+if [[ ! -d "$LOG_DIR" && -f "$LOG_BASE/segments/$DATE.idx.json" ]] && command -v python3 &>/dev/null; then
+    echo "=== Hook Logs for $DATE (compacted) ==="
+    echo "Project: $PROJECT_DIR"
+    echo ""
+    if [[ -n "$CATEGORY" ]]; then
+        echo "--- $CATEGORY.log ---"
+        python3 "$SEGMENTS" --project-dir "$PROJECT_DIR" read --day "$DATE" --category "$CATEGORY" --kind log
+        echo ""
+        echo "--- $CATEGORY.jsonl (structured) ---"
+        python3 "$SEGMENTS" --project-dir "$PROJECT_DIR" read --day "$DATE" --category "$CATEGORY" --kind jsonl
+    else
+        python3 "$SEGMENTS" --project-dir "$PROJECT_DIR" list | awk -v d="$DATE:" '$1 == d {p=1; print; next} /^[0-9]/ {p=0} p'
+    fi
+    exit 0
+fi
+
 if [[ ! -d "$LOG_DIR" ]]; then
     echo "No logs found for $DATE"
     echo "Log location: $LOG_BASE"
@@ -7,6 +7,13 @@ PROJECT_DIR="${CLAUDE_PROJECT_DIR:-$(pwd)}"
 HOOKS_DIR="$PROJECT_DIR/.claude/hooks/utils"
 SETTINGS="$PROJECT_DIR/.claude/settings.json"
 
+SCRIPT_DIR="${BASH_SOURCE[0]%/*}"
+[[ "$SCRIPT_DIR" == "${BASH_SOURCE[0]}" ]] && SCRIPT_DIR="."
+source "$SCRIPT_DIR/../utils/journal.sh"
+
+INPUT=$(cat 2>/dev/null || true)
+SESSION_ID=$(journal_session_id "$INPUT")
+
 echo "=== Hook Development Audit Summary ==="
 echo ""
 
@@ -34,34 +41,70 @@ fi
 
 echo ""
 echo "Recent Hook Activity:"
-# Show recently modified hook scripts
-find "$HOOKS_DIR" -type f \( -name "*.sh" -o -name "*.py" -o -name "*.cjs" \) -mtime -1 2>/dev/null | while read -r hook; do
-    relpath="${hook#$PROJECT_DIR/}"
-    echo "  * $relpath (modified today)"
-done
+HOOK_FILES=()
+if [[ -n "$SESSION_ID" ]]; then
+    # Hook scripts this session wrote, from the journal lint-hook.sh keeps
+    while IFS= read -r hook; do
+        case "$hook" in
+            "$HOOKS_DIR"/*|.claude/hooks/utils/*) HOOK_FILES+=("$hook") ;;
+        esac
+    done < <(journal_files "$SESSION_ID" '\.(sh|py|cjs)$' "$(journal_cwd "$INPUT")")
+    for hook in ${HOOK_FILES[@]+"${HOOK_FILES[@]}"}; do
+        echo "  * ${hook#$PROJECT_DIR/} (modified this session)"
+    done
+else
+    # Run by hand without a payload: show recently modified hook scripts
+    find "$HOOKS_DIR" -type f \( -name "*.sh" -o -name "*.py" -o -name "*.cjs" \) -mtime -1 2>/dev/null | while read -r hook; do
+        relpath="${hook#$PROJECT_DIR/}"
+        echo "  * $relpath (modified today)"
+    done
+    for ext in sh py cjs; do
+        while IFS= read -r hook; do
+            HOOK_FILES+=("$hook")
+        done < <(find "$HOOKS_DIR" -name "*.$ext" 2>/dev/null)
+    done
+fi
 
 echo ""
 echo "Syntax Validation:"
-# Quick syntax check on all hooks
+# Quick syntax check on the session's hooks (all hooks when run by hand)
 ERROR_COUNT=0
-for hook in $(find "$HOOKS_DIR" -name "*.sh" 2>/dev/null); do
-    if ! bash -n "$hook" 2>/dev/null; then
-        echo "  ❌ $hook"
-        ERROR_COUNT=$((ERROR_COUNT + 1))
+SYNTAX_CHECK="$SCRIPT_DIR/../utils/syntax_check.py"
+BATCHED=false
+if [ ${#HOOK_FILES[@]} -gt 0 ] && command -v python3 &>/dev/null && [ -f "$SYNTAX_CHECK" ]; then
+    # One batched, cached pass instead of an interpreter launch per file.
+    # Its plain output has one "✅ file" or "❌ file" line per file (error text
+    # is indented); exit 0 = all valid, 1 = some invalid. Anything else, or a
+    # verdict missing for any file, means the checker itself failed.
+    BATCH_STATUS=0
+    BATCH_OUTPUT=$(python3 "$SYNTAX_CHECK" "${HOOK_FILES[@]}" 2>/dev/null) || BATCH_STATUS=$?
+    VERDICTS=$(printf '%s\n' "$BATCH_OUTPUT" | grep -c -e '^✅ ' -e '^❌ ' || true)
+    FAILED=$(printf '%s\n' "$BATCH_OUTPUT" | grep '^❌ ' || true)
+    if [ "$VERDICTS" -eq ${#HOOK_FILES[@]} ] && {
+        { [ "$BATCH_STATUS" -eq 0 ] && [ -z "$FAILED" ]; } ||
+        { [ "$BATCH_STATUS" -eq 1 ] && [ -n "$FAILED" ]; }
+    }; then
+        BATCHED=true
+        while IFS= read -r hook; do
+            [ -n "$hook" ] || continue
+            echo "  $hook"
+            ERROR_COUNT=$((ERROR_COUNT + 1))
+        done <<< "$FAILED"
     fi
-done
-for hook in $(find "$HOOKS_DIR" -name "*.py" 2>/dev/null); do
-    if ! python -m py_compile "$hook" 2>/dev/null; then
-        echo "  ❌ $hook"
-        ERROR_COUNT=$((ERROR_COUNT + 1))
-    fi
-done
-for hook in $(find "$HOOKS_DIR" -name "*.cjs" 2>/dev/null); do
-    if ! node --check "$hook" 2>/dev/null; then
+fi
+
+if ! $BATCHED; then
+    # Per-file fallback: a file that cannot be checked counts as an error
+    for hook in ${HOOK_FILES[@]+"${HOOK_FILES[@]}"}; do
+        case "$hook" in
+            *.sh) bash -n "$hook" 2>/dev/null && continue ;;
+            *.py) python3 -m py_compile "$hook" 2>/dev/null && continue ;;
+            *.cjs) node --check "$hook" 2>/dev/null && continue ;;
+        esac
         echo "  ❌ $hook"
         ERROR_COUNT=$((ERROR_COUNT + 1))
-    fi
-done
+    done
+fi
 
 if [ "$ERROR_COUNT" -eq 0 ]; then
     echo "  ✓ All hooks pass syntax check"
@@ -2,9 +2,18 @@
 # List all skills with full metadata for overlap detection
 # Searches: Project (.claude/skills), User (~/.claude/skills), Plugin (~/.claude/plugins/cache)
 # Output: JSON array of skill objects
+#
+# With python3 available this execs skill_catalog.py, which prints the same
+# array from a persistent index (only changed directories are rescanned).
+# The awk implementation below is the fallback (also used when
+# LIST_SKILLS_NO_INDEX is set).
 
 set -euo pipefail
 
+if [[ -z "${LIST_SKILLS_NO_INDEX:-}" ]] && command -v python3 &>/dev/null; then
+  exec python3 "$(dirname "${BASH_SOURCE[0]}")/skill_catalog.py"
+fi
+
 PROJECT="${CLAUDE_PROJECT_DIR:-.}/.claude/skills"
 USER_SKILLS="$HOME/.claude/skills"
 PLUGINS="$HOME/.claude/plugins/cache"
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Streaming reader for hook payloads.
+
+A PreToolUse payload for a Write carries the whole file in
+tool_input.content, yet most hooks only need tool_name and
+tool_input.file_path to decide the file is none of their business.
+json.load() reads and decodes all of it first. This reader scans the JSON
+incrementally instead: stdin is read in chunks only as far as the requested
+fields, values are recorded as byte spans, and a span is decoded only when
+get() asks for it. A hook can therefore reject a 50MB Write after reading
+its first few hundred bytes, and decode `content` only when it validates it.
+
+Differences from json.loads, both irrelevant for payloads Claude Code sends:
+malformed JSON after the last field read goes unnoticed, and a duplicated
+key resolves to its first occurrence rather than its last.
+
+Usage:
+    payload_reader.py [--bench] [FIELD...]
+
+Prints each dotted FIELD (default: tool_name tool_input.file_path) read from
+stdin, one per line. --bench times json.load against this reader on Write
+payloads from 1KB to 50MB.
+"""
+
+CHUNK_SIZE = 64 * 1024
+
+# Values deeper than this are skipped over but never recorded
+MAX_RECORD_DEPTH = 2
+
+_WHITESPACE = b" \t\r\n"
+_SCALAR_END = b" \t\r\n,]}"
+_CONTROL = bytes(range(0x20))
+
+
+class PayloadError(ValueError):
+    """The payload is not a JSON object (or not one this reader can follow)."""
+
+
+class Payload:
+    """Lazily scanned hook payload; see get()."""
+
+    def __init__(self, source, chunk_size=CHUNK_SIZE):
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self.data = bytes(source)
+            self.stream = None
+        else:
+            self.data = bytearray()
+            self.stream = source
+        self.chunk_size = chunk_size
+        self.pos = 0
+        self.spans = {}
+        self.decoded = {}
+        self.closed = set()
+        self.finished = False
+        self._events = self._document()
+
+    # ── input ────────────────────────────────────────────────────────────────
+
+    def _more(self, at_least=0):
+        """Append the next chunk; False at end of input."""
+        if self.stream is None:
+            return False
+        chunk = self.stream.read(max(self.chunk_size, at_least))
+        if not chunk:
+            self.stream = None
+            return False
+        self.data += chunk
+        return True
+
+    def _skip_whitespace(self):
+        while True:
+            data, pos = self.data, self.pos
+            while pos < len(data) and data[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(data) or not self._more():
+                return
+
+    def _peek(self):
+        self._skip_whitespace()
+        if self.pos >= len(self.data):
+            raise PayloadError("unexpected end of payload")
+        return self.data[self.pos]
+
+    def _expect(self, byte):
+        if self._peek() != byte:
+            raise PayloadError(f"expected {chr(byte)!r} at byte {self.pos}")
+        self.pos += 1
+
+    def _read_rest(self):
+        if self.stream is not None:
+            self.data += self.stream.read()
+            self.stream = None
+
+    def read_all(self):
+        """The complete raw payload, reading whatever is left of the stream."""
+        self._read_rest()
+        return bytes(self.data)
+
+    # ── scanning ─────────────────────────────────────────────────────────────
+
+    def _closing_quote(self, start, limit=None):
+        """Index of the quote ending the string opened at start, or -1 before limit."""
+        data = self.data
+        quote = data.find(b'"', start + 1, limit)
+        while quote != -1:
+            # Escaped when preceded by an odd number of backslashes
+            backslash = quote
+            while data[backslash - 1] == 0x5C:
+                backslash -= 1
+            if (quote - backslash) % 2 == 0:
+                return quote
+            quote = data.find(b'"', quote + 1, limit)
+        return -1
+
+    def _scan_string(self):
+        """(start, end) of the string token at pos, quotes included."""
+        start = self.pos
+        while True:
+            quote = self._closing_quote(start, start + self.chunk_size)
+            if quote != -1:
+                self.pos = quote + 1
+                return start, self.pos
+            if len(self.data) >= start + self.chunk_size or not self._more():
+                break
+        # A long string (typically `content`): read the rest and let json's C
+        # scanner find the end, keeping the value it decodes
+        self._read_rest()
+        from json.decoder import scanstring
+        try:
+            with memoryview(self.data) as view:
+                text = str(view[start + 1:], "utf-8")
+            value, end = scanstring(text, 0)
+        except ValueError:
+            quote = self._closing_quote(start)
+            if quote == -1:
+                raise PayloadError("unterminated string")
+            self.pos = quote + 1
+            return start, self.pos
+        self.pos = start + 1 + (end if text.isascii() else len(text[:end].encode("utf-8")))
+        self.decoded[(start, self.pos)] = value
+        return start, self.pos
+
+    def _scan_scalar(self):
+        start = pos = self.pos
+        while True:
+            data = self.data
+            while pos < len(data) and data[pos] not in _SCALAR_END:
+                pos += 1
+            if pos < len(data) or not self._more():
+                break
+        if pos == start:
+            raise PayloadError(f"unexpected {chr(self.data[start])!r} at byte {start}")
+        self.pos = pos
+        return start, pos
+
+    def _value(self, path):
+        """Scan one value, yielding (path, span) for it and its members, and (path, None) when an object closes."""
+        byte = self._peek()
+        start = self.pos
+        if byte == 0x7B:  # {
+            self.pos += 1
+            if self._peek() == 0x7D:
+                self.pos += 1
+            else:
+                while True:
+                    if self._peek() != 0x22:
+                        raise PayloadError(f"expected a key at byte {self.pos}")
+                    key = self._key(*self._scan_string())
+                    self._expect(0x3A)  # :
+                    yield from self._value(path + (key,))
+                    if self._peek() == 0x2C:
+                        self.pos += 1
+                    else:
+                        self._expect(0x7D)
+                        break
+            if len(path) < MAX_RECORD_DEPTH:
+                yield path, None
+            if len(path) <= MAX_RECORD_DEPTH:
+                yield path, (start, self.pos)
+        elif byte == 0x5B:  # [
+            self.pos += 1
+            if self._peek() == 0x5D:
+                self.pos += 1
+            else:
+                index = 0
+                while True:
+                    yield from self._value(path + (index,))
+                    index += 1
+                    if self._peek() == 0x2C:
+                        self.pos += 1
+                    else:
+                        self._expect(0x5D)
+                        break
+            if len(path) <= MAX_RECORD_DEPTH:
+                yield path, (start, self.pos)
+        else:
+            span = self._scan_string() if byte == 0x22 else self._scan_scalar()
+            if len(path) <= MAX_RECORD_DEPTH:
+                yield path, span
+
+    def _key(self, start, end):
+        raw = self.data[start + 1:end - 1]
+        if b"\\" not in raw:
+            return raw.decode("utf-8", "surrogateescape")
+        import json
+        return json.loads(self.data[start:end])
+
+    def _document(self):
+        if self._peek() != 0x7B:
+            raise PayloadError("payload is not a JSON object")
+        yield from self._value(())
+        self._skip_whitespace()
+        if self.pos < len(self.data):
+            raise PayloadError(f"extra data at byte {self.pos}")
+
+    # ── lookup ───────────────────────────────────────────────────────────────
+
+    def _settled(self, path):
+        """True once path has a value or can no longer get one."""
+        if path in self.spans or self.finished:
+            return True
+        return any(path[:i] in self.closed for i in range(len(path)))
+
+    def _advance(self):
+        """Record the next scan event; False once the payload is exhausted."""
+        try:
+            event_path, span = next(self._events)
+        except StopIteration:
+            self.finished = True
+            return False
+        except PayloadError:
+            self.finished = True
+            raise
+        except (RecursionError, ValueError) as e:
+            self.finished = True
+            raise PayloadError(str(e)) from e
+        if span is None:
+            self.closed.add(event_path)
+        else:
+            self.spans.setdefault(event_path, span)
+        return True
+
+    def get(self, path, default=None):
+        """
+        Decoded value at path, a dotted string or a tuple of keys.
+
+        Scans only as far as needed to find the value, or to see the
+        enclosing object close without it. Only values within
+        MAX_RECORD_DEPTH levels are available; objects and arrays are
+        decoded whole.
+
+        Raises:
+            PayloadError: if the payload is malformed before the answer is known
+        """
+        if isinstance(path, str):
+            path = tuple(path.split("."))
+        while not self._settled(path) and self._advance():
+            pass
+        span = self.spans.get(path)
+        if span is None:
+            return default
+        if span in self.decoded:
+            return self.decoded[span]
+        start, end = span
+        try:
+            # Plain strings (paths, names) need no JSON decoder
+            raw = self.data[start + 1:end - 1]
+            if self.data[start] == 0x22 and b"\\" not in raw and len(raw.translate(None, _CONTROL)) == len(raw):
+                return raw.decode("utf-8")
+            import json
+            return json.loads(self.data[start:end])
+        except ValueError as e:
+            raise PayloadError(str(e))
+
+    def finish(self):
+        """Scan to the end of the payload, so any malformed JSON raises PayloadError."""
+        while not self.finished and self._advance():
+            pass
+
+
+def read_payload(source, chunk_size=CHUNK_SIZE):
+    """Payload over a binary stream (read lazily) or raw bytes."""
+    return Payload(source, chunk_size)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BENCHMARK
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _bench_payload(size, file_path):
+    import json
+    line = 'const value = "quoted \\\\ text";\t// ünïcode\n'
+    content = (line * (size // len(line) + 1))[:size]
+    return json.dumps({
+        "session_id": "bench", "transcript_path": "/tmp/transcript.jsonl", "cwd": "/tmp",
+        "hook_event_name": "PreToolUse", "tool_name": "Write",
+        "tool_input": {"file_path": file_path, "content": content},
+    }).encode("utf-8")
+
+
+def bench():
+    import io
+    import json
+    import time
+
+    def best(fn, runs):
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        return min(times) * 1000
+
+    print(f"{'size':>8} {'json.load':>11} {'reader':>11} {'reader+content':>15}")
+    for size in (1 << 10, 64 << 10, 1 << 20, 10 << 20, 50 << 20):
+        other = _bench_payload(size, "/repo/src/app.js")
+        skill = _bench_payload(size, "/repo/.claude/skills/x/SKILL.md")
+        runs = 5 if size <= 1 << 20 else 2
+        full = best(lambda: json.load(io.BytesIO(other)), runs)
+        lazy = best(lambda: read_payload(io.BytesIO(other)).get("tool_input.file_path"), runs)
+
+        def needed():
+            payload = read_payload(io.BytesIO(skill))
+            if payload.get("tool_input.file_path", "").endswith("SKILL.md"):
+                payload.get("tool_input.content")
+        content = best(needed, runs)
+        label = f"{size >> 20}MB" if size >= 1 << 20 else f"{size >> 10}KB"
+        print(f"{label:>8} {full:>9.2f}ms {lazy:>9.2f}ms {content:>13.2f}ms")
+
+
+def main():
+    import json
+    import sys
+
+    args = sys.argv[1:]
+    if "--bench" in args:
+        bench()
+        return 0
+    payload = read_payload(sys.stdin.buffer)
+    try:
+        for field in args or ["tool_name", "tool_input.file_path"]:
+            value = payload.get(field, "")
+            print(value if isinstance(value, str) else json.dumps(value))
+    except PayloadError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""Runs the SKILL.md lint and size checks after Write/Edit operations.
+
+PostToolUse hook - non-blocking warnings. Parses the payload once, reads the
+file once and runs every check in skill_checks.py in this process (see
+utils/check_runner.py); every write is also recorded in the session journal
+read by the Stop audit report.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Imported for its side effect: registering the "skill" checks with check_runner
+import skill_checks  # noqa: F401
+from check_runner import run_chain
+
+if __name__ == "__main__":
+    sys.exit(run_chain("skill"))
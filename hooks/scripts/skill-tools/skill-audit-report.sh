@@ -5,8 +5,20 @@ set -euo pipefail
 echo "=== Skill Creator Audit Report ==="
 echo ""
 
-# Find recently modified skill files (last 60 minutes)
-RECENT_SKILLS=$(find .claude/skills -name "SKILL.md" -mmin -60 2>/dev/null || true)
+SCRIPT_DIR="${BASH_SOURCE[0]%/*}"
+[[ "$SCRIPT_DIR" == "${BASH_SOURCE[0]}" ]] && SCRIPT_DIR="."
+source "$SCRIPT_DIR/../utils/journal.sh"
+
+INPUT=$(cat 2>/dev/null || true)
+SESSION_ID=$(journal_session_id "$INPUT")
+
+if [[ -n "$SESSION_ID" ]]; then
+    # Skill files this session wrote, from the journal run-skill-checks.py keeps
+    RECENT_SKILLS=$(journal_files "$SESSION_ID" 'SKILL\.md$' "$(journal_cwd "$INPUT")")
+else
+    # Run by hand without a payload: fall back to recently modified files
+    RECENT_SKILLS=$(find .claude/skills -name "SKILL.md" -mmin -60 2>/dev/null || true)
+fi
 
 if [[ -z "$RECENT_SKILLS" ]]; then
     echo "No skill files modified in this session."
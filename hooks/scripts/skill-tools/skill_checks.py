@@ -0,0 +1,81 @@
+"""PostToolUse checks for SKILL.md files (the former lint-skill.sh and check-skill-size.sh)."""
+import os
+import re
+import sys
+
+UTILS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils")
+if UTILS not in sys.path:
+    sys.path.insert(0, UTILS)
+
+from check_runner import check
+
+SKILL_FILE = r"SKILL\.md$"
+
+WORKFLOW_SUMMARY = re.compile(rb"description:.*then.*then|description:.*step.*step|description:.*first.*then")
+DESCRIPTION = re.compile(rb"^description:")
+TOP_LEVEL_HOOKS = re.compile(rb"^hooks:")
+NESTED_HOOKS = re.compile(rb"^\s+hooks:\s*$")
+REFERENCES_LINK = re.compile(rb"\[.*\]\(references?/")
+CODE_FENCE = re.compile(rb"^```")
+TABLE_ROW = re.compile(rb"^\|")
+
+MAX_LINES = 500
+MAX_WORDS = 2000
+MAX_CODE_FENCES = 10
+MAX_TABLE_ROWS = 50
+
+
+@check("skill", "lint", SKILL_FILE)
+def lint(target):
+    """Quality checks on the frontmatter and links."""
+    warnings = []
+
+    # Check for workflow summary in description (common mistake)
+    if target.grep(WORKFLOW_SUMMARY):
+        warnings.append("Description may contain workflow summary (should only have triggers)")
+
+    # Check description starts with "Use when"
+    line = target.grep(DESCRIPTION)
+    description = line[len(b"description:"):].lstrip() if line else b""
+    if description and not re.match(rb'"?Use when', description):
+        warnings.append("Description should start with 'Use when...'")
+
+    # Check hooks syntax if present - nested hooks: array is the wrong format
+    if target.grep(TOP_LEVEL_HOOKS) and target.grep(NESTED_HOOKS):
+        warnings.append("Hook format may be wrong - use flat format (type: at same level as matcher:)")
+
+    # Check for missing references to supporting files
+    if target.grep(REFERENCES_LINK):
+        if not os.path.isdir(os.path.join(os.path.dirname(target.path) or ".", "references")):
+            warnings.append("References to references/ but directory doesn't exist")
+
+    if not warnings:
+        return [f"Skill lint passed: {target.path}"]
+    return [f"Skill lint warnings for {target.path}:"] + [f"  - {w}" for w in warnings]
+
+
+@check("skill", "size", SKILL_FILE)
+def size(target):
+    """Progressive disclosure thresholds."""
+    line_count = target.data.count(b"\n")
+    word_count = len(target.data.split())
+    output = [f"Skill size check: {target.path}", f"  Lines: {line_count}", f"  Words: {word_count}"]
+
+    issues = []
+    if line_count > MAX_LINES:
+        issues.append(f"SKILL.md has {line_count} lines (recommended: <{MAX_LINES})")
+        issues.append("Consider moving detailed content to reference.md")
+    if word_count > MAX_WORDS:
+        issues.append(f"SKILL.md has {word_count} words (recommended: <{MAX_WORDS})")
+
+    # Common bloat indicators - code blocks and tables (tables bloat token count)
+    code_fences = target.count(CODE_FENCE)
+    if code_fences > MAX_CODE_FENCES:
+        issues.append(f"Many code blocks ({code_fences}) - consider moving examples to scripts/")
+    table_rows = target.count(TABLE_ROW)
+    if table_rows > MAX_TABLE_ROWS:
+        issues.append(f"Many table rows ({table_rows}) - consider moving to reference.md")
+
+    if not issues:
+        return output + ["  Size within limits"]
+    return output + ["", "Size warnings:"] + [f"  - {issue}" for issue in issues]
@@ -0,0 +1,198 @@
+"""Skill metadata checks shared by the PreToolUse hook and its validation server.
+
+run_hook() reproduces the hook's observable behaviour (exit code, stdout,
+stderr) for one raw stdin payload so it can run either in-process or inside
+the long-lived server started by validation_server.py.
+
+A Write is validated from its content. An Edit or MultiEdit is validated by
+applying its replacements to the frontmatter of the file on disk: only the
+header (plus enough of the body to match an edit straddling it) is read,
+and edits that land entirely in the body are let through unchecked.
+"""
+import json
+import os
+import re
+import sys
+
+import payload_reader
+
+# The frontmatter parser ships with the writing-skills skill. It is found
+# through the plugin root Claude Code passes to hooks, else relative to this
+# file; without it SKILL.md writes are let through with a warning.
+PLUGIN_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+FRONTMATTER_DIRS = [
+    os.path.join(root, "skills", "writing-skills", "scripts")
+    for root in dict.fromkeys(filter(None, (os.environ.get("CLAUDE_PLUGIN_ROOT"), PLUGIN_ROOT)))
+]
+for _scripts in FRONTMATTER_DIRS:
+    if os.path.isfile(os.path.join(_scripts, "skill_frontmatter.py")):
+        if _scripts not in sys.path:
+            sys.path.insert(0, _scripts)
+        break
+
+try:
+    import skill_frontmatter
+    from skill_frontmatter import MAX_HEADER_BYTES, parse_frontmatter, read_frontmatter
+except ImportError:
+    skill_frontmatter = None
+
+
+def validate_content(content):
+    """Return the list of frontmatter errors for SKILL.md content."""
+    errors = []
+
+    frontmatter = parse_frontmatter(content)
+
+    # Check for frontmatter
+    if not frontmatter.opened:
+        errors.append("Missing YAML frontmatter (must start with ---)")
+
+    if frontmatter.closed:
+        # Validate name field
+        name = frontmatter.first_line("name")
+        if name:
+            if not re.match(r'^[a-z0-9-]+$', name):
+                errors.append(f"Invalid name '{name}': use lowercase letters, numbers, hyphens only")
+            if len(name) > 64:
+                errors.append(f"Name too long ({len(name)} chars): max 64 characters")
+        else:
+            errors.append("Missing required 'name' field in frontmatter")
+
+        # Validate description field
+        desc = frontmatter.first_line("description")
+        if desc:
+            if not desc.lower().startswith("use when"):
+                errors.append("Description should start with 'Use when...'")
+            if len(desc) > 1024:
+                errors.append(f"Description too long ({len(desc)} chars): max 1024 characters")
+        else:
+            errors.append("Missing required 'description' field in frontmatter")
+
+    return errors
+
+
+def header_end(text):
+    """Where the header of text ends: after its closing '---', or all of it when never closed."""
+    frontmatter = parse_frontmatter(text)
+    if frontmatter.closed:
+        return frontmatter.body_offset
+    return len(text) if frontmatter.opened else 0
+
+
+def read_head(path, lookahead=0):
+    """The start of a file: its frontmatter (up to MAX_HEADER_BYTES if never closed), then `lookahead` more characters."""
+    with open(path, "rb") as f:
+        frontmatter = read_frontmatter(f)
+        size = frontmatter.body_offset if frontmatter.closed else MAX_HEADER_BYTES
+        f.seek(0)
+        # Up to 4 bytes per character, so the lookahead survives any encoding
+        return f.read(size + 4 * lookahead).decode("utf-8", errors="replace")
+
+
+def edited_header(path, edits):
+    """
+    The frontmatter of path after edits, or None when no edit reaches it.
+
+    edits are (old_string, new_string, replace_all) applied in order, the way
+    Edit and MultiEdit apply them. An edit whose first match starts in the
+    body cannot change the header and is skipped; one matching at the very
+    start counts even when the file has no header yet.
+    """
+    edits = [edit for edit in edits if edit[0]]
+    if not edits:
+        return None
+    try:
+        text = read_head(path, max(len(old) for old, _, _ in edits))
+    except OSError:
+        return None  # Edit reports the missing file itself
+
+    end = header_end(text)
+    touched = False
+    for old, new, replace_all in edits:
+        index = text.find(old)
+        if index == -1 or (index > 0 and index >= end):
+            continue
+        if replace_all:
+            text = text.replace(old, new)
+        else:
+            text = text[:index] + new + text[index + len(old):]
+        end = header_end(text)
+        touched = True
+    return text[:end] if touched else None
+
+
+def payload_edits(fields):
+    """(old_string, new_string, replace_all) of an Edit or MultiEdit payload; None for other tools."""
+    tool_name = fields.get("tool_name", "")
+    if tool_name == "Edit":
+        edits = [{
+            "old_string": fields.get("tool_input.old_string", ""),
+            "new_string": fields.get("tool_input.new_string", ""),
+            "replace_all": fields.get("tool_input.replace_all", False),
+        }]
+    elif tool_name == "MultiEdit":
+        edits = fields.get("tool_input.edits", [])
+        if not isinstance(edits, list):
+            return []
+    else:
+        return None
+    return [
+        (edit.get("old_string"), edit.get("new_string"), edit.get("replace_all") is True)
+        for edit in edits
+        if isinstance(edit, dict) and isinstance(edit.get("old_string"), str) and isinstance(edit.get("new_string"), str)
+    ]
+
+
+def run_hook(payload):
+    """
+    Validate one hook payload.
+
+    Args:
+        payload: Raw stdin bytes of the PreToolUse event
+
+    Returns:
+        (exit_code, stdout_text, stderr_text)
+    """
+    fields = payload_reader.read_payload(payload)
+    try:
+        file_path = fields.get("tool_input.file_path", "")
+
+        # Only validate SKILL.md files
+        if not isinstance(file_path, str) or not file_path.endswith("SKILL.md"):
+            return 0, "", ""
+
+        # Decoded only now that it is needed; the rest of the payload is
+        # checked too, so a malformed one is reported rather than validated
+        edits = payload_edits(fields)
+        if edits is None:
+            content = fields.get("tool_input.content", "")
+        else:
+            cwd = fields.get("cwd", "")
+            file_path = os.path.join(cwd if isinstance(cwd, str) else "", file_path)
+        fields.finish()
+    except payload_reader.PayloadError:
+        # Let json report the malformed payload the way the hook always has
+        try:
+            input_data = json.loads(payload)
+        except json.JSONDecodeError as e:
+            return 1, "", f"Error: Invalid JSON input: {e}\n"
+        file_path = input_data.get("tool_input", {}).get("file_path", "")
+        if not file_path.endswith("SKILL.md"):
+            return 0, "", ""
+        content = input_data.get("tool_input", {}).get("content", "")
+        edits = None
+
+    if skill_frontmatter is None:
+        return 0, "", ("Warning: skill_frontmatter.py not found in " + " or ".join(FRONTMATTER_DIRS)
+                       + "; SKILL.md metadata not validated\n")
+
+    if edits is not None:
+        content = edited_header(file_path, edits)
+        if content is None:
+            return 0, "", ""
+
+    errors = validate_content(content)
+    if errors:
+        return 2, "", "".join(f"* {error}\n" for error in errors)
+
+    return 0, "Skill metadata valid\n", ""
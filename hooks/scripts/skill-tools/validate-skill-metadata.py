@@ -1,60 +1,47 @@
 #!/usr/bin/env python3
-"""Validates skill metadata before writing."""
-import json
+"""Validates skill metadata before writing.
+
+The payload is read lazily (payload_reader.py): a write to anything but a
+SKILL.md is let through as soon as tool_input.file_path has been read,
+without reading or decoding the rest. A SKILL.md payload is forwarded to the
+warm validation server (validation_server.py), spawning it on first use, and
+validated in-process whenever the server is unavailable. Set
+SKILL_VALIDATOR_DAEMON=0 to always validate in-process.
+"""
+import os
 import sys
-import re
-
-try:
-    input_data = json.load(sys.stdin)
-except json.JSONDecodeError as e:
-    print(f"Error: Invalid JSON input: {e}", file=sys.stderr)
-    sys.exit(1)
-
-file_path = input_data.get("tool_input", {}).get("file_path", "")
-
-# Only validate SKILL.md files
-if not file_path.endswith("SKILL.md"):
-    sys.exit(0)
-
-content = input_data.get("tool_input", {}).get("content", "")
-
-errors = []
-
-# Check for frontmatter
-if not content.startswith("---"):
-    errors.append("Missing YAML frontmatter (must start with ---)")
-
-# Extract frontmatter
-frontmatter_match = re.search(r'^---\n(.*?)\n---', content, re.DOTALL)
-if frontmatter_match:
-    frontmatter = frontmatter_match.group(1)
-
-    # Validate name field
-    name_match = re.search(r'^name:\s*(.+)$', frontmatter, re.MULTILINE)
-    if name_match:
-        name = name_match.group(1).strip()
-        if not re.match(r'^[a-z0-9-]+$', name):
-            errors.append(f"Invalid name '{name}': use lowercase letters, numbers, hyphens only")
-        if len(name) > 64:
-            errors.append(f"Name too long ({len(name)} chars): max 64 characters")
-    else:
-        errors.append("Missing required 'name' field in frontmatter")
-
-    # Validate description field
-    desc_match = re.search(r'^description:\s*(.+)$', frontmatter, re.MULTILINE)
-    if desc_match:
-        desc = desc_match.group(1).strip()
-        if not desc.lower().startswith("use when"):
-            errors.append("Description should start with 'Use when...'")
-        if len(desc) > 1024:
-            errors.append(f"Description too long ({len(desc)} chars): max 1024 characters")
-    else:
-        errors.append("Missing required 'description' field in frontmatter")
-
-if errors:
-    for error in errors:
-        print(f"* {error}", file=sys.stderr)
-    sys.exit(2)
-
-print("Skill metadata valid")
-sys.exit(0)
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import payload_reader
+
+
+def main():
+    payload = payload_reader.read_payload(sys.stdin.buffer)
+    try:
+        file_path = payload.get("tool_input.file_path", "")
+    except payload_reader.PayloadError:
+        file_path = None  # malformed; run_hook reports it
+    if isinstance(file_path, str) and not file_path.endswith("SKILL.md"):
+        sys.exit(0)
+    payload = payload.read_all()
+
+    import validation_server
+    result = None
+    if os.environ.get("SKILL_VALIDATOR_DAEMON", "1") != "0":
+        result = validation_server.request(payload)
+        if result is None:
+            validation_server.spawn()
+
+    if result is None:
+        import skill_metadata
+        result = skill_metadata.run_hook(payload)
+
+    code, out, err = result
+    sys.stdout.write(out)
+    sys.stderr.write(err)
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Warm validation server for the skill metadata PreToolUse hook.
+
+The hook client (validate-skill-metadata.py) sends the raw stdin payload over
+a Unix domain socket and replays the exit code, stdout and stderr it gets
+back. The server is spawned on first use and exits after an idle timeout, or
+as soon as skill_metadata.py, skill_frontmatter.py or payload_reader.py
+changes on disk. Each request checks those files first and, if they have
+changed, hands the payload back to the client, so edits are never served
+stale.
+
+Only the invoking user is trusted: without XDG_RUNTIME_DIR the socket lives
+in a 0700 directory of its own under TMPDIR, and the client ignores a socket
+(or, on Linux, a peer process) owned by anyone else and validates in-process.
+
+Usage:
+    validation_server.py [--socket PATH] [--idle-timeout SECONDS]
+
+Environment:
+    SKILL_VALIDATOR_SOCKET        Socket path override
+    SKILL_VALIDATOR_IDLE_TIMEOUT  Seconds of inactivity before exit (default: 300)
+"""
+import os
+import socket
+import stat
+import struct
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_IDLE_TIMEOUT = 300
+CLIENT_TIMEOUT = 2.0
+
+# Request: u64 payload length + payload
+# Response: i8 exit code, u32 stdout length, u32 stderr length + both bodies.
+# An exit code of -1 means the server could not handle the payload and the
+# client must validate in-process instead.
+REQUEST_HEADER = struct.Struct(">Q")
+RESPONSE_HEADER = struct.Struct(">bII")
+
+
+def socket_path():
+    """Per-user socket location."""
+    override = os.environ.get("SKILL_VALIDATOR_SOCKET")
+    if override:
+        return override
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "claude-skill-validator.sock")
+    tmp_dir = os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(tmp_dir, f"claude-skill-validator-{os.getuid()}", "validator.sock")
+
+
+def private_dir(path):
+    """True if path is a real directory only this user can write (created 0700 if missing)."""
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    except OSError:
+        return False
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+
+def owned_socket(path):
+    """True if path is a socket owned by this user."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+def peer_is_self(sock):
+    """True if the process at the other end runs as this user (unchecked where SO_PEERCRED is missing)."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _pid, uid, _gid = struct.unpack("3i", creds)
+    return uid == os.getuid()
+
+
+def _recv_exact(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError("connection closed mid-message")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLIENT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def request(payload, path=None):
+    """
+    Ask a running server to validate payload.
+
+    Returns:
+        (exit_code, stdout_text, stderr_text), or None if no server answered
+    """
+    path = path or socket_path()
+    if not owned_socket(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CLIENT_TIMEOUT)
+    try:
+        sock.connect(path)
+        if not peer_is_self(sock):
+            return None
+        sock.sendall(REQUEST_HEADER.pack(len(payload)) + payload)
+        code, out_len, err_len = RESPONSE_HEADER.unpack(_recv_exact(sock, RESPONSE_HEADER.size))
+        body = _recv_exact(sock, out_len + err_len)
+    except OSError:
+        return None
+    finally:
+        sock.close()
+
+    if code < 0:
+        return None
+    return code, body[:out_len].decode("utf-8"), body[out_len:].decode("utf-8")
+
+
+def spawn(path=None):
+    """Start a detached server in the background; never raises."""
+    import subprocess
+
+    args = [sys.executable, os.path.abspath(__file__)]
+    if path:
+        args += ["--socket", path]
+    try:
+        subprocess.Popen(
+            args,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SERVER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def serve(path, idle_timeout):
+    """Serve validation requests until idle or until the checks change."""
+    import fcntl
+    import socketserver
+    import threading
+    import time
+
+    sys.path.insert(0, HERE)
+    import skill_metadata
+    import payload_reader
+
+    # Never serve from a directory another user could swap the socket in
+    if not private_dir(os.path.dirname(path) or "."):
+        return 1
+
+    # One server per socket: the lock is held for the whole lifetime
+    lock_file = open(path + ".lock", "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return 0
+
+    watched = [skill_metadata.__file__, payload_reader.__file__]
+    if skill_metadata.skill_frontmatter is not None:
+        watched.append(skill_metadata.skill_frontmatter.__file__)
+    watched_mtimes = [os.stat(f).st_mtime_ns for f in watched]
+    state = {"last_used": time.monotonic(), "stale": False}
+
+    def changed():
+        try:
+            return [os.stat(f).st_mtime_ns for f in watched] != watched_mtimes
+        except OSError:
+            return True
+
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self):
+            state["last_used"] = time.monotonic()
+            try:
+                (size,) = REQUEST_HEADER.unpack(_recv_exact(self.request, REQUEST_HEADER.size))
+                payload = _recv_exact(self.request, size)
+            except (OSError, struct.error):
+                return
+
+            if changed():
+                # The checks were edited: let the client run the new code and shut down
+                state["stale"] = True
+                code, out, err = -1, "", ""
+            else:
+                try:
+                    code, out, err = skill_metadata.run_hook(payload)
+                except Exception:
+                    # Let the client reproduce the failure in-process
+                    code, out, err = -1, "", ""
+
+            out_bytes = out.encode("utf-8")
+            err_bytes = err.encode("utf-8")
+            try:
+                self.request.sendall(
+                    RESPONSE_HEADER.pack(code, len(out_bytes), len(err_bytes)) + out_bytes + err_bytes
+                )
+            except OSError:
+                pass
+
+            state["stale"] = state["stale"] or changed()
+            state["last_used"] = time.monotonic()
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    if os.path.exists(path):
+        os.unlink(path)
+    old_umask = os.umask(0o077)
+    try:
+        server = Server(path, Handler)
+    finally:
+        os.umask(old_umask)
+
+    def watchdog():
+        while True:
+            time.sleep(1.0)
+            if state["stale"] or time.monotonic() - state["last_used"] > idle_timeout:
+                server.shutdown()
+                return
+
+    threading.Thread(target=watchdog, daemon=True).start()
+    try:
+        server.serve_forever(poll_interval=0.5)
+    finally:
+        server.server_close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        lock_file.close()
+    return 0
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Warm validation server for validate-skill-metadata.py")
+    parser.add_argument("--socket", default=None, help="Unix socket path")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=float(os.environ.get("SKILL_VALIDATOR_IDLE_TIMEOUT", DEFAULT_IDLE_TIMEOUT)),
+        help=f"Seconds of inactivity before exiting (default: {DEFAULT_IDLE_TIMEOUT})",
+    )
+    args = parser.parse_args()
+    sys.exit(serve(args.socket or socket_path(), args.idle_timeout))
+
+
+if __name__ == "__main__":
+    main()
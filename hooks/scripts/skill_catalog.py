@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Cached skill catalog: the JSON that list-skills.sh prints, built from an index.
+
+Skills are found where list-skills.sh looks for them, in the same order:
+    project  $CLAUDE_PROJECT_DIR/.claude/skills/*/SKILL.md
+    user     ~/.claude/skills/*/SKILL.md
+    plugin   ~/.claude/plugins/cache/**/skills/*/SKILL.md (find order)
+
+Each root has its own index file under
+${XDG_CACHE_HOME:-~/.cache}/claude-development/skill-catalog/. It is a
+marshal file, which loads much faster than JSON; the index is derived data
+that can always be rebuilt. It stores each directory's listing with its
+mtime, and each SKILL.md's fingerprint (mtime, size, inode) with its
+rendered record. A later run only re-lists directories whose mtime changed
+and only re-parses a SKILL.md whose fingerprint changed. In-place edits
+leave the directory mtime alone, so each SKILL.md is stat()ed as well.
+
+Fields are extracted the way list-skills.sh's awk does it, first line only.
+One deliberate difference: a user-invocable value other than true or false
+is printed as a JSON string. The script printed it bare, which is invalid
+JSON.
+
+Usage:
+    skill_catalog.py [--no-cache] [--rebuild]
+
+Environment:
+    SKILL_CATALOG_CACHE     Index directory override
+    SKILL_CATALOG_NO_CACHE  Set to 1 to bypass the index
+"""
+
+import os
+import stat
+import sys
+
+INDEX_FORMAT = 1
+PLUGIN_PATTERN_DIR = "/skills/"
+
+
+def cache_dir():
+    override = os.environ.get("SKILL_CATALOG_CACHE")
+    if override:
+        return override
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "claude-development", "skill-catalog")
+
+
+def cache_disabled():
+    return os.environ.get("SKILL_CATALOG_NO_CACHE", "") not in ("", "0")
+
+
+def skill_roots(project_dir=None, home=None):
+    """[(location, root)] spelled exactly as list-skills.sh spells them."""
+    project_dir = project_dir if project_dir is not None else os.environ.get("CLAUDE_PROJECT_DIR", "")
+    home = home if home is not None else os.environ.get("HOME", os.path.expanduser("~"))
+    return [
+        ("project", f"{project_dir or '.'}/.claude/skills"),
+        ("user", f"{home}/.claude/skills"),
+        ("plugin", f"{home}/.claude/plugins/cache"),
+    ]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIELD EXTRACTION (mirrors the awk in list-skills.sh)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def frontmatter_lines(text):
+    """Lines between the first '---' line and the next one (or end of file)."""
+    lines = text.split("\n")
+    if lines and lines[-1] == "":
+        lines.pop()
+    try:
+        start = lines.index("---") + 1
+    except ValueError:
+        return []
+    try:
+        end = lines.index("---", start)
+    except ValueError:
+        end = len(lines)
+    return lines[start:end]
+
+
+def _strip_quotes(value):
+    if value[:1] in ("'", '"'):
+        value = value[1:]
+    if value[-1:] in ("'", '"'):
+        value = value[:-1]
+    return value
+
+
+def get_field(lines, field):
+    prefix = field + ":"
+    for line in lines:
+        if line.startswith(prefix):
+            return _strip_quotes(line[len(prefix):].lstrip(" "))
+    return ""
+
+
+def get_array_field(lines, field):
+    """Comma-joined items of an inline [a, b], comma list, or '  - item' block."""
+    prefix = field + ":"
+    in_array = False
+    items = ""
+    for line in lines:
+        if line.startswith(prefix):
+            start, end = line.find("["), line.rfind("]")
+            if start != -1 and end > start:
+                return line[start + 1:end].replace(" ", "")
+            value = line[len(prefix):].lstrip(" ")
+            if value:
+                return value.replace(" ", "")
+            in_array = True
+        elif in_array:
+            if line.startswith("  - "):
+                item = _strip_quotes(line[4:])
+                items = f"{items},{item}" if items else item
+            elif line[:1] not in ("", " "):
+                return items
+    return items
+
+
+def to_list(value):
+    return [item.strip(" \t\n\r\f\v") for item in value.split(",") if item.strip(" \t\n\r\f\v")]
+
+
+def skill_record(path, location, text):
+    """The catalog entry for one SKILL.md, keys in list-skills.sh order."""
+    lines = frontmatter_lines(text)
+    name = get_field(lines, "name") or os.path.basename(os.path.dirname(path))
+    user_invocable = get_field(lines, "user-invocable") or "true"
+    return {
+        "location": f"{location}: {path}",
+        "name": name,
+        "description": get_field(lines, "description"),
+        "allowed-tools": to_list(get_array_field(lines, "allowed-tools")),
+        "model": get_field(lines, "model"),
+        "context": get_field(lines, "context"),
+        "agent": to_list(get_array_field(lines, "agent")),
+        "user-invocable": {"true": True, "false": False}.get(user_invocable, user_invocable),
+        "has-hooks": any(line.startswith("hooks:") for line in lines),
+    }
+
+
+def render(record):
+    import json
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# INDEX
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class RootIndex:
+    """Directory listings and rendered skill records for one root, keyed by relative path."""
+
+    def __init__(self, root, use_cache=True):
+        self.root = root
+        self.use_cache = use_cache
+        self.dirty = False
+        self.listings = {}
+        self.skills = {}
+        self.seen_dirs = set()
+        self.seen_skills = set()
+        if use_cache:
+            import zlib
+            key = zlib.crc32(root.encode("utf-8", "surrogateescape"))
+            self.path = os.path.join(cache_dir(), f"{os.path.basename(root) or 'root'}-{key:08x}.marshal")
+            self._load()
+
+    def _load(self):
+        import marshal
+        try:
+            with open(self.path, "rb") as f:
+                data = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return
+        if isinstance(data, dict) and data.get("format") == INDEX_FORMAT \
+                and data.get("python") == sys.version_info[:2] and data.get("root") == self.root:
+            self.listings = data["listings"]
+            self.skills = data["skills"]
+
+    def save(self):
+        """Forget what this run did not visit, then write the index if anything changed."""
+        # Every visited key is in its table, so equal sizes mean nothing went stale
+        for table, seen in ((self.listings, self.seen_dirs), (self.skills, self.seen_skills)):
+            if len(table) != len(seen):
+                for key in [k for k in table if k not in seen]:
+                    del table[key]
+                self.dirty = True
+        if not (self.use_cache and self.dirty):
+            return
+        import marshal
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                marshal.dump({"format": INDEX_FORMAT, "python": tuple(sys.version_info[:2]), "root": self.root,
+                              "listings": self.listings, "skills": self.skills}, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    def listing(self, rel, scan, follow_symlinks=False):
+        """Cached scan() of root/rel, refreshed when the directory's mtime changes."""
+        directory = f"{self.root}/{rel}" if rel else self.root
+        try:
+            st = os.stat(directory, follow_symlinks=follow_symlinks)
+        except OSError:
+            return None
+        cached = self.listings.get(rel)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_ino:
+            self.seen_dirs.add(rel)
+            return cached[2]
+        try:
+            entries = scan(directory)
+        except OSError:
+            return None
+        self.listings[rel] = (st.st_mtime_ns, st.st_ino, entries)
+        self.seen_dirs.add(rel)
+        self.dirty = True
+        return entries
+
+    def record(self, rel, location, st):
+        """Rendered record for root/rel, re-parsed only when its fingerprint changed."""
+        cached = self.skills.get(rel)
+        if (cached is not None and cached[0] == st.st_mtime_ns
+                and cached[1] == st.st_size and cached[2] == st.st_ino):
+            self.seen_skills.add(rel)
+            return cached[3]
+        path = f"{self.root}/{rel}"
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                text = f.read()
+        except OSError:
+            return None
+        line = render(skill_record(path, location, text))
+        self.skills[rel] = (st.st_mtime_ns, st.st_size, st.st_ino, line)
+        self.seen_skills.add(rel)
+        self.dirty = True
+        return line
+
+
+def _glob_names(directory):
+    """Non-hidden entry names, in the order a bash glob expands them."""
+    import locale
+    try:
+        locale.setlocale(locale.LC_COLLATE, "")
+    except locale.Error:
+        pass
+    names = [e.name for e in os.scandir(directory) if not e.name.startswith(".")]
+    return tuple(sorted(names, key=locale.strxfrm))
+
+
+def _find_entries(directory):
+    """(name, is_dir) for subdirectories and SKILL.md files, in readdir order (as find sees them)."""
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.is_dir(follow_symlinks=False):
+            entries.append((entry.name, True))
+        elif entry.name == "SKILL.md" and entry.is_file(follow_symlinks=False):
+            entries.append((entry.name, False))
+    return tuple(entries)
+
+
+def scan_glob_root(index, location):
+    """Lines for root/*/SKILL.md (project and user skills)."""
+    lines = []
+    root = index.root
+    for name in index.listing("", _glob_names, follow_symlinks=True) or ():
+        rel = f"{name}/SKILL.md"
+        try:
+            st = os.stat(f"{root}/{rel}")
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            line = index.record(rel, location, st)
+            if line is not None:
+                lines.append(line)
+    return lines
+
+
+def scan_find_root(index, location):
+    """Lines for `find root -path '*/skills/*/SKILL.md' -type f` (plugin skills)."""
+    lines = []
+    root = index.root
+    listing, record, lstat, S_ISREG = index.listing, index.record, os.lstat, stat.S_ISREG
+    # find's pattern needs something between /skills/ and /SKILL.md, so a
+    # SKILL.md directly inside a skills/ directory does not match
+    root_matches = PLUGIN_PATTERN_DIR in root
+    root_is_skills = (root + "/").endswith(PLUGIN_PATTERN_DIR)
+
+    def walk(rel, prefix):
+        matches = root_matches or bool(prefix) and (root_is_skills or PLUGIN_PATTERN_DIR in "/" + prefix[:-1])
+        for name, is_dir in listing(rel, _find_entries) or ():
+            child = prefix + name
+            if is_dir:
+                walk(child, child + "/")
+            elif matches:
+                try:
+                    st = lstat(f"{root}/{child}")
+                except OSError:
+                    continue
+                if S_ISREG(st.st_mode):
+                    line = record(child, location, st)
+                    if line is not None:
+                        lines.append(line)
+
+    # Like find, do not follow a symlinked starting point
+    if not os.path.islink(root):
+        walk("", "")
+    return lines
+
+
+def catalog_lines(project_dir=None, home=None, use_cache=True):
+    """Rendered JSON object per skill, in list-skills.sh order."""
+    use_cache = use_cache and not cache_disabled()
+    lines = []
+    for location, root in skill_roots(project_dir, home):
+        if not os.path.isdir(root):
+            continue
+        index = RootIndex(root, use_cache)
+        scan = scan_find_root if location == "plugin" else scan_glob_root
+        lines.extend(scan(index, location))
+        index.save()
+    return lines
+
+
+def load_catalog(project_dir=None, home=None, use_cache=True):
+    """Every skill's metadata as a list of dicts."""
+    import json
+    return [json.loads(line) for line in catalog_lines(project_dir, home, use_cache)]
+
+
+def format_catalog(lines):
+    """The JSON array exactly as list-skills.sh lays it out."""
+    if not lines:
+        return "[\n]\n"
+    return "[\n" + ",\n".join(f"  {line}" for line in lines) + "\n]\n"
+
+
+def main():
+    args = sys.argv[1:]
+    if "-h" in args or "--help" in args:
+        print(__doc__.strip())
+        return 0
+    if "--rebuild" in args:
+        import shutil
+        shutil.rmtree(cache_dir(), ignore_errors=True)
+    sys.stdout.write(format_catalog(catalog_lines(use_cache="--no-cache" not in args)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
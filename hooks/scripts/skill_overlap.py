@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Find overlapping skills in the catalog with MinHash signatures and LSH banding.
+
+Each skill becomes a set of features: name parts, description words and
+word pairs (minus stopwords), and allowed-tools. The MinHash value of a
+feature under permutation i is a 32-bit slice of shake_128(feature). A
+skill's signature is the element-wise minimum over its features. NumPy
+does that reduction in bulk when it is installed. Without it, the
+reduction runs in pure Python. Both paths give identical signatures.
+
+Signatures are cut into bands. Only skills that share a whole band in
+some band become candidates, so the work grows with the number of near
+pairs rather than quadratically. (bands, rows) are picked for the
+threshold. Every candidate is then checked with exact Jaccard similarity
+on the feature sets. Only pairs at or above the threshold are reported.
+
+Usage:
+    skill_overlap.py [--threshold 0.4] [--num-perm 128] [--catalog FILE] [--json]
+                     [--limit N] [--include-same-name] [--backend auto|numpy|python]
+    skill_overlap.py --bench N   # synthetic catalog of N skills with planted duplicates
+
+The catalog defaults to skill_catalog.py's index (what list-skills.sh prints);
+--catalog reads a saved list-skills.sh array instead ('-' for stdin).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import struct
+import sys
+import time
+from collections import defaultdict
+
+DEFAULT_THRESHOLD = 0.4
+DEFAULT_NUM_PERM = 128
+EMPTY = 0xFFFFFFFF
+
+STOPWORDS = frozenset("""
+    a about after all also an and any are as at be before but by can do does for from has have how i if in
+    into is it its may more must need needs no not of on or other over should so such than that the their
+    them then there these they this those through to too triggers under up use used uses using via want was
+    we what when where which while who will with without you your
+""".split())
+
+_WORD = re.compile(r"[a-z0-9]+")
+_NAME_SPLIT = re.compile(r"[-_\s./:]+")
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def skill_features(skill):
+    """Feature set of one catalog entry."""
+    features = set()
+    for part in _NAME_SPLIT.split(str(skill.get("name") or "").lower()):
+        if part:
+            features.add("n:" + part)
+    words = [w for w in _WORD.findall(str(skill.get("description") or "").lower())
+             if len(w) > 1 and w not in STOPWORDS]
+    features.update("d:" + w for w in words)
+    features.update(f"d:{a} {b}" for a, b in zip(words, words[1:]))
+    for tool in skill.get("allowed-tools") or []:
+        features.add("t:" + str(tool).split("(", 1)[0].strip().lower())
+    return frozenset(features)
+
+
+def jaccard(a, b):
+    if not a and not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MINHASH
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class MinHasher:
+    """Per-feature hash vectors (cached) and signatures built from them."""
+
+    def __init__(self, num_perm=DEFAULT_NUM_PERM, seed=b"skill-overlap"):
+        self.num_perm = num_perm
+        self.seed = seed
+        self._digests = {}
+        self._unpack = struct.Struct(f"<{num_perm}I").unpack
+
+    def digest(self, feature):
+        """num_perm little-endian uint32 hash values of a feature, as bytes."""
+        value = self._digests.get(feature)
+        if value is None:
+            value = hashlib.shake_128(self.seed + feature.encode("utf-8")).digest(4 * self.num_perm)
+            self._digests[feature] = value
+        return value
+
+    def signature(self, features):
+        """Signature tuple in pure Python (map/zip keep the inner loops in C)."""
+        if not features:
+            return (EMPTY,) * self.num_perm
+        return tuple(map(min, zip(*(self._unpack(self.digest(f)) for f in features))))
+
+    def signatures(self, feature_sets, backend="auto"):
+        """One signature per feature set: a list of tuples, or a uint32 matrix with NumPy."""
+        if backend == "auto":
+            backend = "numpy" if np is not None else "python"
+        if backend == "python":
+            return [self.signature(features) for features in feature_sets]
+        if np is None:
+            raise RuntimeError("NumPy backend requested but numpy is not installed")
+        return self._signatures_numpy(feature_sets)
+
+    def _signatures_numpy(self, feature_sets, chunk=1024):
+        ids = {}
+        rows = []
+        for features in feature_sets:
+            for feature in features:
+                if feature not in ids:
+                    ids[feature] = len(rows)
+                    rows.append(self.digest(feature))
+        table = np.frombuffer(b"".join(rows), dtype="<u4").reshape(len(rows), self.num_perm) if rows \
+            else np.empty((0, self.num_perm), dtype="<u4")
+
+        result = np.full((len(feature_sets), self.num_perm), EMPTY, dtype=np.uint32)
+        # Chunks bound the gathered (features x num_perm) matrix
+        for start in range(0, len(feature_sets), chunk):
+            block = [(i, [ids[f] for f in feature_sets[i]])
+                     for i in range(start, min(start + chunk, len(feature_sets))) if feature_sets[i]]
+            if not block:
+                continue
+            lengths = np.fromiter((len(idx) for _, idx in block), dtype=np.int64, count=len(block))
+            gathered = table[np.fromiter((j for _, idx in block for j in idx), dtype=np.int64)]
+            offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            result[[i for i, _ in block]] = np.minimum.reduceat(gathered, offsets, axis=0)
+        return result
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LSH BANDING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _integrate(f, a, b, steps=64):
+    step = (b - a) / steps
+    return sum(f(a + (k + 0.5) * step) for k in range(steps)) * step
+
+
+def optimal_bands(threshold, num_perm, false_negative_weight=0.7):
+    """(bands, rows) minimising weighted false positive/negative area around threshold.
+
+    Misses weigh more than extra candidates: every candidate is verified
+    exactly, so a false positive only costs one set intersection.
+    """
+    best, best_cost = (1, num_perm), float("inf")
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            p = lambda s: 1 - (1 - s ** rows) ** bands
+            fp = _integrate(p, 0.0, threshold)
+            fn = _integrate(lambda s: 1 - p(s), threshold, 1.0)
+            cost = (1 - false_negative_weight) * fp + false_negative_weight * fn
+            if cost < best_cost:
+                best, best_cost = (bands, rows), cost
+    return best
+
+
+def _pairs_from_groups(groups, pairs):
+    for members in groups:
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                pairs.add((members[x], members[y]))
+
+
+def lsh_candidates(signatures, bands, rows):
+    """Index pairs (i < j) whose signatures agree on every row of at least one band."""
+    pairs = set()
+    if np is not None and isinstance(signatures, np.ndarray):
+        for band in range(bands):
+            block = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+            keys = block.view(np.dtype((np.void, block.dtype.itemsize * rows))).ravel()
+            _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+            shared = np.flatnonzero(counts[inverse] > 1)
+            if not len(shared):
+                continue
+            shared = shared[np.argsort(inverse[shared], kind="stable")]
+            cuts = np.flatnonzero(np.diff(inverse[shared])) + 1
+            _pairs_from_groups((g.tolist() for g in np.split(shared, cuts)), pairs)
+        return pairs
+
+    for band in range(bands):
+        buckets = defaultdict(list)
+        lo, hi = band * rows, (band + 1) * rows
+        for i, signature in enumerate(signatures):
+            buckets[signature[lo:hi]].append(i)
+        _pairs_from_groups((m for m in buckets.values() if len(m) > 1), pairs)
+    return pairs
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# OVERLAP REPORT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def find_overlaps(skills, threshold=DEFAULT_THRESHOLD, num_perm=DEFAULT_NUM_PERM,
+                  include_same_name=False, backend="auto", timings=None):
+    """Pairs of skills with feature Jaccard >= threshold, most similar first."""
+    timings = timings if timings is not None else {}
+    started = time.perf_counter()
+    feature_sets = [skill_features(skill) for skill in skills]
+    timings["features"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    signatures = MinHasher(num_perm).signatures(feature_sets, backend)
+    timings["minhash"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    bands, rows = optimal_bands(threshold, num_perm)
+    candidates = lsh_candidates(signatures, bands, rows)
+    timings["lsh"] = time.perf_counter() - started
+    timings["candidates"] = len(candidates)
+    timings["bands"] = (bands, rows)
+
+    started = time.perf_counter()
+    overlaps = []
+    for i, j in candidates:
+        a, b = skills[i], skills[j]
+        if not include_same_name and a.get("name") == b.get("name"):
+            continue
+        similarity = jaccard(feature_sets[i], feature_sets[j])
+        if similarity >= threshold:
+            shared = sorted(f[2:] for f in feature_sets[i] & feature_sets[j] if f.startswith("d:") and " " not in f)
+            overlaps.append({
+                "similarity": round(similarity, 4),
+                "a": {"name": a.get("name"), "location": a.get("location")},
+                "b": {"name": b.get("name"), "location": b.get("location")},
+                "shared-words": shared[:12],
+                "shared-tools": sorted(f[2:] for f in feature_sets[i] & feature_sets[j] if f.startswith("t:")),
+            })
+    overlaps.sort(key=lambda o: (-o["similarity"], o["a"]["name"] or "", o["b"]["name"] or ""))
+    timings["verify"] = time.perf_counter() - started
+    return overlaps
+
+
+def load_skills(catalog=None):
+    if catalog is None:
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        from skill_catalog import load_catalog
+        return load_catalog()
+    if catalog == "-":
+        return json.load(sys.stdin)
+    with open(catalog) as f:
+        return json.load(f)
+
+
+def print_table(overlaps, total):
+    if not overlaps:
+        print(f"No overlapping skills among {total}")
+        return
+    print(f"{'SIM':>5}  {'SKILL':<32} {'OVERLAPS WITH':<32} SHARED")
+    for o in overlaps:
+        print(f"{o['similarity']:>5.2f}  {str(o['a']['name'])[:32]:<32} {str(o['b']['name'])[:32]:<32} "
+              f"{', '.join(o['shared-words'][:6])}")
+    print(f"\n{len(overlaps)} pair(s) among {total} skills")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SYNTHETIC BENCHMARK
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def synthetic_catalog(count, duplicate_share=0.05, seed=7):
+    """count skills over a Zipf-ish vocabulary; a share are edited copies of others.
+
+    Returns (skills, planted) where planted holds (original, copy) index pairs.
+    """
+    import random
+    rng = random.Random(seed)
+    vocabulary = [f"w{k}" for k in range(4000)]
+    weights = [1 / (k + 1) for k in range(len(vocabulary))]
+    tools = ["Read", "Write", "Edit", "Grep", "Glob", "Bash", "Task", "WebFetch"]
+    skills, planted = [], []
+    for i in range(count):
+        if skills and rng.random() < duplicate_share:
+            source = rng.randrange(len(skills))
+            words = skills[source]["description"].split()
+            for _ in range(rng.randint(1, 3)):
+                words[rng.randrange(len(words))] = rng.choice(vocabulary)
+            skills.append(dict(skills[source], name=f"copy-{i}", description=" ".join(words)))
+            planted.append((source, i))
+            continue
+        skills.append({
+            "name": f"{rng.choice(vocabulary)}-{rng.choice(vocabulary)}-{i}",
+            "description": " ".join(rng.choices(vocabulary, weights, k=rng.randint(15, 40))),
+            "allowed-tools": rng.sample(tools, rng.randint(1, 4)),
+            "location": f"synthetic: {i}",
+        })
+    return skills, planted
+
+
+def bench(count, threshold, num_perm, backend):
+    skills, planted = synthetic_catalog(count)
+    timings = {}
+    started = time.perf_counter()
+    overlaps = find_overlaps(skills, threshold, num_perm, backend=backend, timings=timings)
+    elapsed = time.perf_counter() - started
+
+    features = [skill_features(s) for s in skills]
+    expected = {(a, b) for a, b in planted if jaccard(features[a], features[b]) >= threshold}
+    index = {s["name"]: i for i, s in enumerate(skills)}
+    found = {tuple(sorted((index[o["a"]["name"]], index[o["b"]["name"]]))) for o in overlaps}
+    recall = len(expected & found) / len(expected) if expected else 1.0
+
+    bands, rows = timings["bands"]
+    print(f"{count} skills, threshold {threshold}, {num_perm} permutations "
+          f"({bands} bands x {rows} rows), backend {backend if backend != 'auto' else ('numpy' if np else 'python')}")
+    for phase in ("features", "minhash", "lsh", "verify"):
+        print(f"  {phase:<9} {timings[phase] * 1000:>8.1f} ms")
+    print(f"  {'total':<9} {elapsed * 1000:>8.1f} ms")
+    print(f"  candidates {timings['candidates']} (of {count * (count - 1) // 2} pairs), "
+          f"reported {len(overlaps)}, planted recall {recall:.3f} ({len(expected & found)}/{len(expected)})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find overlapping skills with MinHash LSH")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Minimum Jaccard similarity to report (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--num-perm", type=int, default=DEFAULT_NUM_PERM,
+                        help=f"MinHash permutations (default: {DEFAULT_NUM_PERM})")
+    parser.add_argument("--catalog", help="list-skills.sh JSON array to read ('-' for stdin)")
+    parser.add_argument("--json", action="store_true", help="Print pairs as JSON")
+    parser.add_argument("--limit", type=int, default=50, help="Most similar N pairs (0 for all; default: 50)")
+    parser.add_argument("--include-same-name", action="store_true",
+                        help="Also report pairs with the same name (copies, plugin versions)")
+    parser.add_argument("--backend", choices=["auto", "numpy", "python"], default="auto")
+    parser.add_argument("--bench", type=int, metavar="N", help="Time a synthetic catalog of N skills")
+    args = parser.parse_args()
+
+    if not 0 < args.threshold <= 1:
+        parser.error("--threshold must be in (0, 1]")
+    if args.backend == "numpy" and np is None:
+        parser.error("--backend numpy needs numpy installed")
+
+    if args.bench:
+        bench(args.bench, args.threshold, args.num_perm, args.backend)
+        return 0
+
+    skills = load_skills(args.catalog)
+    overlaps = find_overlaps(skills, args.threshold, args.num_perm, args.include_same_name, args.backend)
+    if args.limit:
+        overlaps = overlaps[:args.limit]
+    if args.json:
+        print(json.dumps(overlaps, indent=2))
+    else:
+        print_table(overlaps, len(skills))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
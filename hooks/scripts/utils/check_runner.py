@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+In-process runner for PostToolUse file checks.
+
+A lint chain used to be one bash script per check, each re-reading stdin,
+forking jq, and running its own grep/wc/sed passes over the written file.
+Here the payload is parsed once (payload_reader.py, so a large Write's
+content is never decoded), the file is read once, and every registered
+check runs against the same Target in this process. Each check prints
+exactly what its script used to print.
+
+Checks register themselves per chain, in the order their output appears:
+
+    from check_runner import check
+
+    @check("skill", "size", r"SKILL\\.md$")
+    def size(target):
+        return ["Skill size check: " + target.path, ...]
+
+and a chain's entry script imports its checks module and calls
+run_chain("skill"). The runner also records every written path in the
+session's change journal (see journal.sh) for the Stop audit reports.
+"""
+import os
+import re
+import sys
+import time
+
+# payload_reader ships with the skill tools
+SKILL_TOOLS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "skill-tools")
+if SKILL_TOOLS not in sys.path:
+    sys.path.insert(0, SKILL_TOOLS)
+
+import payload_reader
+
+
+class Check:
+    """A named check for the files whose path matches pattern (searched, like bash `=~`)."""
+    __slots__ = ("name", "pattern", "run")
+
+    def __init__(self, name, pattern, run):
+        self.name = name
+        self.pattern = pattern
+        self.run = run  # run(target) -> list of output lines, or None
+
+
+CHECKS = {}  # chain -> [Check], in registration order
+
+
+def check(chain: str, name: str, pattern: str):
+    """Decorator registering a check for files whose path matches pattern."""
+    def register(func):
+        CHECKS.setdefault(chain, []).append(Check(name, re.compile(pattern), func))
+        return func
+    return register
+
+
+class Target:
+    """The written file, read once and shared by every check."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._data = None
+        self._lines = None
+
+    @property
+    def data(self) -> bytes:
+        if self._data is None:
+            with open(self.path, "rb") as f:
+                self._data = f.read()
+        return self._data
+
+    @property
+    def lines(self) -> list:
+        """Lines as grep sees them (no terminators, no empty line after the last newline)."""
+        if self._lines is None:
+            self._lines = self.data.split(b"\n")
+            if self._lines[-1] == b"":
+                self._lines.pop()
+        return self._lines
+
+    def grep(self, regex):
+        """First line regex matches, or None."""
+        for line in self.lines:
+            if regex.search(line):
+                return line
+        return None
+
+    def count(self, regex) -> int:
+        """Number of lines regex matches (`grep -c`)."""
+        return sum(1 for line in self.lines if regex.search(line))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# JOURNAL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def journal_file(session_id: str, cwd: str = ""):
+    """Same location as journal.sh's journal_file; None when no project directory is known."""
+    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", session_id) or "unknown"
+    project = os.environ.get("CLAUDE_PROJECT_DIR") or cwd
+    if not project:
+        return None
+    return os.path.join(project, ".claude", "hooks", ".cache", "journal", f"{safe}.list")
+
+
+def journal_record(session_id: str, file_path: str, cwd: str = ""):
+    """Append a written path to the session journal, as journal.sh's journal_record does."""
+    if not session_id or not file_path:
+        return
+    journal = journal_file(session_id, cwd)
+    if journal is None:
+        return
+    try:
+        if not os.path.exists(journal):
+            directory = os.path.dirname(journal)
+            os.makedirs(directory, exist_ok=True)
+            # First write of a session: drop journals of long-finished sessions
+            # (find -mtime +N: more than N whole days old)
+            keep_days = int(os.environ.get("JOURNAL_KEEP_DAYS") or 7)
+            cutoff = time.time() - (keep_days + 1) * 86400
+            for entry in os.scandir(directory):
+                if entry.name.endswith(".list") and entry.stat().st_mtime <= cutoff:
+                    os.unlink(entry.path)
+        fd = os.open(journal, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, os.fsencode(file_path) + b"\n")
+        finally:
+            os.close(fd)
+    except (OSError, ValueError):
+        pass
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RUNNER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def read_fields(source):
+    """(event, session_id, cwd, file_path) from a payload; empty strings when absent or malformed."""
+    payload = payload_reader.read_payload(source)
+    fields = []
+    for names in (("hook_event_name",), ("session_id",), ("cwd",), ("tool_input.file_path", "tool_input.filePath")):
+        value = None
+        try:
+            for name in names:
+                value = payload.get(name)
+                if value is not None:
+                    break
+        except payload_reader.PayloadError:
+            pass
+        fields.append(value if isinstance(value, str) else "")
+    return tuple(fields)
+
+
+def run_checks(chain: str, path: str, out=None) -> int:
+    """Run the chain's checks matching path; returns how many produced output."""
+    out = out or sys.stdout
+    selected = [c for c in CHECKS.get(chain, []) if c.pattern.search(path)]
+    if not selected or not os.path.isfile(path):
+        return 0
+    target = Target(path)
+    reported = 0
+    for item in selected:
+        try:
+            lines = item.run(target)
+        except Exception as e:
+            # One broken check must not silence the others
+            print(f"⚠️  {chain} check '{item.name}' failed: {e}", file=sys.stderr)
+            continue
+        if lines:
+            out.write("".join(f"{line}\n" for line in lines))
+            reported += 1
+    return reported
+
+
+def run_chain(chain: str, source=None) -> int:
+    """PostToolUse entry point: journal the write, then run the chain's checks (always exit 0)."""
+    event, session_id, cwd, path = read_fields(source or sys.stdin.buffer)
+    if event in ("", "PostToolUse"):
+        journal_record(session_id, path, cwd)
+    if path:
+        run_checks(chain, path)
+    return 0
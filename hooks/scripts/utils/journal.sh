@@ -0,0 +1,71 @@
+#!/bin/bash
+# Per-session change journal: the files a session has written
+# Source this file: source "${CLAUDE_PLUGIN_ROOT}/hooks/scripts/utils/journal.sh"
+#
+# PostToolUse hooks append each written path with journal_record (fields read
+# with payload.sh's payload_fields, or check_runner.py in Python);
+# Stop hooks read them back with journal_files instead of walking the tree.
+# An audit then costs one read of a file listing what changed, sees only this
+# session's writes, and works however long the session ran.
+#
+# Journal location: $CLAUDE_PROJECT_DIR/.claude/hooks/.cache/journal/<session_id>.list,
+# or under the payload's cwd when CLAUDE_PROJECT_DIR is unset. With neither
+# there is no journal, rather than one in whatever directory the hook ran from.
+# One path per line, appended with a single O_APPEND write; repeats are
+# collapsed on read. Journals untouched for JOURNAL_KEEP_DAYS (default 7) are
+# removed when a new session starts its journal.
+
+# Path of a session's journal (session id reduced to safe filename characters);
+# fails when no project directory is known
+# Usage: journal_file <session_id> [cwd]
+journal_file() {
+    local session_id="${1//[^A-Za-z0-9_.-]/_}"
+    local project_dir="${CLAUDE_PROJECT_DIR:-${2:-}}"
+    [[ -n "$project_dir" ]] || return 1
+    printf '%s\n' "$project_dir/.claude/hooks/.cache/journal/${session_id:-unknown}.list"
+}
+
+# Append a written path to a session's journal
+# Usage: journal_record <session_id> <file_path> [cwd]
+journal_record() {
+    local session_id="$1"
+    local file_path="$2"
+    [[ -z "$session_id" || -z "$file_path" ]] && return 0
+
+    local journal
+    journal=$(journal_file "$session_id" "${3:-}") || return 0
+    if [[ ! -e "$journal" ]]; then
+        local dir="${journal%/*}"
+        mkdir -p "$dir" 2>/dev/null || return 0
+        # First write of a session: drop journals of long-finished sessions
+        find "$dir" -name '*.list' -mtime "+${JOURNAL_KEEP_DAYS:-7}" -delete 2>/dev/null || true
+    fi
+    printf '%s\n' "$file_path" >> "$journal" 2>/dev/null || true
+}
+
+# Session id of a hook payload (empty when absent)
+# Usage: SESSION_ID=$(journal_session_id "$INPUT")
+journal_session_id() {
+    printf '%s' "$1" | jq -r '.session_id // empty' 2>/dev/null || true
+}
+
+# Working directory of a hook payload (empty when absent), for journal_files
+# Usage: CWD=$(journal_cwd "$INPUT")
+journal_cwd() {
+    printf '%s' "$1" | jq -r '.cwd // empty' 2>/dev/null || true
+}
+
+# Files a session wrote that still exist, first write first, each once
+# Usage: journal_files <session_id> [extended-regex] [cwd]
+journal_files() {
+    local journal
+    journal=$(journal_file "$1" "${3:-}") || return 0
+    [[ -f "$journal" ]] || return 0
+
+    local path
+    while IFS= read -r path; do
+        if [[ -f "$path" ]]; then
+            printf '%s\n' "$path"
+        fi
+    done < <(awk -v pattern="${2:-}" '!seen[$0]++ && (pattern == "" || $0 ~ pattern)' "$journal")
+}
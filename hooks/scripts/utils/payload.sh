@@ -0,0 +1,39 @@
+#!/bin/bash
+# Read selected fields of a hook payload without loading all of it
+# Source this file: source "${CLAUDE_PLUGIN_ROOT}/hooks/scripts/utils/payload.sh"
+#
+# `INPUT=$(cat)` followed by `echo "$INPUT" | jq ...` copies the whole
+# payload through bash and re-parses it for every field. For a Write of a
+# large file that is the file's full content, every time. payload_fields
+# parses stdin once with `jq --stream` and stops reading as soon as every
+# requested field has been seen, so the content is skipped whenever it comes
+# after them (as it does in Claude Code's tool_input).
+
+# Print each dotted field of the payload on stdin, one line each ('' if absent)
+# A field may list alternatives, `a|b`: the first of them seen is printed.
+# Other scalars are printed as JSON; objects and arrays count as absent. A
+# repeated key keeps its first value.
+# Usage: { IFS= read -r SESSION_ID; IFS= read -r FILE_PATH; } \
+#            < <(payload_fields session_id 'tool_input.file_path|tool_input.filePath')
+payload_fields() {
+    local want="" field alternatives path
+    local -a paths
+    for field in "$@"; do
+        alternatives=""
+        IFS='|' read -ra paths <<< "$field"
+        for path in "${paths[@]}"; do
+            alternatives="${alternatives:+$alternatives,}[\"${path//./\",\"}\"]"
+        done
+        want="${want:+$want,}[$alternatives]"
+    done
+
+    jq -n --stream -r --argjson want "[$want]" '
+        (last(label $out | foreach (inputs | select(length == 2)) as [$path, $value] ({};
+            reduce range($want | length) as $i (.;
+                if (has($i | tostring) | not) and ($value | type | . != "array" and . != "object")
+                    and any($want[$i][]; . == $path)
+                then .[$i | tostring] = $value else . end);
+            ., (if length == ($want | length) then break $out else empty end))) // {}) as $found
+        | range($want | length) | tostring as $i
+        | if $found | has($i) then $found[$i] | if type == "string" then . else tojson end else "" end' 2>/dev/null
+}
@@ -2,6 +2,8 @@
 # Shared syntax checking helpers for hook scripts
 # Source this file: source "${CLAUDE_PLUGIN_ROOT}/hooks/scripts/utils/syntax-check.sh"
 
+_SYNTAX_CHECK_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
 # Check syntax of a script file based on extension
 # Returns 0 if valid, 1 if invalid
 # Usage: check_syntax "/path/to/script.sh"
@@ -47,3 +49,40 @@ get_syntax_error() {
             ;;
     esac
 }
+
+# Check one file and capture its error text from the same run
+# (get_syntax_error after check_syntax compiles a failing file twice)
+# Returns 0 if valid, 1 if invalid; prints the error text when invalid
+# Usage: if ! err=$(check_syntax_with_error "/path/to/script.sh"); then echo "$err"; fi
+check_syntax_with_error() {
+    local file="$1"
+    local ext="${file##*.}"
+    local output
+
+    case "$ext" in
+        sh|bash)
+            output=$(bash -n "$file" 2>&1) && return 0
+            ;;
+        py)
+            output=$(python3 -c 'import sys; compile(open(sys.argv[1], "rb").read(), sys.argv[1], "exec")' "$file" 2>&1) && return 0
+            ;;
+        cjs|js)
+            output=$(node --check "$file" 2>&1) && return 0
+            ;;
+        *)
+            return 0
+            ;;
+    esac
+    printf '%s\n' "$output"
+    return 1
+}
+
+# Check many files in one pass: Python files compile in a single process,
+# bash -n runs in parallel, JS files share one node process, and verdicts are
+# cached by content hash (see syntax_check.py). Directories are searched.
+# Prints {"ok": bool, "results": [{"file", "language", "ok", "error", "cached"}]}
+# Returns 0 if every file is valid, 1 otherwise
+# Usage: check_syntax_batch file_or_dir...
+check_syntax_batch() {
+    python3 "$_SYNTAX_CHECK_DIR/syntax_check.py" --json "$@"
+}
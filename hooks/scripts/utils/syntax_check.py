@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Batch syntax checker for hook scripts, with verdicts cached by content hash.
+
+One run checks any number of files:
+    .py          compile() in this process (no py_compile subprocess, no .pyc)
+    .sh, .bash   `bash -n`, run in parallel
+    .js, .cjs    one node process parsing every file with vm.Script
+Each file yields a single result holding its verdict and error text, so a
+failing file is never compiled a second time just to get the message. A
+node failure is confirmed with `node --check`, so ESM and other edge cases
+keep node's own verdict.
+
+Verdicts are cached by (language, interpreter, path, content sha256) in
+${XDG_CACHE_HOME:-~/.cache}/claude-development/syntax-cache.json.
+
+Usage:
+    syntax_check.py [--json] [--no-cache] [--jobs N] FILE_OR_DIR...
+
+Directories are searched recursively for checkable files. Exit status is 0
+when every file is valid, 1 otherwise.
+
+Environment:
+    SYNTAX_CHECK_CACHE     Cache file path override
+    SYNTAX_CHECK_NO_CACHE  Set to 1 to bypass the cache
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+LANGUAGES = {".py": "python", ".sh": "bash", ".bash": "bash", ".js": "node", ".cjs": "node"}
+CACHE_VERSION = 1
+MAX_CACHE_ENTRIES = 4096
+
+# Parses each file as CommonJS (wrapped like require() does) and reports per file
+NODE_BATCH = r"""
+const fs = require('fs'), vm = require('vm'), { wrap } = require('module');
+const results = [];
+for (const file of process.argv.slice(1)) {
+  try {
+    let source = fs.readFileSync(file, 'utf8');
+    if (source.startsWith('#!')) source = '//' + source.slice(2);
+    new vm.Script(wrap(source), { filename: file });
+    results.push([file, true, '']);
+  } catch (e) {
+    const lines = String(e.stack || e).split('\n');
+    const end = lines.findIndex((line) => /^\s+at /.test(line));
+    results.push([file, false, lines.slice(0, end === -1 ? undefined : end).join('\n').trim()]);
+  }
+}
+process.stdout.write(JSON.stringify(results));
+"""
+
+
+def default_cache_path():
+    override = os.environ.get("SYNTAX_CHECK_CACHE")
+    if override:
+        return override
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "claude-development", "syntax-cache.json")
+
+
+def cache_disabled():
+    return os.environ.get("SYNTAX_CHECK_NO_CACHE", "") not in ("", "0")
+
+
+def language_of(path):
+    return LANGUAGES.get(os.path.splitext(path)[1])
+
+
+def expand(paths):
+    """Checkable files under the given files and directories, in order, without duplicates."""
+    files, seen = [], set()
+    for path in paths:
+        if os.path.isdir(path):
+            found = []
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames[:] = sorted(d for d in dirnames if d not in ("__pycache__", "node_modules", ".git"))
+                found.extend(os.path.join(dirpath, f) for f in filenames if language_of(f))
+            candidates = sorted(found)
+        else:
+            candidates = [path]
+        for candidate in candidates:
+            if candidate not in seen:
+                seen.add(candidate)
+                files.append(candidate)
+    return files
+
+
+def interpreter_id(language):
+    """Identifies the interpreter whose verdict is cached, so upgrades invalidate entries."""
+    if language == "python":
+        return sys.version
+    binary = shutil.which(language)
+    if binary is None:
+        return None
+    st = os.stat(binary)
+    return f"{os.path.realpath(binary)}:{st.st_size}:{st.st_mtime_ns}"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CHECKERS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def check_python(path, source):
+    try:
+        compile(source, path, "exec", dont_inherit=True)
+    except (SyntaxError, ValueError) as e:
+        import traceback
+        return False, "".join(traceback.format_exception_only(type(e), e)).rstrip()
+    return True, ""
+
+
+def check_bash(paths, jobs):
+    """{path: (ok, error)} running `bash -n` on up to `jobs` files at a time."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def run(path):
+        proc = subprocess.run(["bash", "-n", path], stdout=subprocess.DEVNULL,
+                              stderr=subprocess.PIPE, text=True, errors="replace")
+        return path, (proc.returncode == 0, proc.stderr.rstrip())
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return dict(pool.map(run, paths))
+
+
+def check_node(paths):
+    """{path: (ok, error)} from one node process; failures re-checked with `node --check`."""
+    proc = subprocess.run(["node", "-e", NODE_BATCH, "--", *paths],
+                          capture_output=True, text=True, errors="replace")
+    try:
+        verdicts = {path: (ok, error) for path, ok, error in json.loads(proc.stdout)}
+    except ValueError:
+        verdicts = {}
+    for path in paths:
+        if verdicts.get(path, (False,))[0]:
+            continue
+        # vm.Script only knows CommonJS; node itself is the authority on the rest
+        check = subprocess.run(["node", "--check", path], stdout=subprocess.DEVNULL,
+                               stderr=subprocess.PIPE, text=True, errors="replace")
+        verdicts[path] = (check.returncode == 0, _without_stack(check.stderr))
+    return verdicts
+
+
+def _without_stack(stderr):
+    """node's error text up to the stack trace."""
+    lines = stderr.rstrip().split("\n")
+    for i, line in enumerate(lines):
+        if line.startswith("    at "):
+            lines = lines[:i]
+            break
+    return "\n".join(lines).strip()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CACHE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class VerdictCache:
+    """LRU map of content key -> [ok, error], written atomically when changed."""
+
+    def __init__(self, path=None, enabled=True):
+        self.path = path or default_cache_path()
+        self.enabled = enabled
+        self.entries = {}
+        self.dirty = False
+        if enabled:
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+                if data.get("version") == CACHE_VERSION:
+                    self.entries = data.get("entries", {})
+            except (OSError, ValueError, AttributeError):
+                pass
+
+    def get(self, key):
+        if not self.enabled or key not in self.entries:
+            return None
+        value = self.entries.pop(key)
+        self.entries[key] = value
+        return value
+
+    def put(self, key, ok, error):
+        if self.enabled:
+            self.entries.pop(key, None)
+            self.entries[key] = [ok, error]
+            self.dirty = True
+
+    def save(self):
+        if not (self.enabled and self.dirty):
+            return
+        entries = dict(list(self.entries.items())[-MAX_CACHE_ENTRIES:])
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump({"version": CACHE_VERSION, "entries": entries}, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BATCH
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def check_files(paths, use_cache=True, jobs=None):
+    """One result dict per file: file, language, ok, error, cached."""
+    cache = VerdictCache(enabled=use_cache and not cache_disabled())
+    jobs = jobs or min(8, os.cpu_count() or 1)
+    interpreters = {}
+    results, pending = [], {"bash": [], "node": []}
+
+    for path in paths:
+        result = {"file": path, "language": language_of(path), "ok": True, "error": "", "cached": False}
+        results.append(result)
+        if result["language"] is None:
+            continue
+        try:
+            with open(path, "rb") as f:
+                source = f.read()
+        except OSError as e:
+            result.update(ok=False, error=f"Cannot read {path}: {e.strerror}")
+            continue
+
+        language = result["language"]
+        if language not in interpreters:
+            interpreters[language] = interpreter_id(language)
+        if interpreters[language] is None:
+            result.update(ok=False, error=f"{language} not found; cannot check {path}")
+            continue
+
+        digest = hashlib.sha256(source).hexdigest()
+        key = hashlib.sha256(f"{language}\0{interpreters[language]}\0{path}\0{digest}".encode(
+            "utf-8", "surrogateescape")).hexdigest()
+        result["key"] = key
+        cached = cache.get(key)
+        if cached is not None:
+            result.update(ok=cached[0], error=cached[1], cached=True)
+        elif language == "python":
+            ok, error = check_python(path, source)
+            result.update(ok=ok, error=error)
+            cache.put(key, ok, error)
+        else:
+            pending[language].append(result)
+
+    batches = [("bash", lambda paths: check_bash(paths, jobs)), ("node", check_node)]
+    for language, checker in batches:
+        if pending[language]:
+            verdicts = checker([r["file"] for r in pending[language]])
+            for result in pending[language]:
+                ok, error = verdicts[result["file"]]
+                result.update(ok=ok, error=error)
+                cache.put(result["key"], ok, error)
+
+    for result in results:
+        result.pop("key", None)
+    cache.save()
+    return results
+
+
+def main():
+    args = sys.argv[1:]
+    as_json = "--json" in args
+    use_cache = "--no-cache" not in args
+    jobs = None
+    if "--jobs" in args:
+        i = args.index("--jobs")
+        try:
+            jobs = int(args[i + 1])
+        except (IndexError, ValueError):
+            print("❌ Error: --jobs expects a number", file=sys.stderr)
+            return 2
+        del args[i:i + 2]
+    paths = [a for a in args if a not in ("--json", "--no-cache")]
+    if not paths:
+        print("Usage: syntax_check.py [--json] [--no-cache] [--jobs N] FILE_OR_DIR...", file=sys.stderr)
+        return 2
+
+    results = check_files(expand(paths), use_cache=use_cache, jobs=jobs)
+    ok = all(r["ok"] for r in results)
+    if as_json:
+        print(json.dumps({"ok": ok, "results": results}))
+    else:
+        for r in results:
+            print(f"{'✅' if r['ok'] else '❌'} {r['file']}")
+            if r["error"]:
+                print("   " + r["error"].replace("\n", "\n   "))
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Content-addressed incremental sync of the plugin into the Claude plugins cache.
+
+The cache directory holds a manifest (.sync-manifest.json) of what was last
+synced. For each file it records the sha256, size, mode and mtime, and for
+each symlink its target. A tree hash covers the whole manifest. A sync:
+    - skips files whose size and mtime match the manifest (no read);
+    - hashes the rest and copies only content that changed, via a temp
+      file and rename, so the cache never holds a half-written file;
+    - deletes whatever the source no longer has (like rsync --delete);
+    - writes the manifest last, then updates installed_plugins.json
+      with a JSON load/modify/dump and an atomic replace.
+
+--check stats every source file once against the manifest. Files whose
+stat changed are hashed to tell real edits from touches. This catches
+uncommitted edits that the git HEAD comparison cannot see.
+
+Usage:
+    sync_plugin.py --source DIR --cache-dir DIR --name NAME --marketplace NAME
+                   --version VERSION [--installed-json FILE] [--check] [--quiet]
+
+Normally run through scripts/sync-plugin.sh, which supplies the arguments.
+"""
+
+import argparse
+import datetime
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+import stat
+import subprocess
+import sys
+
+MANIFEST_NAME = ".sync-manifest.json"
+MANIFEST_FORMAT = 1
+
+# Same exclusions the rsync call used
+EXCLUDE = [".DS_Store", "*.pyc", "__pycache__", ".git"]
+
+GREEN = "\033[0;32m"
+YELLOW = "\033[1;33m"
+BLUE = "\033[0;34m"
+NC = "\033[0m"
+
+
+def excluded(name):
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in EXCLUDE)
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scan_source(source):
+    """{relpath: lstat result} for every file and symlink, plus the set of directories."""
+    entries, dirs = {}, set()
+    for dirpath, dirnames, filenames in os.walk(source):
+        rel_dir = os.path.relpath(dirpath, source)
+        prefix = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+        kept = []
+        for d in sorted(dirnames):
+            if excluded(d):
+                continue
+            full = os.path.join(dirpath, d)
+            if os.path.islink(full):
+                # os.walk lists symlinked dirs as dirs; rsync -a copies them as links
+                entries[prefix + d] = os.lstat(full)
+            else:
+                kept.append(d)
+                dirs.add(prefix + d)
+        dirnames[:] = kept
+        for name in filenames:
+            if not excluded(name):
+                entries[prefix + name] = os.lstat(os.path.join(dirpath, name))
+    return entries, dirs
+
+
+def tree_hash(files):
+    digest = hashlib.sha256()
+    for rel in sorted(files):
+        entry = files[rel]
+        identity = entry.get("link") or entry["sha256"]
+        digest.update(f"{rel}\0{entry.get('mode', 0):o}\0{identity}\n".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+def load_manifest(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, MANIFEST_NAME)) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("format") != MANIFEST_FORMAT:
+        return None
+    return data
+
+
+def atomic_write_json(path, data, indent=None):
+    tmp = f"{path}.tmp-{os.getpid()}"
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=indent)
+        if indent:
+            f.write("\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def stat_matches(entry, st):
+    return (entry is not None and "sha256" in entry and entry["size"] == st.st_size
+            and entry["mtime_ns"] == st.st_mtime_ns and entry["mode"] == stat.S_IMODE(st.st_mode))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CHECK
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def diff_source(source, manifest):
+    """(changed, added, removed) relpaths between the source tree and the manifest."""
+    files = (manifest or {}).get("files", {})
+    entries, _ = scan_source(source)
+    changed, added = [], []
+    for rel, st in sorted(entries.items()):
+        entry = files.get(rel)
+        if entry is None:
+            added.append(rel)
+        elif stat.S_ISLNK(st.st_mode):
+            if entry.get("link") != os.readlink(os.path.join(source, rel)):
+                changed.append(rel)
+        elif not stat_matches(entry, st):
+            # Stat differs: only a content or mode change counts, not a touch
+            if (entry.get("sha256") != file_sha256(os.path.join(source, rel))
+                    or entry.get("mode") != stat.S_IMODE(st.st_mode)):
+                changed.append(rel)
+    removed = sorted(set(files) - set(entries))
+    return changed, added, removed
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SYNC
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _copy_file(src, dst, st):
+    tmp = os.path.join(os.path.dirname(dst), f".{os.path.basename(dst)}.tmp-{os.getpid()}")
+    try:
+        shutil.copyfile(src, tmp)
+        os.chmod(tmp, stat.S_IMODE(st.st_mode))
+        os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+        if os.path.isdir(dst) and not os.path.islink(dst):
+            shutil.rmtree(dst)
+        os.replace(tmp, dst)
+    finally:
+        if os.path.lexists(tmp):
+            os.unlink(tmp)
+
+
+def _copy_link(target, dst):
+    tmp = os.path.join(os.path.dirname(dst), f".{os.path.basename(dst)}.tmp-{os.getpid()}")
+    os.symlink(target, tmp)
+    if os.path.isdir(dst) and not os.path.islink(dst):
+        shutil.rmtree(dst)
+    os.replace(tmp, dst)
+
+
+def sync_tree(source, cache_dir, log=print):
+    """Bring cache_dir in line with source; returns (manifest, copied, deleted, unchanged)."""
+    os.makedirs(cache_dir, exist_ok=True)
+    old = (load_manifest(cache_dir) or {}).get("files", {})
+    entries, dirs = scan_source(source)
+    files, copied, unchanged = {}, [], 0
+
+    for rel in sorted(dirs):
+        dst = os.path.join(cache_dir, rel)
+        if os.path.lexists(dst) and (os.path.islink(dst) or not os.path.isdir(dst)):
+            os.unlink(dst)
+        os.makedirs(dst, exist_ok=True)
+
+    for rel, st in sorted(entries.items()):
+        src = os.path.join(source, rel)
+        dst = os.path.join(cache_dir, rel)
+        entry = old.get(rel)
+
+        if stat.S_ISLNK(st.st_mode):
+            target = os.readlink(src)
+            files[rel] = {"link": target}
+            if not (entry and entry.get("link") == target and os.path.islink(dst)
+                    and os.readlink(dst) == target):
+                _copy_link(target, dst)
+                copied.append(rel)
+            else:
+                unchanged += 1
+            continue
+
+        try:
+            dst_st = os.lstat(dst)
+        except FileNotFoundError:
+            dst_st = None
+        # The cache copy carries the source mtime, so stat alone vouches for it too
+        dst_ok = dst_st is not None and stat_matches(entry, dst_st)
+
+        if dst_ok and stat_matches(entry, st):
+            files[rel] = entry
+            unchanged += 1
+            continue
+
+        digest = file_sha256(src)
+        record = {"sha256": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                  "mode": stat.S_IMODE(st.st_mode)}
+        if dst_ok and entry["sha256"] == digest and entry["mode"] == record["mode"]:
+            # Touched, not edited: refresh the cache copy's mtime only
+            os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+            unchanged += 1
+        else:
+            _copy_file(src, dst, st)
+            copied.append(rel)
+        files[rel] = record
+
+    # Anything the source no longer has goes, like rsync --delete (which
+    # also leaves excluded names alone on the receiving side)
+    deleted = []
+    for dirpath, dirnames, filenames in os.walk(cache_dir, topdown=False):
+        rel_dir = os.path.relpath(dirpath, cache_dir)
+        if rel_dir != "." and any(excluded(part) for part in rel_dir.split(os.sep)):
+            continue
+        prefix = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+        dirnames = [d for d in dirnames if not excluded(d)]
+        filenames = [f for f in filenames if not excluded(f)]
+        for name in filenames + [d for d in dirnames if os.path.islink(os.path.join(dirpath, d))]:
+            rel = prefix + name
+            if rel not in files and rel != MANIFEST_NAME:
+                os.unlink(os.path.join(dirpath, name))
+                deleted.append(rel)
+        for name in dirnames:
+            rel = prefix + name
+            full = os.path.join(dirpath, name)
+            if rel not in dirs and rel not in files and not os.path.islink(full):
+                shutil.rmtree(full, ignore_errors=True)
+                deleted.append(rel + "/")
+
+    manifest = {"format": MANIFEST_FORMAT, "source": os.path.abspath(source),
+                "tree": tree_hash(files), "files": files}
+    atomic_write_json(os.path.join(cache_dir, MANIFEST_NAME), manifest)
+
+    if log:
+        for rel in copied:
+            log(f"    updated: {rel}")
+        for rel in sorted(deleted):
+            log(f"    deleted: {rel}")
+    return manifest, copied, deleted, unchanged
+
+
+def git_commit_sha(repo):
+    try:
+        result = subprocess.run(["git", "-C", repo, "rev-parse", "HEAD"],
+                                capture_output=True, text=True, check=True)
+        return result.stdout.strip() or "unknown"
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def update_installed(installed_json, key, cache_dir, version, commit_sha, timestamp):
+    """Rewrite this plugin's entry in installed_plugins.json, keeping installedAt."""
+    with open(installed_json) as f:
+        data = json.load(f)
+    plugins = data.setdefault("plugins", {})
+    previous = plugins.get(key) or [{}]
+    plugins[key] = [{
+        "scope": "user",
+        "installPath": cache_dir,
+        "version": version,
+        "installedAt": previous[0].get("installedAt", timestamp),
+        "lastUpdated": timestamp,
+        "gitCommitSha": commit_sha,
+    }]
+    atomic_write_json(installed_json, data, indent=2)
+
+
+def cached_commit_sha(installed_json, key):
+    try:
+        with open(installed_json) as f:
+            entries = json.load(f).get("plugins", {}).get(key) or [{}]
+    except (OSError, ValueError, AttributeError):
+        return ""
+    return entries[0].get("gitCommitSha", "")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incrementally sync the plugin into the Claude plugins cache")
+    parser.add_argument("--source", required=True, help="Directory to sync")
+    parser.add_argument("--cache-dir", required=True, help="Destination in ~/.claude/plugins/cache")
+    parser.add_argument("--name", required=True, help="Plugin name")
+    parser.add_argument("--marketplace", required=True, help="Marketplace name")
+    parser.add_argument("--version", required=True, help="Plugin version")
+    parser.add_argument("--installed-json", default=os.path.expanduser("~/.claude/plugins/installed_plugins.json"))
+    parser.add_argument("--repo", help="Git checkout for the commit SHA (default: parent of --source)")
+    parser.add_argument("--check", action="store_true", help="Report whether a sync is needed (exit 1 if so)")
+    parser.add_argument("--quiet", action="store_true", help="Do not list copied and deleted files")
+    args = parser.parse_args()
+
+    key = f"{args.name}@{args.marketplace}"
+    repo = args.repo or os.path.dirname(os.path.abspath(args.source))
+    current = git_commit_sha(repo)
+
+    if args.check:
+        cached = cached_commit_sha(args.installed_json, key)
+        manifest = load_manifest(args.cache_dir)
+        print(f"{BLUE}Plugin:{NC} {key}")
+        print(f"{BLUE}Current commit:{NC} {current[:7]}")
+        print(f"{BLUE}Cached commit:{NC}  {cached[:7]}")
+        if manifest is None:
+            print(f"{YELLOW}⚠ No sync manifest in {args.cache_dir} (run: npm run sync){NC}")
+            return 1
+        changed, added, removed = diff_source(args.source, manifest)
+        for label, paths in (("modified", changed), ("added", added), ("removed", removed)):
+            for rel in paths:
+                print(f"    {label}: {rel}")
+        if changed or added or removed:
+            print(f"{YELLOW}⚠ Plugin needs sync: {len(changed)} modified, {len(added)} added, "
+                  f"{len(removed)} removed (run: npm run sync){NC}")
+            return 1
+        if current != cached:
+            print(f"{YELLOW}⚠ Plugin needs sync (run: npm run sync){NC}")
+            return 1
+        print(f"{GREEN}✓ Plugin is up to date{NC}")
+        return 0
+
+    print(f"{BLUE}Syncing {args.name} to global plugins...{NC}")
+    print("  Copying plugin files...")
+    manifest, copied, deleted, unchanged = sync_tree(args.source, args.cache_dir,
+                                                     log=None if args.quiet else print)
+    print(f"  {len(copied)} updated, {len(deleted)} deleted, {unchanged} unchanged (tree {manifest['tree'][:12]})")
+
+    timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    if os.path.isfile(args.installed_json):
+        print("  Updating installed_plugins.json...")
+        update_installed(args.installed_json, key, args.cache_dir, args.version, current, timestamp)
+
+    print(f"{GREEN}✓ Synced to {args.cache_dir}{NC}")
+    print(f"{GREEN}✓ Updated installed_plugins.json (commit: {current[:7]}){NC}")
+    print()
+    print(f"{YELLOW}Note: Restart Claude Code to load changes{NC}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
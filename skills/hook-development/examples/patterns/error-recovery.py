@@ -3,16 +3,25 @@
 Error Recovery Patterns for Hooks
 
 Patterns included:
-1. Retry with exponential backoff
-2. Circuit breaker
+1. Retry with exponential backoff (sync, and async with deadline/hedging)
+2. Circuit breaker (shared mmap registry, safe across concurrent hooks)
 3. Graceful degradation
 
 Use these patterns for hooks that call external services or have failure modes.
+
+Run `error-recovery.py --self-test` to exercise the retry patterns against a
+local stub service that injects latency and failures.
 """
 import sys
 import json
 import time
 import os
+import asyncio
+import random
+import fcntl
+import mmap
+import struct
+from contextlib import contextmanager
 from pathlib import Path
 
 
@@ -20,32 +29,257 @@ from pathlib import Path
 # PATTERN 1: RETRY WITH EXPONENTIAL BACKOFF
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def call_with_retry(func, *args, max_retries=3, **kwargs):
+def decorrelated_jitter(previous, base, cap):
+    """Next backoff delay: uniform between base and 3x the previous delay, capped."""
+    return min(cap, random.uniform(base, max(base, previous * 3)))
+
+
+def call_with_retry(func, *args, max_retries=3, deadline=None, base=0.05, cap=1.0, **kwargs):
     """
-    Call function with exponential backoff retry.
+    Call function with jittered exponential backoff retry.
 
     Usage:
-        result = call_with_retry(external_api.validate, data)
+        result = call_with_retry(external_api.validate, data, deadline=4.0)
 
-    Retries: 1s, 2s, 4s (exponential backoff)
+    Delays use decorrelated jitter between base and cap seconds. With a
+    deadline (seconds, measured from the first call), no sleep or retry is
+    started that would overrun it, so the hook stays inside its timeout.
+    For async clients use retry_async, which can also cancel a slow attempt.
     """
+    started = time.monotonic()
+    delay = base
+    error = 'Max retries exceeded'
+
     for attempt in range(max_retries):
         try:
             return {'success': True, 'result': func(*args, **kwargs)}
         except Exception as e:
-            if attempt == max_retries - 1:
-                return {'success': False, 'error': str(e)}
+            error = str(e)
+
+        if attempt == max_retries - 1:
+            break
+
+        delay = decorrelated_jitter(delay, base, cap)
+        if deadline is not None and time.monotonic() - started + delay >= deadline:
+            error = f'Deadline exceeded after {attempt + 1} attempts: {error}'
+            break
+        time.sleep(delay)
 
-            # Exponential backoff: 2^attempt seconds
-            time.sleep(2 ** attempt)
+    return {'success': False, 'error': error}
 
-    return {'success': False, 'error': 'Max retries exceeded'}
+
+async def retry_async(func, *args, deadline=0.1, attempt_timeout=None, max_attempts=5,
+                      base=0.005, cap=0.05, hedge_after=None, retry_on=(Exception,), **kwargs):
+    """
+    Retry an async call within an overall deadline.
+
+    Usage:
+        result = await retry_async(client.validate, data, deadline=0.08, hedge_after=0.02)
+
+    - deadline: seconds for all attempts and sleeps together; attempts still
+      in flight when it runs out are cancelled
+    - attempt_timeout: per-attempt limit (default: whatever budget remains)
+    - max_attempts: calls started in total, hedges included
+    - base/cap: decorrelated jitter bounds for the sleep between rounds
+    - hedge_after: if an attempt has not finished after this many seconds,
+      start one duplicate; the first success wins and the other is cancelled
+    - retry_on: exception types worth retrying; anything else fails at once
+
+    Returns the call_with_retry result dict plus 'attempts'.
+    """
+    loop = asyncio.get_running_loop()
+    stop_at = loop.time() + deadline
+    delay = base
+    attempts = 0
+    error = 'Deadline exceeded'
+
+    while attempts < max_attempts and loop.time() < stop_at:
+        round_end = min(stop_at, loop.time() + (attempt_timeout or deadline))
+        pending = set()
+        hedged = False
+
+        def launch():
+            nonlocal attempts
+            attempts += 1
+            pending.add(asyncio.ensure_future(func(*args, **kwargs)))
+            return loop.time()
+
+        launched_at = launch()
+        try:
+            while pending and loop.time() < round_end:
+                can_hedge = hedge_after is not None and not hedged and attempts < max_attempts
+                timeout = round_end - loop.time()
+                if can_hedge:
+                    timeout = min(timeout, max(0.0, launched_at + hedge_after - loop.time()))
+
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.discard(task)
+                    exc = task.exception()
+                    if exc is None:
+                        return {'success': True, 'result': task.result(), 'attempts': attempts}
+                    if not isinstance(exc, retry_on):
+                        return {'success': False, 'error': str(exc), 'attempts': attempts}
+                    error = str(exc) or type(exc).__name__
+
+                if not done and can_hedge and loop.time() < round_end:
+                    hedged = True
+                    launch()
+            if pending:
+                error = 'Attempt timed out'
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        delay = decorrelated_jitter(delay, base, cap)
+        if loop.time() + delay >= stop_at:
+            break
+        await asyncio.sleep(delay)
+
+    return {'success': False, 'error': error, 'attempts': attempts}
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # PATTERN 2: CIRCUIT BREAKER
 # ═══════════════════════════════════════════════════════════════════════════════
 
+class BreakerRegistry:
+    """
+    Fixed-layout, memory-mapped state for many named circuit breakers.
+
+    One file holds a header and SLOT_COUNT slots; each slot is a breaker
+    (name, seq, state, failures, opened_at). Hook processes map the file and:
+
+    - read lock-free: a seqlock (seq is odd while a write is in progress)
+      lets readers detect torn reads and retry, so is_open() costs a few
+      microseconds and never blocks;
+    - write under fcntl.flock: read-modify-write of a slot is serialised
+      across processes, so concurrent failures are never lost.
+
+    Usage:
+        registry = BreakerRegistry.open()      # one mmap per file per process
+        slot = registry.slot('external-api')
+        state, failures, opened_at = registry.read(slot)
+    """
+
+    MAGIC = b'CBRK'
+    VERSION = 1
+    SLOT_COUNT = 256
+    NAME_SIZE = 32
+
+    HEADER = struct.Struct('<4sII4x')           # magic, version, slot count
+    SLOT = struct.Struct('<32sIB3xId12x')       # name, seq, state, failures, opened_at
+    FIELDS = struct.Struct('<B3xId')            # the seq-protected part of SLOT
+    FIELDS_OFFSET = NAME_SIZE + 4
+    SIZE = HEADER.size + SLOT_COUNT * SLOT.size
+
+    CLOSED, OPEN, HALF_OPEN = 0, 1, 2
+    STATE_NAMES = {CLOSED: 'closed', OPEN: 'open', HALF_OPEN: 'half-open'}
+
+    _instances = {}
+
+    @classmethod
+    def open(cls, path=None):
+        """Shared registry for path (default: .claude/hooks/.circuit-breakers.mmap)."""
+        if path is None:
+            project_dir = os.environ.get('CLAUDE_PROJECT_DIR', '.')
+            path = Path(project_dir) / '.claude/hooks/.circuit-breakers.mmap'
+        key = os.path.abspath(path)
+        if key not in cls._instances:
+            cls._instances[key] = cls(key)
+        return cls._instances[key]
+
+    def __init__(self, path):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        with self.locked():
+            self._initialise()
+        self.mm = mmap.mmap(self.fd, self.SIZE)
+        self._slots = {}
+
+    def _initialise(self):
+        """Create (or reset an incompatible) registry file. Caller holds the lock."""
+        header = os.pread(self.fd, self.HEADER.size, 0)
+        expected = self.HEADER.pack(self.MAGIC, self.VERSION, self.SLOT_COUNT)
+        if header == expected and os.fstat(self.fd).st_size >= self.SIZE:
+            return
+        os.ftruncate(self.fd, 0)
+        os.ftruncate(self.fd, self.SIZE)
+        os.pwrite(self.fd, expected, 0)
+
+    @contextmanager
+    def locked(self):
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+    def _offset(self, slot):
+        return self.HEADER.size + slot * self.SLOT.size
+
+    def slot(self, name):
+        """Slot index for a breaker name, allocating one on first use."""
+        if name in self._slots:
+            return self._slots[name]
+        encoded = name.encode('utf-8')
+        if not encoded or len(encoded) > self.NAME_SIZE:
+            raise ValueError(f'Breaker name must be 1-{self.NAME_SIZE} bytes: {name!r}')
+        key = encoded.ljust(self.NAME_SIZE, b'\0')
+
+        # Names are written once and never change, so a lock-free scan is safe
+        index = self._find(key)
+        if index is None:
+            with self.locked():
+                index = self._find(key)
+                if index is None:
+                    index = self._find(b'\0' * self.NAME_SIZE)
+                    if index is None:
+                        raise RuntimeError(f'Circuit breaker registry is full ({self.SLOT_COUNT} slots)')
+                    self.mm[self._offset(index):self._offset(index) + self.SLOT.size] = \
+                        self.SLOT.pack(key, 0, self.CLOSED, 0, 0.0)
+        self._slots[name] = index
+        return index
+
+    def _find(self, key):
+        for index in range(self.SLOT_COUNT):
+            offset = self._offset(index)
+            if self.mm[offset:offset + self.NAME_SIZE] == key:
+                return index
+        return None
+
+    def _seq(self, offset):
+        return struct.unpack_from('<I', self.mm, offset + self.NAME_SIZE)[0]
+
+    def read(self, slot):
+        """(state, failures, opened_at) of a slot via the seqlock; never blocks writers."""
+        offset = self._offset(slot)
+        for _ in range(100):
+            before = self._seq(offset)
+            if before & 1:
+                continue
+            fields = self.FIELDS.unpack_from(self.mm, offset + self.FIELDS_OFFSET)
+            if self._seq(offset) == before:
+                return fields
+        # A writer is busy or died mid-update; take the lock instead
+        with self.locked():
+            return self.read_locked(slot)
+
+    def read_locked(self, slot):
+        """(state, failures, opened_at) of a slot. Caller holds the lock."""
+        return self.FIELDS.unpack_from(self.mm, self._offset(slot) + self.FIELDS_OFFSET)
+
+    def write(self, slot, state, failures, opened_at):
+        """Publish new slot fields. Caller holds the lock."""
+        offset = self._offset(slot)
+        # Odd while writing; also recovers a seq left odd by a writer that died
+        seq = self._seq(offset) | 1
+        struct.pack_into('<I', self.mm, offset + self.NAME_SIZE, seq)
+        self.FIELDS.pack_into(self.mm, offset + self.FIELDS_OFFSET, state, failures, opened_at)
+        struct.pack_into('<I', self.mm, offset + self.NAME_SIZE, (seq + 1) & 0xFFFFFFFF)
+
+
 class CircuitBreaker:
     """
     Circuit breaker prevents cascading failures.
@@ -55,8 +289,12 @@ class CircuitBreaker:
     - OPEN: Too many failures, requests bypassed for timeout period
     - HALF-OPEN: After timeout, allow one request to test recovery
 
+    State lives in a shared BreakerRegistry, one named slot per service, so
+    every hook process sees the same counts and only one of them probes a
+    recovering service.
+
     Usage:
-        breaker = CircuitBreaker(failure_threshold=5, timeout=60)
+        breaker = CircuitBreaker(failure_threshold=5, timeout=60, name='external-api')
 
         if breaker.is_open():
             # Skip external call, use fallback
@@ -69,61 +307,71 @@ class CircuitBreaker:
             breaker.record_failure()
     """
 
-    def __init__(self, failure_threshold=5, timeout=60):
+    def __init__(self, failure_threshold=5, timeout=60, name='default', registry=None):
         self.failure_threshold = failure_threshold
         self.timeout = timeout
-        project_dir = os.environ.get('CLAUDE_PROJECT_DIR', '.')
-        self.state_file = Path(project_dir) / '.claude/hooks/.circuit-breaker-state.json'
+        self.name = name
+        self.registry = registry or BreakerRegistry.open()
+        self.slot = self.registry.slot(name)
 
     def get_state(self) -> dict:
         """Get current circuit breaker state."""
-        if not self.state_file.exists():
-            return {'failures': 0, 'opened_at': None, 'state': 'closed'}
-
-        try:
-            with open(self.state_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return {'failures': 0, 'opened_at': None, 'state': 'closed'}
+        state, failures, opened_at = self.registry.read(self.slot)
+        return {
+            'failures': failures,
+            'opened_at': opened_at or None,
+            'state': BreakerRegistry.STATE_NAMES.get(state, 'closed'),
+        }
 
     def save_state(self, state: dict):
         """Save circuit breaker state."""
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.state_file, 'w') as f:
-            json.dump(state, f)
+        codes = {v: k for k, v in BreakerRegistry.STATE_NAMES.items()}
+        with self.registry.locked():
+            self.registry.write(self.slot, codes.get(state.get('state'), BreakerRegistry.CLOSED),
+                                state.get('failures', 0), state.get('opened_at') or 0.0)
 
     def record_failure(self):
         """Record a failure."""
-        state = self.get_state()
-        state['failures'] += 1
+        with self.registry.locked():
+            state, failures, opened_at = self.registry.read_locked(self.slot)
+            failures += 1
 
-        if state['failures'] >= self.failure_threshold:
-            state['opened_at'] = time.time()
-            state['state'] = 'open'
+            if state == BreakerRegistry.HALF_OPEN or (
+                    state == BreakerRegistry.CLOSED and failures >= self.failure_threshold):
+                # Failed probe, or threshold reached: (re)open
+                state, opened_at = BreakerRegistry.OPEN, time.time()
 
-        self.save_state(state)
+            self.registry.write(self.slot, state, failures, opened_at)
 
     def record_success(self):
         """Record a success, reset circuit."""
-        if self.state_file.exists():
-            self.state_file.unlink()
+        if self.registry.read(self.slot) == (BreakerRegistry.CLOSED, 0, 0.0):
+            return
+        with self.registry.locked():
+            self.registry.write(self.slot, BreakerRegistry.CLOSED, 0, 0.0)
 
     def is_open(self) -> bool:
         """Check if circuit is open (blocking requests)."""
-        state = self.get_state()
+        state, _, opened_at = self.registry.read(self.slot)
 
-        if state['state'] != 'open':
+        if state == BreakerRegistry.CLOSED:
             return False
 
-        # Check if timeout has passed (half-open state)
-        if state['opened_at'] and time.time() - state['opened_at'] > self.timeout:
-            # Allow one request through (half-open)
-            state['state'] = 'half-open'
-            self.save_state(state)
+        # Open or probing: blocked until the timeout has passed
+        if time.time() - opened_at <= self.timeout:
+            return True
+
+        # Timeout passed: let exactly one caller through as the half-open probe.
+        # A probe that never reports back is replaced after another timeout.
+        with self.registry.locked():
+            state, failures, opened_at = self.registry.read_locked(self.slot)
+            if state == BreakerRegistry.CLOSED:
+                return False
+            if time.time() - opened_at <= self.timeout:
+                return True
+            self.registry.write(self.slot, BreakerRegistry.HALF_OPEN, failures, time.time())
             return False
 
-        return True
-
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # PATTERN 3: GRACEFUL DEGRADATION
@@ -191,11 +439,156 @@ def validate_with_fallback(input_data: dict, breaker: CircuitBreaker) -> dict:
             }
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# SELF-TEST
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class StubService:
+    """
+    Local TCP service that injects latency and failures, for exercising retries.
+
+    Each request is one line; the reply is 'ok' after `latency` seconds. The
+    first `slow_first` requests take `slow_latency` instead; the first
+    `fail_first` requests, and a random `failure_rate` share of the rest,
+    are dropped without a reply.
+
+    Usage:
+        async with StubService(fail_first=2) as service:
+            result = await retry_async(service.call, deadline=0.5)
+    """
+
+    def __init__(self, latency=0.0, failure_rate=0.0, fail_first=0,
+                 slow_first=0, slow_latency=1.0, seed=0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.fail_first = fail_first
+        self.slow_first = slow_first
+        self.slow_latency = slow_latency
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.cancelled = 0
+        self.server = None
+        self.port = None
+        self.handlers = set()
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self._handle, '127.0.0.1', 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+        for task in self.handlers:
+            task.cancel()
+        await asyncio.gather(*self.handlers, return_exceptions=True)
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        index = self.requests
+        self.requests += 1
+        task = asyncio.current_task()
+        self.handlers.add(task)
+        try:
+            await reader.readline()
+            if index < self.fail_first or self.random.random() < self.failure_rate:
+                return
+            await asyncio.sleep(self.slow_latency if index < self.slow_first else self.latency)
+            writer.write(b'ok\n')
+            await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass  # Client gave up or the stub is shutting down
+        finally:
+            writer.close()
+            self.handlers.discard(task)
+
+    async def call(self, payload=b'ping'):
+        """Client side: one request/response; raises ConnectionError on a dropped request."""
+        try:
+            reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+            try:
+                writer.write(payload + b'\n')
+                await writer.drain()
+                reply = await reader.readline()
+            finally:
+                writer.close()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if not reply:
+            raise ConnectionError('Request dropped')
+        return reply.strip().decode()
+
+
+async def _self_test():
+    """Run retry_async against StubService; returns [(check, passed)].
+
+    Checks count attempts and cancellations rather than timing them; the only
+    time bounds are far below the stub's slow latency, so a loaded machine
+    cannot fail them.
+    """
+    checks = []
+
+    async with StubService(fail_first=2) as service:
+        result = await retry_async(service.call, deadline=5.0)
+        checks.append(('retries through transient failures',
+                       result['success'] and result['attempts'] == 3))
+
+    async with StubService(latency=5.0) as service:
+        started = time.monotonic()
+        result = await retry_async(service.call, deadline=0.1)
+        elapsed = time.monotonic() - started
+        checks.append(('stops at the deadline and cancels the attempt',
+                       not result['success'] and result['attempts'] == 1
+                       and service.cancelled == 1 and elapsed < 2.5))
+
+    async with StubService(slow_first=1, slow_latency=5.0) as service:
+        started = time.monotonic()
+        result = await retry_async(service.call, deadline=5.0, hedge_after=0.02)
+        elapsed = time.monotonic() - started
+        checks.append(('hedged request beats a slow attempt',
+                       result['success'] and result['attempts'] == 2 and service.requests == 2
+                       and service.cancelled == 1 and elapsed < 2.5))
+
+    async with StubService(failure_rate=0.5, latency=0.002, seed=7) as service:
+        results = [await retry_async(service.call, deadline=5.0, max_attempts=8) for _ in range(20)]
+        checks.append(('recovers under 50% random failures', all(r['success'] for r in results)))
+
+    async with StubService(fail_first=100) as service:
+        result = await retry_async(service.call, deadline=5.0, max_attempts=3)
+        checks.append(('respects max_attempts', not result['success'] and service.requests == 3))
+
+    delays, delay = [], 0.005
+    for _ in range(1000):
+        delay = decorrelated_jitter(delay, 0.005, 0.05)
+        delays.append(delay)
+    checks.append(('jitter stays within base and cap', all(0.005 <= d <= 0.05 for d in delays)))
+
+    # Sleeps are at least base (0.05s) and must fit in 0.2s: three at most, so four calls
+    calls = []
+    result = call_with_retry(lambda: calls.append(1) or 1 / 0, max_retries=10, deadline=0.2, base=0.05, cap=0.1)
+    checks.append(('call_with_retry honours its deadline',
+                   not result['success'] and result['error'].startswith('Deadline exceeded')
+                   and 1 <= len(calls) <= 4))
+
+    return checks
+
+
+def self_test():
+    """Print check results and return an exit code."""
+    checks = asyncio.run(_self_test())
+    for name, passed in checks:
+        print(f"{'✓' if passed else '❌'} {name}")
+    return 0 if all(passed for _, passed in checks) else 1
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # MAIN
 # ═══════════════════════════════════════════════════════════════════════════════
 
 def main():
+    if '--self-test' in sys.argv[1:]:
+        sys.exit(self_test())
+
     input_data = json.load(sys.stdin)
     breaker = CircuitBreaker(failure_threshold=5, timeout=60)
 
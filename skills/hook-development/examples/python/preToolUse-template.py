@@ -9,10 +9,32 @@ Use Python for:
 - Scoring/ranking algorithms
 
 Performance budget: < 100ms for PreToolUse
+
+Deny/allow rules are read from $HOOK_RULES_FILE, or rules.txt next to this
+script, and matched by rule_engine.py (copy it alongside). Without a rules
+file the built-in patterns below apply; a rules file that cannot be loaded
+denies every Bash command until it is fixed.
 """
+import os
 import sys
 import json
 
+# Used when no rules file exists
+DANGEROUS_PATTERNS = ['rm -rf /', 'DROP TABLE', 'xp_cmdshell']
+
+HOOK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_rules():
+    """RuleEngine for the rules file, or None when there is none."""
+    rules_file = os.environ.get('HOOK_RULES_FILE') or os.path.join(HOOK_DIR, 'rules.txt')
+    if not os.path.isfile(rules_file):
+        return None
+    sys.path.insert(0, HOOK_DIR)
+    from rule_engine import RuleEngine
+    # Compiled once per rules-file version, then loaded from cache
+    return RuleEngine.from_file(rules_file)
+
 
 def should_block(input_data: dict) -> tuple[bool, str]:
     """
@@ -24,9 +46,19 @@ def should_block(input_data: dict) -> tuple[bool, str]:
     tool_input = input_data.get('tool_input', {})
     command = tool_input.get('command', '')
 
-    # Example: Block dangerous commands
-    dangerous_patterns = ['rm -rf /', 'DROP TABLE', 'xp_cmdshell']
-    for pattern in dangerous_patterns:
+    # Example: Block commands matching a deny rule (one pass for all rules)
+    try:
+        engine = load_rules()
+    except Exception as e:
+        # Fail closed: a broken rules file must not switch every deny rule off
+        return True, f"Rules file could not be loaded: {e}"
+    if engine is not None:
+        match = engine.check(command)
+        if match:
+            return True, f"Blocked by rule {match.rule}"
+        return False, ""
+
+    for pattern in DANGEROUS_PATTERNS:
         if pattern in command:
             return True, f"Dangerous pattern detected: {pattern}"
 
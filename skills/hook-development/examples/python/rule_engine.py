@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Compiled deny/allow rule engine for PreToolUse hooks
+
+Rules live in a text file, one per line:
+
+    # comment
+    deny  rm -rf /
+    allow rm -rf /tmp/
+
+The text after the kind is matched literally (case-sensitive) anywhere in
+the command. A deny match blocks the command unless an allow match covers
+it, so the rules above block `rm -rf /` but not `rm -rf /tmp/build`, and
+still block `rm -rf /tmp/x; rm -rf /`.
+
+All patterns are compiled once into a single Aho-Corasick automaton, so a
+command is matched in one pass however many rules there are, and every hit
+names the rule (and line) that fired. The compiled automaton is cached by
+the rules file's SHA-256 in
+${XDG_CACHE_HOME:-~/.cache}/claude-development/rule-engine/, so hooks pay
+for compilation only when the rules change.
+
+Usage:
+    rule_engine.py RULES_FILE COMMAND    Print the rule that blocks COMMAND
+    rule_engine.py --bench [N]           Benchmark N rules (default 10000)
+
+Environment:
+    RULE_ENGINE_CACHE     Cache directory override
+    RULE_ENGINE_NO_CACHE  Set to 1 to compile on every load
+"""
+import hashlib
+import os
+import sys
+from typing import Iterator, NamedTuple, Optional
+
+CACHE_FORMAT = 1
+KINDS = ("deny", "allow")
+
+
+class Rule(NamedTuple):
+    kind: str       # 'deny' or 'allow'
+    pattern: str    # literal text to find
+    line: int       # line number in the rules file (0 when built in code)
+
+    def __str__(self):
+        where = f"line {self.line}: " if self.line else ""
+        return f"{where}{self.kind} {self.pattern}"
+
+
+class Match(NamedTuple):
+    rule: Rule
+    start: int
+    end: int
+
+
+class RuleError(ValueError):
+    """A rules file line that is not `deny <text>` or `allow <text>` (any whitespace between)."""
+
+
+def parse_rules(text: str) -> list:
+    """Rules from rules-file text; blank lines and # comments are skipped."""
+    rules = []
+    for number, line in enumerate(text.splitlines(), 1):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        kind, pattern = (stripped.split(None, 1) + [""])[:2]
+        if kind not in KINDS or not pattern:
+            raise RuleError(f"line {number}: expected 'deny <text>' or 'allow <text>', got {stripped!r}")
+        rules.append(Rule(kind, pattern, number))
+    return rules
+
+
+def cache_dir() -> str:
+    override = os.environ.get("RULE_ENGINE_CACHE")
+    if override:
+        return override
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "claude-development", "rule-engine")
+
+
+def cache_disabled() -> bool:
+    return os.environ.get("RULE_ENGINE_NO_CACHE", "") not in ("", "0")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# AUTOMATON
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# A transition is stored as one integer key: state << CHAR_BITS | ord(char)
+CHAR_BITS = 21
+TABLES = {"keys": "q", "targets": "l", "fail": "l", "out_offsets": "l", "out_rules": "l"}
+
+
+def compile_automaton(patterns):
+    """
+    Aho-Corasick tables for patterns, as flat arrays (cheap to cache and load).
+
+    Returns:
+        {name: array} for TABLES: the sorted transition keys and their target
+        states, each state's fail link (longest proper suffix state), and for
+        state s the indexes of every pattern ending there,
+        out_rules[out_offsets[s]:out_offsets[s + 1]].
+    """
+    from array import array
+    from collections import deque
+
+    goto = [{}]
+    found = [[]]
+    for index, pattern in enumerate(patterns):
+        state = 0
+        for char in pattern:
+            following = goto[state].get(char)
+            if following is None:
+                following = len(goto)
+                goto.append({})
+                found.append([])
+                goto[state][char] = following
+            state = following
+        found[state].append(index)
+
+    # Breadth-first, so a state's fail target is always complete before it
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, following in goto[state].items():
+            queue.append(following)
+            target = fail[state]
+            while target and char not in goto[target]:
+                target = fail[target]
+            fail[following] = goto[target].get(char, 0)
+            found[following].extend(found[fail[following]])
+
+    transitions = sorted(
+        (state << CHAR_BITS | ord(char), following)
+        for state, edges in enumerate(goto) for char, following in edges.items()
+    )
+    offsets = [0]
+    for indexes in found:
+        offsets.append(offsets[-1] + len(indexes))
+    return {
+        "keys": array("q", [key for key, _ in transitions]),
+        "targets": array("l", [following for _, following in transitions]),
+        "fail": array("l", fail),
+        "out_offsets": array("l", offsets),
+        "out_rules": array("l", [index for indexes in found for index in indexes]),
+    }
+
+
+class RuleEngine:
+    """Deny/allow rules compiled into one automaton."""
+
+    def __init__(self, rules, tables=None):
+        self._rules = [Rule(*rule) for rule in rules]
+        self._columns = None
+        self._set_tables(tables or compile_automaton([rule.pattern for rule in self._rules]))
+
+    def _set_tables(self, tables):
+        self.tables = tables
+        keys, targets = tables["keys"], tables["targets"]
+        # Most characters of a command leave the automaton at the root, so its
+        # transitions (the smallest keys) get a dict
+        self._root = {}
+        for key, following in zip(keys, targets):
+            if key >> CHAR_BITS:
+                break
+            self._root[chr(key)] = following
+
+    @classmethod
+    def _from_cache(cls, cached):
+        from array import array
+        engine = cls.__new__(cls)
+        tables = {}
+        for name, typecode in TABLES.items():
+            tables[name] = array(typecode)
+            tables[name].frombytes(cached[name])
+        engine._rules = None
+        engine._columns = (cached["patterns"], cached["kinds"], cached["lines"])
+        engine._set_tables(tables)
+        return engine
+
+    @property
+    def rules(self) -> list:
+        if self._rules is None:
+            patterns, kinds, lines = self._columns
+            self._rules = [Rule(KINDS[kind], pattern, line)
+                           for pattern, kind, line in zip(patterns.split("\n"), kinds, lines)]
+        return self._rules
+
+    @classmethod
+    def from_file(cls, path, use_cache=True) -> "RuleEngine":
+        """Load a rules file, reusing the automaton compiled for identical contents."""
+        with open(path, "rb") as f:
+            data = f.read()
+        if not use_cache or cache_disabled():
+            return cls(parse_rules(data.decode("utf-8")))
+
+        import marshal
+        digest = hashlib.sha256(data).hexdigest()
+        cache_path = os.path.join(cache_dir(), f"{digest}.marshal")
+        try:
+            with open(cache_path, "rb") as f:
+                cached = marshal.loads(f.read())
+            if cached["format"] == CACHE_FORMAT and cached["python"] == tuple(sys.version_info[:2]):
+                return cls._from_cache(cached)
+        except (OSError, EOFError, ValueError, TypeError, KeyError):
+            pass
+
+        engine = cls(parse_rules(data.decode("utf-8")))
+        cached = {name: engine.tables[name].tobytes() for name in TABLES}
+        cached.update({
+            "format": CACHE_FORMAT, "python": tuple(sys.version_info[:2]),
+            "patterns": "\n".join(rule.pattern for rule in engine.rules),
+            "kinds": bytes(KINDS.index(rule.kind) for rule in engine.rules),
+            "lines": [rule.line for rule in engine.rules],
+        })
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                marshal.dump(cached, f)
+            os.replace(tmp, cache_path)
+        except OSError:
+            pass
+        return engine
+
+    def matches(self, text: str) -> Iterator[Match]:
+        """Every rule occurrence in text, in order of where it ends (one pass)."""
+        from bisect import bisect_left
+
+        tables = self.tables
+        keys, targets, fail = tables["keys"], tables["targets"], tables["fail"]
+        offsets, out_rules = tables["out_offsets"], tables["out_rules"]
+        root, size = self._root, len(keys)
+        state = 0
+        for position, char in enumerate(text, 1):
+            while True:
+                if not state:
+                    state = root.get(char, 0)
+                    break
+                key = state << CHAR_BITS | ord(char)
+                slot = bisect_left(keys, key)
+                if slot < size and keys[slot] == key:
+                    state = targets[slot]
+                    break
+                state = fail[state]
+            if offsets[state] != offsets[state + 1]:
+                rules = self.rules
+                for index in out_rules[offsets[state]:offsets[state + 1]]:
+                    rule = rules[index]
+                    yield Match(rule, position - len(rule.pattern), position)
+
+    def check(self, text: str) -> Optional[Match]:
+        """The deny match that blocks text (earliest in text, then in the rules), or None."""
+        denies, allows = [], []
+        for match in self.matches(text):
+            (denies if match.rule.kind == "deny" else allows).append(match)
+        for deny in sorted(denies, key=lambda m: (m.start, m.rule.line)):
+            if not any(a.start <= deny.start and deny.end <= a.end for a in allows):
+                return deny
+        return None
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BENCHMARK
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _bench_rules(count, rng):
+    """Rules shaped like a real policy: tool invocations, paths, SQL, URLs."""
+    verbs = ["rm -rf", "chmod 777", "curl -s", "wget", "scp", "dd if=", "mkfs", "DROP TABLE",
+             "git push --force", "kubectl delete", "docker rm", "aws s3 rm", "terraform destroy"]
+    words = ["prod", "data", "backup", "users", "secrets", "logs", "cache", "build", "tmp", "home",
+             "etc", "var", "db", "infra", "release", "billing", "archive"]
+    lines = ["# generated policy"]
+    for index in range(count):
+        target = "/".join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+        kind = "allow" if index % 10 == 9 else "deny"
+        lines.append(f"{kind} {rng.choice(verbs)} /{target}{index}")
+    return "\n".join(lines) + "\n"
+
+
+def bench(count=10000):
+    import random
+    import tempfile
+    import time
+
+    rng = random.Random(7)
+    text = _bench_rules(count, rng)
+    rules = parse_rules(text)
+    patterns = [r.pattern for r in rules if r.kind == "deny"]
+    commands = [
+        "ls -la",
+        "git status && npm test -- --watch=false",
+        f"cd /srv && {rules[len(rules) // 2].pattern} && echo done",
+        "python3 - <<'EOF'\n" + "print('x' * 80)\n" * 200 + "EOF",
+    ]
+
+    def timed(fn, runs=5):
+        best = float("inf")
+        for _ in range(runs):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        return best * 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["RULE_ENGINE_CACHE"] = tmp
+        path = os.path.join(tmp, "rules.txt")
+        with open(path, "w") as f:
+            f.write(text)
+        cold = timed(lambda: RuleEngine.from_file(path, use_cache=False), runs=3)
+        RuleEngine.from_file(path)
+        warm = timed(lambda: RuleEngine.from_file(path))
+        naive_load = timed(lambda: parse_rules(open(path).read()))
+        engine = RuleEngine.from_file(path)
+
+        print(f"{count} rules, {len(engine.tables['fail'])} automaton states")
+        print(f"  load: compile {cold:.1f}ms, cached {warm:.1f}ms (parse only, for the loop: {naive_load:.1f}ms)")
+        print(f"  {'command':>14} {'automaton':>10} {'substring loop':>15}")
+        for command in commands:
+            fast = timed(lambda: engine.check(command), runs=20)
+            slow = timed(lambda: [p for p in patterns if p in command], runs=20)
+            print(f"  {len(command):>8} chars {fast:>8.3f}ms {slow:>13.3f}ms")
+
+
+def main():
+    args = sys.argv[1:]
+    if args[:1] == ["--bench"]:
+        bench(int(args[1]) if len(args) > 1 else 10000)
+        return 0
+    if len(args) != 2:
+        print(__doc__.strip())
+        return 1
+    try:
+        engine = RuleEngine.from_file(args[0])
+    except (OSError, RuleError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    match = engine.check(args[1])
+    if match is None:
+        print("✅ allowed")
+        return 0
+    print(f"🚫 blocked by {match.rule} (at {match.start}-{match.end})")
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
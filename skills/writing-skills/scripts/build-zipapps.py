@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Build precompiled zipapps of the skill scripts, and report their startup cost.
+
+Each zipapp bundles every module in this directory as source plus an
+unchecked-hash .pyc for the building interpreter, so the same Python version
+imports without compiling or stat-ing sources, while other versions fall
+back to the bundled source. Archives are reproducible and run isolated
+(`python3 -I`: no PYTHON* variables, no user site, no script dir on sys.path).
+
+Usage:
+    build-zipapps.py [--output DIR] [--python INTERPRETER]
+    build-zipapps.py --report SKILL_DIR [--output DIR] [--runs N]
+
+Example:
+    build-zipapps.py --output dist/zipapps
+    dist/zipapps/quick_validate.pyz skills/my-skill
+    build-zipapps.py --report skills/my-skill
+
+The report runs quick_validate on SKILL_DIR from source, from source with
+PyYAML imported up front (the old module-level import), and from the
+zipapp, and prints median wall time, total import time (-X importtime) and
+the slowest imports of each.
+"""
+
+import argparse
+import os
+import py_compile
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Command-line entry points; each gets its own zipapp
+ENTRY_POINTS = [
+    "quick_validate",
+    "package_skill",
+    "bulk_package",
+    "validate-report",
+    "clean-frontmatter",
+    "init_skill",
+]
+
+DEFAULT_INTERPRETER = "/usr/bin/env -S python3 -I"
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+MAIN_TEMPLATE = """import runpy
+runpy.run_module({module!r}, run_name="__main__", alter_sys=True)
+"""
+
+
+def module_name(path):
+    return path.stem.replace("-", "_")
+
+
+def library_sources():
+    """Every module bundled into the zipapps, excluding this builder."""
+    return sorted(p for p in SCRIPTS_DIR.glob("*.py") if p.resolve() != Path(__file__).resolve())
+
+
+def compile_unchecked(source_path, name, workdir):
+    """Bytes of an unchecked-hash .pyc for source_path (no source stat at import)."""
+    cfile = Path(workdir) / f"{name}.pyc"
+    py_compile.compile(
+        str(source_path),
+        cfile=str(cfile),
+        dfile=f"{name}.py",
+        doraise=True,
+        invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+    )
+    return cfile.read_bytes()
+
+
+def _write(zf, arcname, data):
+    zinfo = zipfile.ZipInfo(arcname, date_time=FIXED_DATE_TIME)
+    zinfo.create_system = 3
+    zinfo.external_attr = 0o100644 << 16
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zf.writestr(zinfo, data)
+
+
+def build_zipapp(entry, output_dir, interpreter, compiled):
+    """Write <output_dir>/<entry>.pyz and return its path."""
+    target = Path(output_dir) / f"{module_name(Path(entry))}.pyz"
+    tmp = target.with_name(f".{target.name}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(f"#!{interpreter}\n".encode("utf-8"))
+        with zipfile.ZipFile(f, "w") as zf:
+            _write(zf, "__main__.py", MAIN_TEMPLATE.format(module=module_name(Path(entry))))
+            for name, (source, pyc) in sorted(compiled.items()):
+                _write(zf, f"{name}.py", source)
+                _write(zf, f"{name}.pyc", pyc)
+    os.chmod(tmp, 0o755)
+    os.replace(tmp, target)
+    return target
+
+
+def build_all(output_dir, interpreter=DEFAULT_INTERPRETER):
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory() as workdir:
+        compiled = {
+            module_name(path): (path.read_bytes(), compile_unchecked(path, module_name(path), workdir))
+            for path in library_sources()
+        }
+        return [build_zipapp(entry, output_dir, interpreter, compiled) for entry in ENTRY_POINTS]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# STARTUP REPORT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def parse_importtime(stderr):
+    """(total import µs, [(cumulative µs, module)] for top-level imports, all module names)."""
+    top, names = [], set()
+    for line in stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, name = match.groups()
+        names.add(name)
+        if len(indent) == 1:
+            top.append((int(cumulative), name))
+    return sum(c for c, _ in top), sorted(top, reverse=True), names
+
+
+def measure(argv, runs, env):
+    """Median wall time (ms) over runs, plus one -X importtime run."""
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(argv, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append((time.perf_counter() - started) * 1000)
+    traced = subprocess.run(argv[:1] + ["-X", "importtime"] + argv[1:], env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    total, top, names = parse_importtime(traced.stderr)
+    return statistics.median(times), total, top, names
+
+
+def report(skill_dir, output_dir, runs):
+    zipapp = build_all(output_dir)[ENTRY_POINTS.index("quick_validate")]
+    env = dict(os.environ, SKILL_VALIDATE_NO_CACHE="1")
+    script = str(SCRIPTS_DIR / "quick_validate.py")
+    eager_yaml = ("import sys, runpy, yaml; sys.path.insert(0, sys.argv[1]); "
+                  "sys.argv = sys.argv[2:]; runpy.run_path(sys.argv[0], run_name='__main__')")
+    modes = [
+        ("source", [sys.executable, script, skill_dir]),
+        ("source + eager PyYAML", [sys.executable, "-c", eager_yaml, str(SCRIPTS_DIR), script, skill_dir]),
+        ("zipapp (-I)", [sys.executable, "-I", str(zipapp), skill_dir]),
+    ]
+
+    print(f"quick_validate {skill_dir}  (median of {runs} runs, cache disabled)")
+    print()
+    print(f"{'MODE':<24} {'WALL ms':>8} {'IMPORTS ms':>11} {'YAML':>5}")
+    details = []
+    for label, argv in modes:
+        wall, total, top, names = measure(argv, runs, env)
+        print(f"{label:<24} {wall:>8.1f} {total / 1000:>11.1f} {'yes' if 'yaml' in names else 'no':>5}")
+        details.append((label, top))
+
+    for label, top in details:
+        print()
+        print(f"Slowest imports ({label}):")
+        for cumulative, name in top[:8]:
+            print(f"  {cumulative / 1000:>7.1f} ms  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build precompiled zipapps of the skill scripts")
+    parser.add_argument("--output", default="dist/zipapps", help="Output directory (default: dist/zipapps)")
+    parser.add_argument("--python", default=DEFAULT_INTERPRETER,
+                        help=f"Shebang interpreter (default: {DEFAULT_INTERPRETER!r})")
+    parser.add_argument("--report", metavar="SKILL_DIR", help="Print a startup report for quick_validate")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per mode for --report (default: 10)")
+    args = parser.parse_args()
+
+    if args.report:
+        report(args.report, args.output, args.runs)
+        return
+
+    for path in build_all(args.output, args.python):
+        print(f"✅ {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Bulk Skill Packager - Validates and packages many skills concurrently
+
+Each argument is either a skill folder (contains SKILL.md) or a root whose
+subfolders are skills. Archives are written to the dist directory together
+with index.json, which lists every archive's name, version, sha256, size and
+entry count so consumers never need to open an archive to discover it.
+A skill that fails to validate or package has its previous archive removed
+and unlisted, so the index never advertises a stale build.
+
+Usage:
+    python bulk_package.py <skill-folder-or-root>... [--dist DIR] [--jobs N] [--no-cache] [--full] [--level N]
+
+Example:
+    python bulk_package.py skills/ --dist ./dist
+    python bulk_package.py skills/pdf skills/docx --dist ./dist --jobs 4
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from package_skill import write_skill_archive
+from packaging_policy import DEFAULT_LEVEL, PackagingPolicy
+from quick_validate import get_cache, validate_skill
+from skill_archive import MANIFEST_NAME
+from skill_frontmatter import FrontmatterError, load_frontmatter, read_frontmatter
+
+INDEX_NAME = "index.json"
+INDEX_FORMAT = 1
+
+
+def find_skills(paths):
+    """Resolve arguments to a sorted list of skill folders."""
+    skills = set()
+    for path in paths:
+        path = Path(path).resolve()
+        if (path / "SKILL.md").is_file():
+            skills.add(path)
+        elif path.is_dir():
+            skills.update(p.parent for p in path.rglob("SKILL.md"))
+    return sorted(skills)
+
+
+def skill_metadata(skill_path):
+    """(name, version) from SKILL.md frontmatter; version comes from metadata.version."""
+    name, version = skill_path.name, None
+    try:
+        header = read_frontmatter(skill_path / "SKILL.md")
+        data = load_frontmatter(header) if header.closed else None
+    except (OSError, FrontmatterError):
+        return name, version
+    if isinstance(data, dict):
+        if isinstance(data.get("name"), str) and data["name"].strip():
+            name = data["name"].strip()
+        metadata = data.get("metadata")
+        if isinstance(metadata, dict) and metadata.get("version") is not None:
+            version = str(metadata["version"])
+    return name, version
+
+
+def remove_stale(archive):
+    """Delete a previous run's archive for a skill that no longer packages."""
+    try:
+        archive.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def build_one(skill_path, dist, use_cache=True, incremental=True, level=DEFAULT_LEVEL):
+    """Validate and package one skill; returns an index record or an error record."""
+    archive = dist / f"{skill_path.name}.skill"
+    record = {"folder": str(skill_path), "ok": False, "archive": archive.name}
+
+    valid, message = validate_skill(skill_path, use_cache=use_cache)
+    if not valid:
+        record["error"] = f"Validation failed: {message}"
+        remove_stale(archive)
+        return record
+
+    try:
+        policy = PackagingPolicy(level=level)
+        write_skill_archive(skill_path, archive, incremental=incremental, log=None, policy=policy)
+        with zipfile.ZipFile(archive) as zf:
+            entries = len(zf.infolist())
+    except Exception as e:
+        record["error"] = f"Error creating .skill file: {e}"
+        remove_stale(archive)
+        return record
+
+    digest = hashlib.sha256()
+    with open(archive, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+
+    name, version = skill_metadata(skill_path)
+    record.update({
+        "ok": True,
+        "name": name,
+        "version": version,
+        "archive": archive.name,
+        "sha256": digest.hexdigest(),
+        "size": archive.stat().st_size,
+        "entries": entries,
+    })
+    return record
+
+
+def build_batch(skills, dist, use_cache=True, incremental=True, level=DEFAULT_LEVEL):
+    """Package a batch of skills in one worker.
+
+    Pool workers exit without running atexit handlers, so the validation
+    cache is saved explicitly once per batch.
+    """
+    records = [build_one(skill, dist, use_cache, incremental, level) for skill in skills]
+    if use_cache:
+        get_cache().save()
+    return records
+
+
+def iter_builds(skills, dist, jobs, use_cache=True, incremental=True, level=DEFAULT_LEVEL):
+    """Yield build records as batches of skills finish packaging."""
+    if jobs <= 1 or len(skills) <= 1:
+        for skill in skills:
+            yield build_one(skill, dist, use_cache, incremental, level)
+        return
+
+    batch_size = max(1, min(16, len(skills) // (jobs * 4)))
+    batches = [skills[i:i + batch_size] for i in range(0, len(skills), batch_size)]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(build_batch, b, dist, use_cache, incremental, level) for b in batches]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def load_index(dist):
+    try:
+        with open(dist / INDEX_NAME) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("format") != INDEX_FORMAT:
+        return {}
+    return {entry["archive"]: entry for entry in data.get("skills", [])}
+
+
+def write_index(dist, records, failed=()):
+    """Merge this run's records into dist/index.json, dropping failed skills and archives that no longer exist."""
+    entries = load_index(dist)
+    for r in failed:
+        entries.pop(r.get("archive"), None)
+    for r in records:
+        entries[r["archive"]] = {k: r[k] for k in ("name", "version", "archive", "sha256", "size", "entries")}
+    skills = sorted(
+        (e for e in entries.values() if (dist / e["archive"]).is_file()),
+        key=lambda e: (e["name"], e["archive"]),
+    )
+
+    index_path = dist / INDEX_NAME
+    tmp_path = index_path.with_name(f".{INDEX_NAME}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({"format": INDEX_FORMAT, "manifest": MANIFEST_NAME, "skills": skills}, f, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, index_path)
+    return index_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate and package many skills into a dist directory")
+    parser.add_argument("paths", nargs="+", help="Skill folders or roots containing skills")
+    parser.add_argument("--dist", default="dist", help="Output directory (default: ./dist)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--no-cache", action="store_true", help="Always re-validate")
+    parser.add_argument("--full", action="store_true", help="Recompress every entry")
+    parser.add_argument("--level", type=int, default=DEFAULT_LEVEL, choices=range(10), metavar="0-9",
+                        help=f"DEFLATE level for compressible entries (default: {DEFAULT_LEVEL})")
+    args = parser.parse_args()
+
+    skills = find_skills(args.paths)
+    if not skills:
+        print("❌ Error: No skills found")
+        sys.exit(1)
+
+    # Archive names come from folder names, so they must be unique
+    by_name = {}
+    for skill in skills:
+        by_name.setdefault(skill.name, []).append(skill)
+    duplicates = {name: paths for name, paths in by_name.items() if len(paths) > 1}
+    if duplicates:
+        for name, paths in sorted(duplicates.items()):
+            print(f"❌ Error: Duplicate skill folder name '{name}': {', '.join(map(str, paths))}")
+        sys.exit(1)
+
+    dist = Path(args.dist).resolve()
+    dist.mkdir(parents=True, exist_ok=True)
+
+    print(f"📦 Packaging {len(skills)} skills into {dist}")
+    print()
+
+    records = []
+    for record in iter_builds(skills, dist, args.jobs, not args.no_cache, not args.full, args.level):
+        if record["ok"]:
+            print(f"  ✅ {record['archive']} ({record['entries']} entries, {record['size']} bytes)")
+        else:
+            print(f"  ❌ {record['folder']}: {record['error']}")
+        records.append(record)
+
+    packaged = [r for r in records if r["ok"]]
+    failed = [r for r in records if not r["ok"]]
+    index_path = write_index(dist, packaged, failed)
+
+    print()
+    print(f"Packaged: {len(packaged)}")
+    print(f"Failed: {len(failed)}")
+    print(f"Index: {index_path}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,138 +1,147 @@
 #!/usr/bin/env python3
 """
 Clean SKILL.md frontmatter to only include valid fields.
-Valid fields: name, description, allowed-tools, model, context, agent, hooks, user-invocable, disable-model-invocation
+Valid fields: see VALID_FIELDS / FIELD_ORDER in skill_frontmatter.py
+
+Only files whose header actually changes are written. The new header goes to
+a temp file next to the original, the body is copied kernel-side
+(copy_file_range, then sendfile, then a plain copy), and the temp file is
+renamed over the original, so a crash never leaves a half-written SKILL.md.
+
+Usage:
+    clean-frontmatter.py [--dry-run] [--jobs N]
 """
 
+import argparse
+import difflib
 import os
-import re
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-VALID_FIELDS = {
-    "name",
-    "description",
-    "allowed-tools",
-    "model",
-    "context",
-    "agent",
-    "hooks",
-    "user-invocable",
-    "disable-model-invocation",
-}
-
-FIELD_ORDER = ["name", "description", "allowed-tools", "model", "context", "agent", "hooks", "user-invocable", "disable-model-invocation"]
-
-
-def extract_frontmatter_and_body(content):
-    """Extract frontmatter and body from file content."""
-    lines = content.split('\n')
-
-    if not lines or lines[0] != '---':
-        return None, content
-
-    fm_end = None
-    for i in range(1, len(lines)):
-        if lines[i] == '---':
-            fm_end = i
-            break
-
-    if fm_end is None:
-        return None, content
-
-    frontmatter_lines = lines[1:fm_end]
-    body_lines = lines[fm_end+1:]
-
-    return frontmatter_lines, '\n'.join(body_lines)
-
-
-def parse_frontmatter(fm_lines):
-    """Parse YAML frontmatter into a dict."""
-    fields = {}
-    current_field = None
-    current_value = []
-
-    for line in fm_lines:
-        # Check if this is a field definition
-        if ':' in line and not line.startswith(' '):
-            # Save previous field
-            if current_field:
-                value = '\n'.join(current_value).strip()
-                fields[current_field] = value
+from skill_frontmatter import FIELD_ORDER, VALID_FIELDS, parse_field_blocks, read_frontmatter
 
-            # Parse new field
-            parts = line.split(':', 1)
-            current_field = parts[0].strip()
-            current_value = [parts[1].strip()] if len(parts) > 1 else []
-        elif current_field and line.startswith(' '):
-            # Continuation of current field
-            current_value.append(line)
 
-    # Save last field
-    if current_field:
-        value = '\n'.join(current_value).strip()
-        fields[current_field] = value
-
-    return fields
-
-
-def build_frontmatter(fields):
-    """Build YAML frontmatter from dict."""
+def build_frontmatter(blocks):
+    """Build YAML frontmatter from field blocks, keeping each field's original lines."""
     lines = ['---']
 
     # Add fields in preferred order
     for field in FIELD_ORDER:
-        if field in fields:
-            value = fields[field]
-            if '\n' in value:
-                # Multiline value
-                lines.append(f"{field}:")
-                for vline in value.split('\n'):
-                    lines.append(f"  {vline}")
-            else:
-                lines.append(f"{field}: {value}")
+        if field in blocks:
+            lines.extend(blocks[field])
 
     lines.append('---')
     return '\n'.join(lines)
 
 
-def clean_skill_file(filepath):
-    """Clean a single SKILL.md file."""
-    with open(filepath, 'r') as f:
-        content = f.read()
-
-    fm_lines, body = extract_frontmatter_and_body(content)
-
-    if fm_lines is None:
-        return False  # No frontmatter found
-
-    # Parse frontmatter
-    fields = parse_frontmatter(fm_lines)
-
-    # Check if any invalid fields exist
-    has_invalid = False
-    for field in fields:
-        if field not in VALID_FIELDS:
-            has_invalid = True
-            break
-
-    if not has_invalid:
-        return False  # No changes needed
-
-    # Filter to only valid fields
-    cleaned_fields = {k: v for k, v in fields.items() if k in VALID_FIELDS}
-
-    # Rebuild file
-    new_frontmatter = build_frontmatter(cleaned_fields)
-    new_content = new_frontmatter + '\n' + body
-
-    with open(filepath, 'w') as f:
-        f.write(new_content)
-
-    return True
+def _copy_range(src_fd, dst_fd, offset, count):
+    """Copy count bytes from src_fd at offset to dst_fd's current position."""
+    if count <= 0:
+        return
+
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while count > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, count, offset)
+                if copied == 0:
+                    break
+                offset += copied
+                count -= copied
+            if count == 0:
+                return
+        except OSError:
+            pass
+
+    if hasattr(os, 'sendfile'):
+        try:
+            while count > 0:
+                sent = os.sendfile(dst_fd, src_fd, offset, count)
+                if sent == 0:
+                    break
+                offset += sent
+                count -= sent
+            if count == 0:
+                return
+        except OSError:
+            pass
+
+    os.lseek(src_fd, offset, os.SEEK_SET)
+    with open(src_fd, 'rb', closefd=False) as src, open(dst_fd, 'wb', closefd=False) as dst:
+        remaining = count
+        while remaining > 0:
+            chunk = src.read(min(remaining, shutil.COPY_BUFSIZE))
+            if not chunk:
+                break
+            dst.write(chunk)
+            remaining -= len(chunk)
+
+
+def _replace_header(filepath, src, header_bytes, body_offset):
+    """Write header_bytes + body of src to a temp file and rename it over filepath."""
+    st = os.fstat(src.fileno())
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.SKILL.md.', suffix='.tmp')
+    try:
+        os.write(fd, header_bytes)
+        _copy_range(src.fileno(), fd, body_offset, st.st_size - body_offset)
+        os.fchmod(fd, st.st_mode & 0o7777)
+        os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, filepath)
+
+
+def clean_skill_file(filepath, dry_run=False):
+    """
+    Clean a single SKILL.md file.
+
+    Returns:
+        Unified diff of the header change ('' when the file needs no change)
+    """
+    with open(filepath, 'rb') as src:
+        frontmatter = read_frontmatter(src)
+
+        if not frontmatter.closed:
+            return ''  # No frontmatter found
+
+        blocks = parse_field_blocks(frontmatter.lines)
+
+        # Only rewrite when invalid fields exist
+        if all(field in VALID_FIELDS for field in blocks):
+            return ''
+
+        cleaned_blocks = {k: v for k, v in blocks.items() if k in VALID_FIELDS}
+        new_header = build_frontmatter(cleaned_blocks) + '\n'
+        old_header = '\n'.join(['---'] + frontmatter.lines + ['---']) + '\n'
+        if new_header == old_header:
+            return ''
+
+        diff = ''.join(difflib.unified_diff(
+            old_header.splitlines(keepends=True),
+            new_header.splitlines(keepends=True),
+            fromfile=str(filepath),
+            tofile=f"{filepath} (cleaned)",
+        ))
+
+        if not dry_run:
+            _replace_header(filepath, src, new_header.encode('utf-8'), frontmatter.body_offset)
+
+    return diff
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Remove invalid fields from SKILL.md frontmatter')
+    parser.add_argument('--dry-run', action='store_true', help='Print unified diffs instead of writing')
+    parser.add_argument('--jobs', '-j', type=int, default=min(32, (os.cpu_count() or 1) * 4),
+                        help='Worker threads')
+    args = parser.parse_args()
+
     skills_dir = os.environ.get('CLAUDE_PROJECT_DIR', '.')
     skills_path = Path(skills_dir) / '.claude' / 'skills'
 
@@ -143,22 +152,29 @@ def main():
     # Find all SKILL.md files
     skill_files = sorted(skills_path.rglob('SKILL.md'))
 
-    print(f"Cleaning {len(skill_files)} SKILL.md files...")
+    verb = "Checking" if args.dry_run else "Cleaning"
+    print(f"{verb} {len(skill_files)} SKILL.md files...")
     print()
 
     cleaned = 0
-    for filepath in skill_files:
-        if clean_skill_file(filepath):
-            print(f"  ✓ {filepath.relative_to(skills_path.parent)}")
-            cleaned += 1
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        for filepath, diff in zip(skill_files, pool.map(lambda p: clean_skill_file(p, args.dry_run), skill_files)):
+            if diff:
+                if args.dry_run:
+                    print(diff, end='')
+                else:
+                    print(f"  ✓ {filepath.relative_to(skills_path.parent)}")
+                cleaned += 1
 
     print()
     print(f"Summary:")
     print(f"  Total files: {len(skill_files)}")
-    print(f"  Files cleaned: {cleaned}")
+    print(f"  Files {'to clean' if args.dry_run else 'cleaned'}: {cleaned}")
     print()
 
-    if cleaned > 0:
+    if args.dry_run:
+        print("Dry run: no files were modified.")
+    elif cleaned > 0:
         print("Done!")
     else:
         print("All files already have valid frontmatter.")
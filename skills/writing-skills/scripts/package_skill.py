@@ -3,26 +3,51 @@
 Skill Packager - Creates a distributable .skill file of a skill folder
 
 Usage:
-    python utils/package_skill.py <path/to/skill-folder> [output-directory]
+    python utils/package_skill.py <path/to/skill-folder> [output-directory] [--no-cache] [--full] [--level N]
+
+Repackaging is incremental: entries whose content hash matches the manifest
+in the existing .skill archive are copied without recompression. Use --full
+to recompress everything. Output is byte-for-byte reproducible.
+
+Files matching the packaging policy's ignore patterns (__pycache__, .git,
+.DS_Store, ... plus the skill's .skillignore) are left out. Already-compressed
+assets are stored rather than deflated; --level picks the DEFLATE level for
+everything else (0 stores all entries, default 6).
 
 Example:
     python utils/package_skill.py skills/public/my-skill
     python utils/package_skill.py skills/public/my-skill ./dist
 """
 
+import os
 import sys
 import zipfile
 from pathlib import Path
+from packaging_policy import DEFAULT_LEVEL, PackagingPolicy
 from quick_validate import validate_skill
-
-
-def package_skill(skill_path, output_dir=None):
+from skill_archive import (
+    MANIFEST_NAME,
+    PreviousArchive,
+    encode_file,
+    file_digest,
+    make_zipinfo,
+    manifest_bytes,
+    manifest_record,
+    write_entry,
+    write_raw_entry,
+)
+
+
+def package_skill(skill_path, output_dir=None, use_cache=True, incremental=True, level=DEFAULT_LEVEL):
     """
     Package a skill folder into a .skill file.
 
     Args:
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the .skill file (defaults to current directory)
+        use_cache: Reuse a cached validation verdict when SKILL.md is unchanged
+        incremental: Copy unchanged entries' compressed bytes from the previous archive
+        level: DEFLATE level 0-9 for compressible entries
 
     Returns:
         Path to the created .skill file, or None if error
@@ -46,7 +71,7 @@ def package_skill(skill_path, output_dir=None):
 
     # Run validation before packaging
     print("🔍 Validating skill...")
-    valid, message = validate_skill(skill_path)
+    valid, message = validate_skill(skill_path, use_cache=use_cache)
     if not valid:
         print(f"❌ Validation failed: {message}")
         print("   Please fix the validation errors before packaging.")
@@ -65,15 +90,8 @@ def package_skill(skill_path, output_dir=None):
 
     # Create the .skill file (zip format)
     try:
-        with zipfile.ZipFile(skill_filename, "w", zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            for file_path in skill_path.rglob("*"):
-                if file_path.is_file():
-                    # Calculate the relative path within the zip
-                    arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
-
+        policy = PackagingPolicy(level=level)
+        write_skill_archive(skill_path, skill_filename, incremental=incremental, policy=policy)
         print(f"\n✅ Successfully packaged skill to: {skill_filename}")
         return skill_filename
 
@@ -82,23 +100,128 @@ def package_skill(skill_path, output_dir=None):
         return None
 
 
+def write_skill_archive(skill_path, skill_filename, incremental=True, log=print, policy=None):
+    """
+    Write skill_path to skill_filename as a .skill archive.
+
+    The archive is built beside skill_filename and swapped in atomically.
+    Large entries are compressed on a thread pool while smaller ones are
+    written, so output order (and bytes) never depend on the pool. At most
+    policy.jobs * 2 pooled results are in flight, bounding memory to a few
+    compressed entries however large the skill is.
+
+    Args:
+        skill_path: Resolved path to the skill folder
+        skill_filename: Destination .skill path
+        incremental: Copy unchanged entries' compressed bytes from the previous archive
+        log: Called with one line per entry (None for silence)
+        policy: PackagingPolicy deciding ignored files and compression (default policy if None)
+
+    Returns:
+        The manifest written into the archive (arcname -> record)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    log = log or (lambda line: None)
+    policy = policy or PackagingPolicy()
+    tmp_filename = skill_filename.with_name(f".{skill_filename.name}.tmp")
+    try:
+        previous = PreviousArchive(skill_filename if incremental else None)
+        with previous, zipfile.ZipFile(tmp_filename, "w") as zipf, \
+                ThreadPoolExecutor(max_workers=policy.jobs) as pool:
+            manifest = {}
+            plan = []
+
+            # Walk through the skill directory in a stable order, skipping ignored files
+            for file_path in policy.walk(skill_path):
+                # Calculate the relative path within the zip
+                arcname = file_path.relative_to(skill_path.parent).as_posix()
+                st = file_path.stat()
+                compress_type = policy.compression_for(file_path, st.st_size)
+                zinfo = make_zipinfo(arcname, bool(st.st_mode & 0o111), compress_type)
+
+                record = manifest_record(file_digest(file_path), st.st_size, compress_type, policy.level)
+                manifest[arcname] = record
+
+                src_info = previous.reusable(arcname, record)
+                pooled = src_info is None and policy.compress_in_pool(st.st_size)
+                plan.append((zinfo, src_info, file_path, pooled))
+
+            # Submit pooled entries in write order, a bounded window ahead of the writer
+            in_flight = {}
+            waiting = iter([i for i, item in enumerate(plan) if item[3]])
+
+            def top_up():
+                while len(in_flight) < policy.jobs * 2:
+                    i = next(waiting, None)
+                    if i is None:
+                        return
+                    zinfo, _, file_path, _ = plan[i]
+                    in_flight[i] = pool.submit(encode_file, file_path, zinfo.compress_type, policy.level)
+
+            top_up()
+            for i, (zinfo, src_info, file_path, pooled) in enumerate(plan):
+                if src_info is not None:
+                    previous.copy_to(zipf, src_info, zinfo)
+                    log(f"  Reused: {zinfo.filename}")
+                    continue
+                if pooled:
+                    digest, encoded = in_flight.pop(i).result()
+                    top_up()
+                else:
+                    digest, encoded = encode_file(file_path, zinfo.compress_type, policy.level)
+                # Record the bytes actually written, in case the file changed since it was planned
+                manifest[zinfo.filename] = manifest_record(digest, encoded[2], zinfo.compress_type, policy.level)
+                write_raw_entry(zipf, zinfo, *encoded, policy.level)
+                stored = " (stored)" if zinfo.compress_type == zipfile.ZIP_STORED else ""
+                log(f"  Added: {zinfo.filename}{stored}")
+
+            # Level 0 stores everything, the manifest included
+            manifest_type = zipfile.ZIP_STORED if policy.level == 0 else zipfile.ZIP_DEFLATED
+            write_entry(zipf, make_zipinfo(MANIFEST_NAME, compress_type=manifest_type),
+                        manifest_bytes(manifest), policy.level)
+
+        os.replace(tmp_filename, skill_filename)
+        return manifest
+
+    finally:
+        if tmp_filename.exists():
+            tmp_filename.unlink()
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory]")
+    args = [a for a in sys.argv[1:] if a not in ("--no-cache", "--full")]
+    use_cache = "--no-cache" not in sys.argv[1:]
+    incremental = "--full" not in sys.argv[1:]
+
+    level = DEFAULT_LEVEL
+    if "--level" in args:
+        i = args.index("--level")
+        try:
+            level = int(args[i + 1])
+        except (IndexError, ValueError):
+            level = -1
+        if not 0 <= level <= 9:
+            print("❌ Error: --level expects a number from 0 to 9")
+            sys.exit(1)
+        del args[i:i + 2]
+
+    if len(args) < 1:
+        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory] [--no-cache] [--full] [--level N]")
         print("\nExample:")
         print("  python utils/package_skill.py skills/public/my-skill")
         print("  python utils/package_skill.py skills/public/my-skill ./dist")
         sys.exit(1)
 
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    skill_path = args[0]
+    output_dir = args[1] if len(args) > 1 else None
 
     print(f"📦 Packaging skill: {skill_path}")
     if output_dir:
         print(f"   Output directory: {output_dir}")
     print()
 
-    result = package_skill(skill_path, output_dir)
+    result = package_skill(skill_path, output_dir, use_cache=use_cache, incremental=incremental, level=level)
 
     if result:
         sys.exit(0)
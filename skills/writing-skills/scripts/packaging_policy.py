@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Packaging policy for .skill archives.
+
+Decides which files go into an archive and how each one is compressed:
+
+- Ignore patterns: built-in junk (__pycache__, .git, .DS_Store, ...) plus
+  gitignore-style globs from a .skillignore file in the skill folder.
+  A trailing '/' matches directories only; a pattern containing '/' is
+  matched against the path relative to the skill folder, otherwise against
+  each name.
+- Compression: already-compressed formats (by extension) and files whose
+  leading sample looks random (Shannon entropy) are STORED; everything else
+  is DEFLATED at the selected level. Level 0 stores everything.
+- Large files are deflated on a thread pool (zlib releases the GIL).
+"""
+
+import fnmatch
+import math
+import os
+import zipfile
+from collections import Counter
+from pathlib import Path
+
+from skill_archive import DEFAULT_LEVEL
+
+IGNORE_FILE = ".skillignore"
+
+DEFAULT_IGNORE = [
+    "__pycache__/",
+    "*.pyc",
+    "*.pyo",
+    ".DS_Store",
+    "Thumbs.db",
+    ".git/",
+    ".hg/",
+    ".svn/",
+    "*.swp",
+    "*~",
+    IGNORE_FILE,
+]
+
+INCOMPRESSIBLE_EXTENSIONS = {
+    # Images
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".heic", ".ico",
+    # Documents with compressed streams
+    ".pdf", ".docx", ".xlsx", ".pptx", ".odt", ".epub",
+    # Archives
+    ".zip", ".skill", ".jar", ".whl", ".gz", ".tgz", ".bz2", ".xz", ".zst", ".7z", ".rar",
+    # Media and fonts
+    ".mp3", ".mp4", ".m4a", ".mov", ".webm", ".ogg", ".flac", ".woff", ".woff2",
+}
+
+# Entropy sampling: files at least MIN_SAMPLE_SIZE long are checked on their first SAMPLE_SIZE bytes
+SAMPLE_SIZE = 64 * 1024
+MIN_SAMPLE_SIZE = 4 * 1024
+ENTROPY_THRESHOLD = 7.5  # bits per byte; 8.0 is uniformly random
+
+# Files at least this large are deflated on the thread pool
+PARALLEL_MIN_SIZE = 256 * 1024
+
+
+def shannon_entropy(sample):
+    """Entropy of a byte string in bits per byte."""
+    if not sample:
+        return 0.0
+    total = len(sample)
+    return -sum(c / total * math.log2(c / total) for c in Counter(sample).values())
+
+
+def read_ignore_file(skill_path):
+    """Patterns from <skill>/.skillignore (blank lines and # comments skipped)."""
+    try:
+        with open(Path(skill_path) / IGNORE_FILE) as f:
+            lines = [line.strip() for line in f]
+    except OSError:
+        return []
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+class PackagingPolicy:
+    """Ignore rules and per-file compression choices for one packaging run."""
+
+    def __init__(self, level=DEFAULT_LEVEL, ignore=None, jobs=None, detect_entropy=True):
+        if not 0 <= level <= 9:
+            raise ValueError(f"Compression level must be 0-9, got {level}")
+        self.level = level
+        self.ignore = list(DEFAULT_IGNORE if ignore is None else ignore)
+        self.jobs = jobs or min(8, os.cpu_count() or 1)
+        self.detect_entropy = detect_entropy
+
+    def is_ignored(self, relpath, is_dir, patterns):
+        name = relpath.rsplit("/", 1)[-1]
+        for pattern in patterns:
+            dir_only = pattern.endswith("/")
+            pattern = pattern.rstrip("/")
+            if dir_only and not is_dir:
+                continue
+            target = relpath if "/" in pattern else name
+            if fnmatch.fnmatchcase(target, pattern.lstrip("/")):
+                return True
+        return False
+
+    def walk(self, skill_path):
+        """Files to package, sorted, with ignored files and directories pruned."""
+        skill_path = Path(skill_path)
+        patterns = self.ignore + read_ignore_file(skill_path)
+        files = []
+        for dirpath, dirnames, filenames in os.walk(skill_path):
+            rel_dir = Path(dirpath).relative_to(skill_path).as_posix()
+            prefix = "" if rel_dir == "." else rel_dir + "/"
+            dirnames[:] = [d for d in dirnames if not self.is_ignored(prefix + d, True, patterns)]
+            files.extend(
+                Path(dirpath) / f for f in filenames
+                if not self.is_ignored(prefix + f, False, patterns)
+            )
+        return sorted(files)
+
+    def compression_for(self, file_path, size):
+        """ZIP_STORED or ZIP_DEFLATED for a file."""
+        if self.level == 0:
+            return zipfile.ZIP_STORED
+        if Path(file_path).suffix.lower() in INCOMPRESSIBLE_EXTENSIONS:
+            return zipfile.ZIP_STORED
+        if self.detect_entropy and size >= MIN_SAMPLE_SIZE:
+            with open(file_path, "rb") as f:
+                sample = f.read(SAMPLE_SIZE)
+            if shannon_entropy(sample) >= ENTROPY_THRESHOLD:
+                return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+
+    def compress_in_pool(self, size):
+        return size >= PARALLEL_MIN_SIZE
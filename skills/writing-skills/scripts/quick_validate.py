@@ -1,17 +1,53 @@
 #!/usr/bin/env python3
 """
 Quick validation script for skills - minimal version
+
+PyYAML is only imported for headers the flat parser cannot handle, so
+validating a typical skill starts fast.
 """
 
 import sys
-import os
 import re
-import yaml
 from pathlib import Path
 
+from skill_frontmatter import VALID_FIELDS, FrontmatterError, load_frontmatter, read_frontmatter
+from validation_cache import ValidationCache, cache_disabled
+
+_cache = None
+
+
+def get_cache():
+    """Process-wide validation cache (created on first use)."""
+    global _cache
+    if _cache is None:
+        _cache = ValidationCache()
+    return _cache
+
+
+def validate_skill(skill_path, use_cache=True):
+    """
+    Basic validation of a skill.
 
-def validate_skill(skill_path):
-    """Basic validation of a skill"""
+    Verdicts are cached on disk by SKILL.md fingerprint; pass use_cache=False
+    (or set SKILL_VALIDATE_NO_CACHE=1) to always re-validate.
+    """
+    skill_md = Path(skill_path) / "SKILL.md"
+    if not use_cache or cache_disabled() or not skill_md.is_file():
+        return _validate_skill(skill_path)
+
+    cache = get_cache()
+    cached = cache.lookup(skill_md)
+    if cached is not None:
+        return cached
+
+    fingerprint = cache.fingerprint(skill_md)
+    valid, message = _validate_skill(skill_path)
+    cache.store(skill_md, fingerprint, valid, message)
+    return valid, message
+
+
+def _validate_skill(skill_path):
+    """Validate a skill without consulting the cache"""
     skill_path = Path(skill_path)
 
     # Check SKILL.md exists
@@ -19,28 +55,23 @@ def validate_skill(skill_path):
     if not skill_md.exists():
         return False, "SKILL.md not found"
 
-    # Read and validate frontmatter
-    content = skill_md.read_text()
-    if not content.startswith("---"):
+    # Read and validate frontmatter (header only, the body is never loaded)
+    header = read_frontmatter(skill_md)
+    if not header.opened:
         return False, "No YAML frontmatter found"
-
-    # Extract frontmatter
-    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
-    if not match:
+    if not header.closed:
         return False, "Invalid frontmatter format"
 
-    frontmatter_text = match.group(1)
-
     # Parse YAML frontmatter
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
+        frontmatter = load_frontmatter(header)
         if not isinstance(frontmatter, dict):
             return False, "Frontmatter must be a YAML dictionary"
-    except yaml.YAMLError as e:
+    except FrontmatterError as e:
         return False, f"Invalid YAML in frontmatter: {e}"
 
-    # Define allowed properties
-    ALLOWED_PROPERTIES = {"name", "description", "license", "allowed-tools", "metadata"}
+    # Allowed properties are shared with the other frontmatter tools
+    ALLOWED_PROPERTIES = VALID_FIELDS
 
     # Check for unexpected properties (excluding nested keys under metadata)
     unexpected_keys = set(frontmatter.keys()) - ALLOWED_PROPERTIES
@@ -88,10 +119,14 @@ def validate_skill(skill_path):
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python quick_validate.py <skill_directory>")
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    flags = {a for a in sys.argv[1:] if a.startswith("--")}
+    if len(args) != 1 or flags - {"--no-cache", "--cache-stats"}:
+        print("Usage: python quick_validate.py <skill_directory> [--no-cache] [--cache-stats]")
         sys.exit(1)
 
-    valid, message = validate_skill(sys.argv[1])
+    valid, message = validate_skill(args[0], use_cache="--no-cache" not in flags)
     print(message)
+    if "--cache-stats" in flags:
+        print(get_cache().stats(), file=sys.stderr)
     sys.exit(0 if valid else 1)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Reproducible, incremental .skill archive writing.
+
+Every archive carries a content-hash manifest (MANIFEST_NAME) listing each
+entry's sha256, size and compression. When a skill is repackaged, entries
+whose hash and compression match the previous archive have their
+compressed bytes copied straight across instead of being deflated again.
+
+Archives are byte-for-byte reproducible: entries are sorted, timestamps are
+fixed, permissions are normalised to 0644/0755 and no host metadata is
+recorded.
+
+Appending pre-compressed bytes needs ZipFile internals, so it is only done
+on the CPython versions RAW_WRITE_VERSIONS covers, and only while the
+attributes it touches exist. Elsewhere every entry is recompressed through
+ZipFile.writestr: slower, but the same bytes for the same zlib.
+"""
+
+import hashlib
+import json
+import struct
+import sys
+import zipfile
+import zlib
+from pathlib import Path
+
+MANIFEST_NAME = ".skill-manifest.json"
+MANIFEST_FORMAT = 1
+
+# Earliest timestamp a zip entry can hold
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# zlib's default level, recorded so reuse only happens between like builds
+DEFAULT_LEVEL = 6
+
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\003\004"
+
+_METHOD_NAMES = {zipfile.ZIP_STORED: "stored", zipfile.ZIP_DEFLATED: "deflated"}
+
+# CPython releases whose ZipFile write internals write_raw_entry was checked against
+RAW_WRITE_VERSIONS = ((3, 8), (3, 13))
+_RAW_WRITE_ATTRS = ("_lock", "_writecheck", "_didModify", "fp", "filelist", "NameToInfo", "start_dir")
+
+RAW_WRITES = (
+    sys.implementation.name == "cpython"
+    and RAW_WRITE_VERSIONS[0] <= sys.version_info[:2] <= RAW_WRITE_VERSIONS[1]
+    and hasattr(zipfile.ZipInfo, "FileHeader")
+)
+
+
+def file_digest(path):
+    """sha256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def deflate_bytes(data, level=DEFAULT_LEVEL):
+    """Raw DEFLATE stream of data, as stored in a zip entry."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+
+def make_zipinfo(arcname, executable=False, compress_type=zipfile.ZIP_DEFLATED):
+    """ZipInfo with normalised, host-independent metadata."""
+    zinfo = zipfile.ZipInfo(arcname, date_time=FIXED_DATE_TIME)
+    zinfo.create_system = 3  # Unix
+    zinfo.external_attr = (0o100755 if executable else 0o100644) << 16
+    zinfo.compress_type = compress_type
+    return zinfo
+
+
+def manifest_record(digest, size, compress_type, level):
+    level = level if compress_type == zipfile.ZIP_DEFLATED else None
+    return {
+        "sha256": digest,
+        "size": size,
+        "method": _METHOD_NAMES.get(compress_type, str(compress_type)),
+        "level": level,
+    }
+
+
+def read_manifest(zf):
+    """Manifest of an open archive ({} when absent or unreadable)."""
+    try:
+        data = json.loads(zf.read(MANIFEST_NAME))
+    except (KeyError, ValueError, zipfile.BadZipFile):
+        return {}
+    if data.get("format") != MANIFEST_FORMAT:
+        return {}
+    return data.get("files", {})
+
+
+def manifest_bytes(files):
+    """Deterministic serialisation of the manifest."""
+    data = {"format": MANIFEST_FORMAT, "files": files}
+    return (json.dumps(data, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
+def read_raw_entry(zf, zinfo):
+    """Compressed bytes of an entry, exactly as stored in the archive."""
+    fp = zf.fp
+    fp.seek(zinfo.header_offset)
+    header = fp.read(_LOCAL_HEADER.size)
+    fields = _LOCAL_HEADER.unpack(header)
+    if fields[0] != _LOCAL_HEADER_SIGNATURE:
+        raise zipfile.BadZipFile(f"Bad local header for {zinfo.filename}")
+    name_len, extra_len = fields[-2], fields[-1]
+    fp.seek(zinfo.header_offset + _LOCAL_HEADER.size + name_len + extra_len)
+    return fp.read(zinfo.compress_size)
+
+
+def raw_writes_supported(zf):
+    """True if raw bytes can be appended to zf without recompressing."""
+    return RAW_WRITES and all(hasattr(zf, attr) for attr in _RAW_WRITE_ATTRS)
+
+
+def write_raw_entry(zf, zinfo, raw, crc, file_size, level=DEFAULT_LEVEL):
+    """
+    Append an already-compressed entry to a ZipFile opened for writing.
+
+    zinfo.compress_type must describe how raw was produced (raw DEFLATE
+    stream or stored bytes). Where raw_writes_supported is false, raw is
+    inflated and written again through ZipFile.writestr at level.
+    """
+    if not raw_writes_supported(zf):
+        data = zlib.decompress(raw, -15) if zinfo.compress_type == zipfile.ZIP_DEFLATED else raw
+        if zlib.crc32(data) != crc or len(data) != file_size:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for {zinfo.filename}")
+        zf.writestr(zinfo, data, compresslevel=level)
+        return
+
+    zinfo.CRC = crc
+    zinfo.file_size = file_size
+    zinfo.compress_size = len(raw)
+    zinfo.flag_bits = 0
+    zip64 = file_size > zipfile.ZIP64_LIMIT or len(raw) > zipfile.ZIP64_LIMIT
+
+    with zf._lock:
+        zf._writecheck(zinfo)
+        zf._didModify = True
+        zinfo.header_offset = zf.fp.tell()
+        zf.fp.write(zinfo.FileHeader(zip64))
+        zf.fp.write(raw)
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[zinfo.filename] = zinfo
+        zf.start_dir = zf.fp.tell()
+
+
+def encode_entry(data, compress_type, level=DEFAULT_LEVEL):
+    """(raw, crc, size) for data under compress_type, ready for write_raw_entry.
+
+    Safe to call from worker threads: zlib releases the GIL while compressing.
+    """
+    raw = deflate_bytes(data, level) if compress_type == zipfile.ZIP_DEFLATED else data
+    return raw, zlib.crc32(data), len(data)
+
+
+def encode_file(path, compress_type, level=DEFAULT_LEVEL):
+    """(sha256, encode_entry result) for one read of a file, so the digest matches the bytes written."""
+    data = Path(path).read_bytes()
+    return hashlib.sha256(data).hexdigest(), encode_entry(data, compress_type, level)
+
+
+def write_entry(zf, zinfo, data, level=DEFAULT_LEVEL):
+    """Compress (or store) data according to zinfo.compress_type and append it."""
+    write_raw_entry(zf, zinfo, *encode_entry(data, zinfo.compress_type, level), level)
+
+
+class PreviousArchive:
+    """Read-only view of the last build, used to reuse unchanged entries."""
+
+    def __init__(self, path):
+        self._zf = None
+        self.manifest = {}
+        if path and Path(path).is_file():
+            try:
+                self._zf = zipfile.ZipFile(path, "r")
+                self.manifest = read_manifest(self._zf)
+            except (OSError, zipfile.BadZipFile):
+                self.close()
+
+    def reusable(self, arcname, record):
+        """Source ZipInfo if arcname can be copied unchanged, else None."""
+        if self._zf is None or self.manifest.get(arcname) != record:
+            return None
+        try:
+            zinfo = self._zf.getinfo(arcname)
+        except KeyError:
+            return None
+        if zinfo.file_size != record["size"] or zinfo.flag_bits & 0x1:
+            return None
+        return zinfo
+
+    def copy_to(self, zf, src_info, zinfo):
+        raw = read_raw_entry(self._zf, src_info)
+        zinfo.compress_type = src_info.compress_type
+        level = self.manifest[zinfo.filename].get("level")
+        write_raw_entry(zf, zinfo, raw, src_info.CRC, src_info.file_size,
+                        DEFAULT_LEVEL if level is None else level)
+
+    def close(self):
+        if self._zf is not None:
+            self._zf.close()
+            self._zf = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
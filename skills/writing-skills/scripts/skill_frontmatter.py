@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Shared SKILL.md frontmatter parser.
+
+Reads only the header: a file is consumed line by line up to the closing
+`---` (bounded by MAX_HEADER_BYTES), and in-memory content is scanned without
+splitting the body. Used by quick_validate.py, validate-report.py,
+clean-frontmatter.py and the skill metadata PreToolUse hook so they all agree
+on what the frontmatter is and which fields are valid.
+
+load_frontmatter turns a header into data. Flat `key: value` headers (the
+common case) are parsed in pure Python; anything else goes to PyYAML, which
+is imported only then and uses the libyaml CSafeLoader when available.
+"""
+
+import re
+from typing import Dict, List, NamedTuple
+
+# Preferred order when rebuilding a header; also the set of valid fields
+FIELD_ORDER = [
+    "name",
+    "description",
+    "license",
+    "allowed-tools",
+    "model",
+    "context",
+    "agent",
+    "hooks",
+    "user-invocable",
+    "disable-model-invocation",
+    "metadata",
+]
+VALID_FIELDS = frozenset(FIELD_ORDER)
+
+DELIMITER = "---"
+
+# Headers larger than this are treated as unterminated
+MAX_HEADER_BYTES = 64 * 1024
+
+
+class Frontmatter(NamedTuple):
+    """Parsed SKILL.md header."""
+
+    opened: bool              # content starts with '---'
+    closed: bool              # a closing '---' line was found
+    lines: List[str]          # header lines between the delimiters
+    fields: Dict[str, str]    # top-level key -> value (continuation lines joined)
+    body_offset: int          # where the body starts (bytes for files, chars for text); -1 if not closed
+
+    @property
+    def text(self):
+        """Header as a single string, suitable for yaml.safe_load."""
+        return "\n".join(self.lines)
+
+    def first_line(self, field):
+        """First non-empty line of a field's value ('' if absent)."""
+        value = self.fields.get(field, "")
+        return value.split("\n", 1)[0].strip()
+
+
+NOT_FOUND = Frontmatter(False, False, [], {}, -1)
+
+
+class FrontmatterError(ValueError):
+    """The header is not valid YAML (message is the parser's)."""
+
+
+def _is_delimiter(line):
+    return line.rstrip() == DELIMITER
+
+
+def parse_field_blocks(lines):
+    """Group header lines into top-level fields: key -> [key line, continuation lines...].
+
+    Indented, list and blank lines continue the current key; lines before the
+    first key are dropped. The first occurrence of a duplicated key wins.
+    """
+    blocks = {}
+    current = None
+
+    for line in lines:
+        if ":" in line and line[:1] not in (" ", "\t", "-", "#"):
+            key = line.split(":", 1)[0].strip()
+            current = [line]
+            blocks.setdefault(key, current)
+        elif current is not None:
+            current.append(line)
+
+    return blocks
+
+
+def parse_fields(lines):
+    """Parse top-level `key: value` entries; continuation lines are joined into the value."""
+    fields = {}
+    for key, block in parse_field_blocks(lines).items():
+        inline = block[0].split(":", 1)[1].strip()
+        fields[key] = "\n".join([inline] + block[1:]).strip()
+    return fields
+
+
+def _scan(line_iter):
+    """Consume (line, length) pairs up to the closing delimiter."""
+    consumed = 0
+    header = []
+
+    for index, (line, length) in enumerate(line_iter):
+        consumed += length
+        stripped = line.rstrip("\r\n")
+        if index == 0:
+            if not stripped.startswith(DELIMITER):
+                return NOT_FOUND
+            if not _is_delimiter(stripped):
+                return Frontmatter(True, False, [], {}, -1)
+            continue
+        if _is_delimiter(stripped):
+            return Frontmatter(True, True, header, parse_fields(header), consumed)
+        header.append(stripped)
+
+    return Frontmatter(consumed > 0, False, header, {}, -1)
+
+
+def _text_lines(content, limit):
+    pos = 0
+    end = min(len(content), limit)
+    while pos < end:
+        nl = content.find("\n", pos, end)
+        nxt = end if nl == -1 else nl + 1
+        yield content[pos:nxt], nxt - pos
+        pos = nxt
+
+
+def _file_lines(f, limit):
+    remaining = limit
+    while remaining > 0:
+        raw = f.readline(remaining)
+        if not raw:
+            return
+        remaining -= len(raw)
+        yield raw.decode("utf-8", errors="replace"), len(raw)
+
+
+def parse_frontmatter(content, max_chars=MAX_HEADER_BYTES):
+    """Parse the header of in-memory SKILL.md content without touching the body."""
+    return _scan(_text_lines(content, max_chars))
+
+
+def read_frontmatter(path, max_bytes=MAX_HEADER_BYTES):
+    """Read and parse only the header of a SKILL.md file (a path or a binary file object)."""
+    if hasattr(path, "readline"):
+        return _scan(_file_lines(path, max_bytes))
+    with open(path, "rb") as f:
+        return _scan(_file_lines(f, max_bytes))
+
+
+# Plain scalars resolved the way PyYAML's SafeLoader (YAML 1.1) resolves them
+_FLAT_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*")
+_FLAT_INT = re.compile(r"-?(?:0|[1-9][0-9]*)")
+_FLAT_WORDS = {
+    **dict.fromkeys("yes Yes YES true True TRUE on On ON".split(), True),
+    **dict.fromkeys("no No NO false False FALSE off Off OFF".split(), False),
+    **dict.fromkeys("null Null NULL ~".split(), None),
+}
+_PLAIN_UNSAFE_START = set("-?:,[]{}#&*!|>'\"%@`+.0123456789~=<")
+_UNRESOLVED = object()
+
+
+def _flat_scalar(value):
+    """Value of a simple scalar, or _UNRESOLVED when only YAML can decide."""
+    if not value.isprintable():
+        return _UNRESOLVED
+    if value in _FLAT_WORDS:
+        return _FLAT_WORDS[value]
+    if _FLAT_INT.fullmatch(value):
+        return int(value)
+    if value[0] == '"':
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != '"' or '"' in inner or "\\" in inner:
+            return _UNRESOLVED
+        return inner
+    if value[0] == "'":
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != "'" or "'" in inner.replace("''", ""):
+            return _UNRESOLVED
+        return inner.replace("''", "'")
+    if (value[0] in _PLAIN_UNSAFE_START
+            or ": " in value or " #" in value or value.endswith(":")):
+        return _UNRESOLVED
+    return value
+
+
+def parse_flat(lines):
+    """
+    Parse a header made only of `key: scalar` lines, blanks and comments.
+
+    Scalars may be plain or simply quoted strings, booleans, nulls or decimal
+    integers. Returns the same dict yaml.safe_load would, or None if any line
+    needs a real YAML parser (nesting, lists, block scalars, escapes, floats,
+    duplicate keys, keys YAML reads as booleans or null, ...).
+    """
+    data = {}
+    for line in lines:
+        if not line.strip() or line.startswith("#"):
+            continue
+        key, sep, value = line.partition(":")
+        if not sep or not _FLAT_KEY.fullmatch(key) or key in _FLAT_WORDS or key in data:
+            return None
+        if value and value[0] != " ":
+            return None
+        value = value.strip(" ")
+        if not value:
+            return None
+        scalar = _flat_scalar(value)
+        if scalar is _UNRESOLVED:
+            return None
+        data[key] = scalar
+    return data or None
+
+
+def load_yaml(text):
+    """yaml.safe_load with the C loader when available; raises FrontmatterError."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        return yaml.load(text, Loader=loader)
+    except yaml.YAMLError as e:
+        raise FrontmatterError(str(e)) from e
+
+
+def load_frontmatter(header):
+    """Data of a closed Frontmatter: pure-Python for flat headers, YAML otherwise."""
+    data = parse_flat(header.lines)
+    if data is not None:
+        return data
+    return load_yaml(header.text)
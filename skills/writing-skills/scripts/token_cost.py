@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Token-cost analyzer for progressive disclosure across a skill catalog.
+
+A skill costs context in three tiers:
+
+    always     name + description, listed in every session's system prompt
+    on load    the whole SKILL.md, read when the skill triggers
+    on demand  every other file the skill ships (references/, scripts/,
+               examples...), read only when SKILL.md sends Claude to it
+
+Tokens are estimated offline by a small approximation of BPE tokenization
+(no tokenizer download, no network): text is split into words, camelCase
+parts, digit groups, punctuation runs and whitespace runs, and each piece
+is charged by length. It errs on the high side, at about 3.6 characters per
+token on Markdown and 3.1 on Python, so treat counts as a budget rather
+than an exact bill. Binary files are listed but not counted.
+
+Per-file counts are cached by content sha256 in
+${XDG_CACHE_HOME:-~/.cache}/claude-development/token-cost.json, so a re-run
+over a large catalog only tokenizes files that changed.
+
+Usage:
+    token_cost.py [PATH ...] [--all-roots] [--sort TIER] [--files] [--json] [--no-cache] [--jobs N]
+
+Each PATH is a skill folder or a root whose subfolders are skills. With no
+PATH, $CLAUDE_PROJECT_DIR/.claude/skills is analyzed; --all-roots adds the
+user (~/.claude/skills) and plugin cache (~/.claude/plugins/cache) roots.
+Skills are ranked by --sort (always, load, demand or total; default load,
+the cost of triggering a skill), highest first.
+
+Environment:
+    TOKEN_COST_CACHE     Cache file path override
+    TOKEN_COST_NO_CACHE  Set to 1 to bypass the cache
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from packaging_policy import PackagingPolicy
+from skill_frontmatter import FrontmatterError, load_frontmatter, read_frontmatter
+
+# Bump when estimate_tokens changes, so cached counts are recomputed
+TOKENIZER_VERSION = 1
+CACHE_VERSION = 1
+MAX_CACHE_ENTRIES = 16384
+
+# Files to tokenize before a process pool pays for itself
+POOL_MIN_FILES = 64
+
+TIERS = ("always", "load", "demand", "total")
+
+_PIECES = re.compile(r"""
+    (\ ?[A-Z]?[a-z]+|\ ?[A-Z]+(?![a-z]))   # words and camelCase parts, acronyms
+  | (\ ?[0-9]{1,3})                         # numbers, three digits at a time
+  | (\ ?[!-/:-@\[-`{-~]+)                   # ASCII punctuation runs
+  | ([^\x00-\x7f])                          # any other character
+  | (\s+)                                   # whitespace runs
+""", re.VERBOSE)
+
+# Longer pieces cost one more token per this many characters
+WORD_CHARS_PER_TOKEN = 8
+PUNCT_CHARS_PER_TOKEN = 3
+
+
+def estimate_tokens(text):
+    """Approximate token count of text."""
+    tokens = 0
+    for word, number, punct, other, _space in _PIECES.findall(text):
+        if word:
+            tokens += 1 + (len(word.lstrip(" ")) - 1) // WORD_CHARS_PER_TOKEN
+        elif punct:
+            tokens += 1 + (len(punct.lstrip(" ")) - 1) // PUNCT_CHARS_PER_TOKEN
+        elif other:
+            # Accented letters are usually one token; CJK and emoji more
+            tokens += 1 if other < "\u0800" else 2
+        else:
+            tokens += 1
+    return tokens
+
+
+def estimate_bytes(data):
+    """Token estimate for file contents, or None for binary files."""
+    if b"\0" in data:
+        return None
+    try:
+        return estimate_tokens(data.decode("utf-8"))
+    except UnicodeDecodeError:
+        return None
+
+
+def _estimate_batch(blobs):
+    return [estimate_bytes(data) for data in blobs]
+
+
+def default_cache_path():
+    override = os.environ.get("TOKEN_COST_CACHE")
+    if override:
+        return override
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "claude-development", "token-cost.json")
+
+
+def cache_disabled():
+    return os.environ.get("TOKEN_COST_NO_CACHE", "") not in ("", "0")
+
+
+class TokenCache:
+    """LRU map of content sha256 -> token count (None for binary), written atomically when changed."""
+
+    def __init__(self, path=None, enabled=True):
+        self.path = path or default_cache_path()
+        self.enabled = enabled
+        self.entries = {}
+        self.dirty = False
+        if enabled:
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+                if data.get("version") == CACHE_VERSION and data.get("tokenizer") == TOKENIZER_VERSION:
+                    self.entries = data.get("entries", {})
+            except (OSError, ValueError, AttributeError):
+                pass
+
+    def __contains__(self, digest):
+        return self.enabled and digest in self.entries
+
+    def get(self, digest):
+        value = self.entries.pop(digest)
+        self.entries[digest] = value
+        return value
+
+    def put(self, digest, tokens):
+        if self.enabled:
+            self.entries.pop(digest, None)
+            self.entries[digest] = tokens
+            self.dirty = True
+
+    def save(self):
+        if not (self.enabled and self.dirty):
+            return
+        entries = dict(list(self.entries.items())[-MAX_CACHE_ENTRIES:])
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump({"version": CACHE_VERSION, "tokenizer": TOKENIZER_VERSION, "entries": entries}, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CATALOG
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def project_root():
+    return Path(os.environ.get("CLAUDE_PROJECT_DIR", ".")) / ".claude" / "skills"
+
+
+def standard_roots():
+    """Project, user and plugin-cache skill roots."""
+    home = Path.home() / ".claude"
+    return [project_root(), home / "skills", home / "plugins" / "cache"]
+
+
+def find_skills(paths):
+    """Resolve arguments to a sorted list of skill folders."""
+    skills = set()
+    for path in paths:
+        path = Path(path).resolve()
+        if (path / "SKILL.md").is_file():
+            skills.add(path)
+        elif path.is_dir():
+            skills.update(p.parent for p in path.rglob("SKILL.md"))
+    return sorted(skills)
+
+
+def listing_text(skill_path):
+    """What the skill contributes to every session's skill listing: `name: description`."""
+    name, description = skill_path.name, ""
+    try:
+        header = read_frontmatter(skill_path / "SKILL.md")
+        data = load_frontmatter(header) if header.closed else None
+    except (OSError, FrontmatterError):
+        data = None
+    if isinstance(data, dict):
+        if isinstance(data.get("name"), str) and data["name"].strip():
+            name = data["name"].strip()
+        if data.get("description") is not None:
+            description = str(data["description"]).strip()
+    return name, f"{name}: {description}"
+
+
+def group_of(relpath):
+    """Report group of an on-demand file: its top-level folder, or './' for loose files."""
+    return relpath.split("/", 1)[0] + "/" if "/" in relpath else "./"
+
+
+def analyze(skills, use_cache=True, jobs=None):
+    """One result dict per skill: name, path, always, load, demand, total, groups, files, binary."""
+    cache = TokenCache(enabled=use_cache and not cache_disabled())
+    policy = PackagingPolicy()
+
+    plans = []
+    pending = {}  # digest -> file contents still to tokenize
+    for skill_path in skills:
+        files = []
+        for file_path in policy.walk(skill_path):
+            try:
+                data = file_path.read_bytes()
+            except OSError:
+                continue
+            digest = hashlib.sha256(data).hexdigest()
+            if digest not in cache:
+                pending.setdefault(digest, data)
+            files.append((file_path.relative_to(skill_path).as_posix(), digest))
+        plans.append((skill_path, files))
+
+    digests = list(pending)
+    blobs = [pending[d] for d in digests]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(blobs) >= POOL_MIN_FILES:
+        size = max(1, len(blobs) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            counts = [n for batch in pool.map(_estimate_batch, [blobs[i:i + size] for i in range(0, len(blobs), size)])
+                      for n in batch]
+    else:
+        counts = _estimate_batch(blobs)
+    known = dict(zip(digests, counts))
+    for digest, tokens in known.items():
+        cache.put(digest, tokens)
+
+    results = []
+    for skill_path, files in plans:
+        name, listing = listing_text(skill_path)
+        result = {
+            "skill": name,
+            "path": str(skill_path),
+            "always": estimate_tokens(listing),
+            "load": 0,
+            "demand": 0,
+            "groups": {},
+            "files": [],
+            "binary": 0,
+        }
+        for relpath, digest in files:
+            tokens = known[digest] if digest in known else cache.get(digest)
+            tier = "load" if relpath == "SKILL.md" else "demand"
+            result["files"].append({"file": relpath, "tier": tier, "tokens": tokens})
+            if tokens is None:
+                result["binary"] += 1
+                continue
+            result[tier] += tokens
+            if tier == "demand":
+                group = group_of(relpath)
+                result["groups"][group] = result["groups"].get(group, 0) + tokens
+        result["total"] = result["always"] + result["load"] + result["demand"]
+        results.append(result)
+
+    cache.save()
+    return results
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# REPORT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def print_files(result):
+    files = sorted(result["files"], key=lambda f: (f["tier"] != "load", -(f["tokens"] or 0), f["file"]))
+    for entry in files:
+        tokens = "binary" if entry["tokens"] is None else f"{entry['tokens']:,}"
+        print(f"      {tokens:>9}  {entry['file']}")
+    for group, tokens in sorted(result["groups"].items(), key=lambda g: -g[1]):
+        print(f"      {tokens:>9,}  on demand in {group}")
+
+
+def print_report(results, sort, show_files):
+    width = max([len(r["skill"]) for r in results] + [len("catalog")])
+    print(f"💰 Context cost of {len(results)} skills (estimated tokens, by {sort})")
+    print()
+    print(f"  {'skill':<{width}}  {'always':>8}  {'on load':>8}  {'on demand':>9}  {'total':>9}")
+    for result in results:
+        print(f"  {result['skill']:<{width}}  {result['always']:>8,}  {result['load']:>8,}"
+              f"  {result['demand']:>9,}  {result['total']:>9,}")
+        if show_files:
+            print_files(result)
+    totals = {tier: sum(r[tier] for r in results) for tier in TIERS}
+    print(f"  {'─' * (width + 44)}")
+    print(f"  {'catalog':<{width}}  {totals['always']:>8,}  {totals['load']:>8,}"
+          f"  {totals['demand']:>9,}  {totals['total']:>9,}")
+    print()
+    print(f"Always loaded: {totals['always']:,} tokens in every session")
+    binary = sum(r["binary"] for r in results)
+    if binary:
+        print(f"Binary files not counted: {binary}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate the context cost of skills, per disclosure tier")
+    parser.add_argument("paths", nargs="*", help="Skill folders or roots containing skills")
+    parser.add_argument("--all-roots", action="store_true", help="Also analyze user and plugin-cache skills")
+    parser.add_argument("--sort", choices=TIERS, default="load", help="Tier to rank skills by (default: load)")
+    parser.add_argument("--files", action="store_true", help="Show each file's tokens")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--no-cache", action="store_true", help="Re-tokenize every file")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Worker processes")
+    args = parser.parse_args()
+
+    paths = args.paths or [project_root()]
+    if args.all_roots:
+        paths += standard_roots()
+    skills = find_skills(paths)
+    if not skills:
+        print("❌ Error: No skills found")
+        sys.exit(1)
+
+    results = analyze(skills, use_cache=not args.no_cache, jobs=args.jobs)
+    # "load" ranks by what triggering a skill costs: its listing plus SKILL.md
+    rank = (lambda r: r["always"] + r["load"]) if args.sort == "load" else (lambda r: r[args.sort])
+    results.sort(key=lambda r: (-rank(r), r["skill"]))
+
+    if args.json:
+        json.dump({"tokenizer": TOKENIZER_VERSION, "skills": results}, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(results, args.sort, args.files)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,112 +1,210 @@
 #!/usr/bin/env python3
 """
 Generate a validation report of SKILL.md frontmatter compliance.
-Shows all 43 skills with their frontmatter fields.
+Shows every skill under one or more roots with its frontmatter fields.
+
+Scanning and validation run in a process pool; results are printed as each
+batch finishes, and can also be written as JSON and JUnit XML for CI.
+
+Usage:
+    validate-report.py [ROOT ...] [--all-roots] [--jobs N] [--json FILE] [--junit FILE]
+
+With no ROOT, $CLAUDE_PROJECT_DIR/.claude/skills is scanned. --all-roots adds
+the user (~/.claude/skills) and plugin cache (~/.claude/plugins/cache) roots.
 """
 
+import argparse
+import json
 import os
-import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from xml.sax.saxutils import quoteattr
 
-VALID_FIELDS = {
-    "name",
-    "description",
-    "allowed-tools",
-    "model",
-    "context",
-    "agent",
-    "hooks",
-    "user-invocable",
-    "disable-model-invocation",
-}
+from skill_frontmatter import VALID_FIELDS, read_frontmatter
 
+# Top-level entries per worker task: small enough to stream, large enough to amortise IPC
+BATCH_SIZE = 32
 
-def extract_frontmatter(content):
-    """Extract frontmatter from file content."""
-    lines = content.split('\n')
 
-    if not lines or lines[0] != '---':
-        return None
+def project_root():
+    return Path(os.environ.get('CLAUDE_PROJECT_DIR', '.')) / '.claude' / 'skills'
 
-    fm_end = None
-    for i in range(1, len(lines)):
-        if lines[i] == '---':
-            fm_end = i
-            break
 
-    if fm_end is None:
-        return None
+def standard_roots():
+    """Project, user and plugin-cache skill roots."""
+    home = Path.home() / '.claude'
+    return [project_root(), home / 'skills', home / 'plugins' / 'cache']
 
-    return lines[1:fm_end]
 
+def validate_file(filepath, root):
+    """Validate one SKILL.md and return a JSON-serialisable result."""
+    result = {
+        'root': str(root),
+        'path': str(Path(filepath).relative_to(root.parent)),
+        'status': 'valid',
+        'fields': [],
+        'invalid_fields': [],
+    }
 
-def parse_frontmatter(fm_lines):
-    """Parse YAML frontmatter into a dict."""
-    fields = {}
-    current_field = None
+    try:
+        frontmatter = read_frontmatter(filepath)
+    except OSError as e:
+        result['status'] = 'error'
+        result['error'] = str(e)
+        return result
 
-    for line in fm_lines:
-        if ':' in line and not line.startswith(' '):
-            parts = line.split(':', 1)
-            current_field = parts[0].strip()
-            fields[current_field] = True
+    if not frontmatter.closed or not frontmatter.lines:
+        result['status'] = 'no-frontmatter'
+        return result
 
-    return fields
+    fields = frontmatter.fields
+    result['fields'] = sorted(fields.keys())
+    result['invalid_fields'] = [f for f in fields if f not in VALID_FIELDS]
+    if result['invalid_fields']:
+        result['status'] = 'invalid'
+    return result
 
 
-def main():
-    skills_dir = Path(os.environ.get('CLAUDE_PROJECT_DIR', '.')) / '.claude' / 'skills'
-
-    if not skills_dir.exists():
-        print(f"Skills directory not found: {skills_dir}")
+def scan_batch(root, entries):
+    """Find and validate every SKILL.md below the given top-level entries of root."""
+    results = []
+    for entry in entries:
+        top = root / entry
+        if entry == 'SKILL.md':
+            results.append(validate_file(top, root))
+            continue
+        for dirpath, dirnames, filenames in os.walk(top):
+            dirnames.sort()
+            if 'SKILL.md' in filenames:
+                results.append(validate_file(Path(dirpath) / 'SKILL.md', root))
+    return results
+
+
+def plan_batches(root):
+    """Split a root's top-level entries into worker-sized batches."""
+    try:
+        entries = sorted(
+            e.name for e in os.scandir(root)
+            if e.is_dir() or e.name == 'SKILL.md'
+        )
+    except OSError:
+        return []
+    return [entries[i:i + BATCH_SIZE] for i in range(0, len(entries), BATCH_SIZE)]
+
+
+def iter_results(roots, jobs):
+    """Yield result batches as they complete."""
+    work = [(root, batch) for root in roots for batch in plan_batches(root)]
+
+    if jobs <= 1 or len(work) <= 1:
+        for root, batch in work:
+            yield scan_batch(root, batch)
         return
 
-    # Find all SKILL.md files
-    skill_files = sorted(skills_dir.rglob('SKILL.md'))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(scan_batch, root, batch) for root, batch in work]
+        for future in as_completed(futures):
+            yield future.result()
 
-    print("=" * 80)
-    print("SKILL.md FRONTMATTER VALIDATION REPORT")
-    print("=" * 80)
-    print()
 
-    all_valid = True
-    invalid_skills = []
+def print_result(result):
+    if result['status'] == 'no-frontmatter':
+        print(f"❌ {result['path']}: NO FRONTMATTER")
+    elif result['status'] == 'error':
+        print(f"❌ {result['path']}: {result['error']}")
+    elif result['status'] == 'invalid':
+        print(f"❌ {result['path']}")
+        print(f"   Invalid fields: {', '.join(result['invalid_fields'])}")
+    else:
+        print(f"✓ {result['path']}")
+        print(f"  Fields: {', '.join(result['fields'])}")
+
+
+def write_json(path, roots, results):
+    invalid = [r for r in results if r['status'] != 'valid']
+    report = {
+        'roots': [str(r) for r in roots],
+        'total': len(results),
+        'valid': len(results) - len(invalid),
+        'invalid': len(invalid),
+        'results': results,
+    }
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+
+
+def write_junit(path, roots, results):
+    """One <testsuite> per root, one <testcase> per SKILL.md."""
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>']
+    total_failures = sum(1 for r in results if r['status'] != 'valid')
+    lines.append(f'<testsuites name="skill-frontmatter" tests="{len(results)}" failures="{total_failures}">')
+
+    for root in roots:
+        suite = [r for r in results if r['root'] == str(root)]
+        failures = sum(1 for r in suite if r['status'] != 'valid')
+        lines.append(f'  <testsuite name={quoteattr(str(root))} tests="{len(suite)}" failures="{failures}">')
+        for r in suite:
+            lines.append(f'    <testcase classname="frontmatter" name={quoteattr(r["path"])}>')
+            if r['status'] == 'invalid':
+                message = f"Invalid fields: {', '.join(r['invalid_fields'])}"
+                lines.append(f'      <failure message={quoteattr(message)}/>')
+            elif r['status'] == 'no-frontmatter':
+                lines.append('      <failure message="NO FRONTMATTER"/>')
+            elif r['status'] == 'error':
+                lines.append(f'      <failure message={quoteattr(r["error"])}/>')
+            lines.append('    </testcase>')
+        lines.append('  </testsuite>')
+
+    lines.append('</testsuites>')
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
 
-    for filepath in skill_files:
-        with open(filepath, 'r') as f:
-            content = f.read()
 
-        fm_lines = extract_frontmatter(content)
-        if not fm_lines:
-            print(f"❌ {filepath.relative_to(skills_dir.parent)}: NO FRONTMATTER")
-            all_valid = False
-            invalid_skills.append(str(filepath.relative_to(skills_dir.parent)))
-            continue
+def main():
+    parser = argparse.ArgumentParser(description='SKILL.md frontmatter validation report')
+    parser.add_argument('roots', nargs='*', type=Path, help='Skill roots to scan (default: project .claude/skills)')
+    parser.add_argument('--all-roots', action='store_true', help='Also scan the user and plugin-cache roots')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, help='Worker processes (default: CPU count)')
+    parser.add_argument('--json', metavar='FILE', help='Write a machine-readable JSON report')
+    parser.add_argument('--junit', metavar='FILE', help='Write a JUnit XML report')
+    args = parser.parse_args()
+
+    roots = list(args.roots) or [project_root()]
+    if args.all_roots:
+        roots += [r for r in standard_roots() if r not in roots]
+
+    existing = []
+    for root in roots:
+        if root.exists():
+            existing.append(root)
+        else:
+            print(f"Skills directory not found: {root}")
+    if not existing:
+        return
 
-        fields = parse_frontmatter(fm_lines)
+    print("=" * 80)
+    print("SKILL.md FRONTMATTER VALIDATION REPORT")
+    print("=" * 80)
+    print()
 
-        # Check for invalid fields
-        invalid_fields = [f for f in fields if f not in VALID_FIELDS]
+    results = []
+    for batch in iter_results(existing, args.jobs):
+        for result in batch:
+            print_result(result)
+        results.extend(batch)
 
-        if invalid_fields:
-            print(f"❌ {filepath.relative_to(skills_dir.parent)}")
-            print(f"   Invalid fields: {', '.join(invalid_fields)}")
-            all_valid = False
-            invalid_skills.append(str(filepath.relative_to(skills_dir.parent)))
-        else:
-            # Show valid fields
-            field_list = ', '.join(sorted(fields.keys()))
-            print(f"✓ {filepath.relative_to(skills_dir.parent)}")
-            print(f"  Fields: {field_list}")
+    results.sort(key=lambda r: (r['root'], r['path']))
+    invalid_skills = [r['path'] for r in results if r['status'] != 'valid']
 
     print()
     print("=" * 80)
-    print(f"Total skills: {len(skill_files)}")
-    print(f"Valid: {len(skill_files) - len(invalid_skills)}")
+    print(f"Total skills: {len(results)}")
+    print(f"Valid: {len(results) - len(invalid_skills)}")
     print(f"Invalid: {len(invalid_skills)}")
     print()
 
-    if all_valid:
+    if not invalid_skills:
         print("✓ ALL SKILLS HAVE VALID FRONTMATTER")
     else:
         print("❌ SOME SKILLS HAVE INVALID FRONTMATTER:")
@@ -115,6 +213,11 @@ def main():
 
     print("=" * 80)
 
+    if args.json:
+        write_json(args.json, existing, results)
+    if args.junit:
+        write_junit(args.junit, existing, results)
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+On-disk result cache for quick_validate.validate_skill.
+
+Entries are keyed by the SKILL.md path and fingerprinted by (mtime, size,
+header hash). An unchanged file is answered from its stat alone; a touched
+file whose header hash still matches is a hit too, since validation only
+looks at the frontmatter. The cache is LRU-ordered and capped at
+max_entries; it is written atomically at exit when anything changed.
+
+Environment:
+    SKILL_VALIDATE_CACHE     Cache file path override
+    SKILL_VALIDATE_NO_CACHE  Set to 1 to bypass the cache
+"""
+
+import atexit
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+from skill_frontmatter import VALID_FIELDS, read_frontmatter
+
+# Bump when validation rules change so old verdicts are discarded
+CACHE_VERSION = 1
+DEFAULT_MAX_ENTRIES = 4096
+
+
+def default_cache_path():
+    """Cache file location (XDG cache dir by default)."""
+    override = os.environ.get("SKILL_VALIDATE_CACHE")
+    if override:
+        return Path(override)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "claude-development" / "validate-cache.json"
+
+
+def cache_disabled():
+    """True when SKILL_VALIDATE_NO_CACHE is set."""
+    return os.environ.get("SKILL_VALIDATE_NO_CACHE", "") not in ("", "0")
+
+
+def header_hash(skill_md):
+    """Hash of everything validation depends on: the parsed header."""
+    header = read_frontmatter(skill_md)
+    digest = hashlib.sha256()
+    digest.update(f"{header.opened}:{header.closed}\n".encode("utf-8"))
+    digest.update(header.text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ValidationCache:
+    """LRU map of SKILL.md path -> fingerprint + verdict."""
+
+    def __init__(self, path=None, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = Path(path) if path else default_cache_path()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = None
+        self._dirty = False
+        self._schema = f"{CACHE_VERSION}:{','.join(sorted(VALID_FIELDS))}"
+
+    def _read_disk(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return OrderedDict()
+        if not isinstance(data, dict) or data.get("schema") != self._schema:
+            return OrderedDict()
+        return OrderedDict(data.get("entries", {}))
+
+    def _load(self):
+        if self._entries is None:
+            self._entries = self._read_disk()
+        return self._entries
+
+    def lookup(self, skill_md):
+        """
+        Return the cached (valid, message) for skill_md, or None on a miss.
+        """
+        entries = self._load()
+        key = str(Path(skill_md).resolve())
+        entry = entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        try:
+            st = os.stat(skill_md)
+        except OSError:
+            self.misses += 1
+            return None
+
+        if entry["mtime"] != st.st_mtime_ns or entry["size"] != st.st_size:
+            # Touched: only the header hash decides
+            if entry["sha256"] != header_hash(skill_md):
+                self.misses += 1
+                return None
+            entry["mtime"] = st.st_mtime_ns
+            entry["size"] = st.st_size
+            self._mark_dirty()
+
+        entries.move_to_end(key)
+        self.hits += 1
+        return entry["valid"], entry["message"]
+
+    @staticmethod
+    def fingerprint(skill_md):
+        """(mtime, size, header hash) of skill_md, or None if unreadable.
+
+        Take it before validating so a concurrent edit can't be cached
+        under the wrong verdict.
+        """
+        try:
+            st = os.stat(skill_md)
+            return st.st_mtime_ns, st.st_size, header_hash(skill_md)
+        except OSError:
+            return None
+
+    def store(self, skill_md, fingerprint, valid, message):
+        """Record a verdict for the contents described by fingerprint."""
+        if fingerprint is None:
+            return
+
+        entries = self._load()
+        key = str(Path(skill_md).resolve())
+        mtime, size, digest = fingerprint
+        entries[key] = {
+            "mtime": mtime,
+            "size": size,
+            "sha256": digest,
+            "valid": valid,
+            "message": message,
+        }
+        entries.move_to_end(key)
+        self._evict(entries)
+        self._mark_dirty()
+
+    def _evict(self, entries):
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def _mark_dirty(self):
+        if not self._dirty:
+            self._dirty = True
+            atexit.register(self.save)
+
+    def save(self):
+        """Merge with the on-disk cache and write it atomically."""
+        if not self._dirty:
+            return
+        merged = self._read_disk()
+        for key, entry in self._entries.items():
+            merged.pop(key, None)
+            merged[key] = entry
+        self._evict(merged)
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump({"schema": self._schema, "entries": merged}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            return
+        self._dirty = False
+
+    def stats(self):
+        """Human-readable hit/miss counters."""
+        total = self.hits + self.misses
+        rate = (100.0 * self.hits / total) if total else 0.0
+        return f"Validation cache: {self.hits} hits, {self.misses} misses ({rate:.0f}% hit rate) [{self.path}]"